@@ -0,0 +1,293 @@
+"""
+Headless command-line access to a task store - no Qt, no widgets.
+
+Tasks are streamed chunk by chunk from the same TaskStorage backends the GUI
+uses (TaskStorage.iter_load), filtered on the fly and written out as they are
+read, so listing, counting or reporting over a large store needs neither the
+GUI startup nor the whole store in memory (only --sort has to collect the
+matches first). `import` is the one command that builds a DataModel (and so
+imports QtCore), since new tasks need ids and the store's persistence.
+
+    python -m cli list [--pending|--done] [--priority P] [--due-before DATE]
+                       [--overdue] [--search TEXT] [--sort KEY] [--limit N]
+                       [--format text|jsonl|csv]
+    python -m cli count [filters]
+    python -m cli report [filters] [--format text|json]
+    python -m cli import FILE.jsonl|FILE.csv [--chunk-size N] [--no-dedupe]
+    python -m cli export FILE.jsonl|FILE.csv [filters]
+
+The store defaults to tasks.json next to this file; --store picks another one
+(.db/.sqlite for SQLiteStorage, .bin for BinaryStorage, anything else JSON,
+journaled if a .journal file sits next to it).
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from datetime import date, timedelta
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+
+from models.bulk_io import export_tasks, import_tasks
+from models.search_index import tokenize
+from models.sorted_index import SORT_KEYS
+from models.storage import JsonStorage, TaskStorage
+from models.task import Task
+
+
+CHUNK_SIZE = 5000
+_FIELDS = ("id", "title", "description", "deadline", "priority", "completed", "created_at")
+
+
+def open_storage(path: str, journal: Optional[bool] = None) -> TaskStorage:
+    """Open the backend matching a store path (read access is all the CLI needs)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".db", ".sqlite", ".sqlite3"):
+        from models.sqlite_storage import SQLiteStorage
+        return SQLiteStorage(path)
+    if ext == ".bin":
+        from models.binary_storage import BinaryStorage
+        return BinaryStorage(path)
+    if journal is None:
+        journal = os.path.exists(path + ".journal")
+    if journal:
+        from models.journal import JournalStorage
+        return JournalStorage(path)
+    return JsonStorage(path)
+
+
+def iter_tasks(storage: TaskStorage, chunk_size: int = CHUNK_SIZE) -> Iterator[list[Task]]:
+    for chunk, _ in storage.iter_load(chunk_size):
+        yield chunk
+
+
+# --- filtering -------------------------------------------------------
+def make_filters(args) -> list[Callable[[Task], bool]]:
+    """One predicate per filter option given on the command line."""
+    checks: list[Callable[[Task], bool]] = []
+    if args.done or args.pending:
+        wanted = bool(args.done)
+        checks.append(lambda t: bool(t.completed) == wanted)
+    if args.priority:
+        priority = args.priority.casefold()
+        checks.append(lambda t: str(t.priority or "").casefold() == priority)
+    if args.due_before:
+        before = args.due_before
+        checks.append(lambda t: bool(t.deadline) and str(t.deadline) < before)
+    if args.overdue:
+        today = date.today().isoformat()
+        checks.append(lambda t: not t.completed and bool(t.deadline) and str(t.deadline) < today)
+    if args.search:
+        # same rule as SearchIndex without typo tolerance: every word prefixes some token
+        words = tokenize(args.search)
+
+        def matches(t: Task) -> bool:
+            tokens = tokenize(f"{t.title or ''} {t.description or ''}")
+            return all(any(tok.startswith(w) for tok in tokens) for w in words)
+        checks.append(matches)
+    return checks
+
+
+def matching(storage: TaskStorage, args) -> Iterator[list[Task]]:
+    """Chunks of tasks passing the filters (empty chunks are skipped)."""
+    checks = make_filters(args)
+    for chunk in iter_tasks(storage):
+        # narrow the chunk one filter at a time: each pass sees fewer tasks
+        for check in checks:
+            chunk = [t for t in chunk if check(t)]
+        if chunk:
+            yield chunk
+
+
+# --- output ----------------------------------------------------------
+def format_text(t: Task) -> str:
+    line = f"[{'x' if t.completed else ' '}] #{t.id} {t.title}"
+    details = []
+    if t.priority and t.priority != "Normal":
+        details.append(str(t.priority))
+    if t.deadline:
+        details.append(f"due {t.deadline}")
+    return f"{line} ({', '.join(details)})" if details else line
+
+
+def write_tasks(chunks: Iterable[list[Task]], fmt: str, out) -> int:
+    """Write chunks as they arrive; returns the number of tasks written."""
+    written = 0
+    writer = None
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(_FIELDS)
+    for chunk in chunks:
+        if fmt == "csv":
+            writer.writerows([getattr(t, name) for name in _FIELDS] for t in chunk)
+        elif fmt == "jsonl":
+            out.write("".join(json.dumps(t.to_dict(), ensure_ascii=False) + "\n" for t in chunk))
+        else:
+            out.write("".join(format_text(t) + "\n" for t in chunk))
+        written += len(chunk)
+    return written
+
+
+def _limited(chunks: Iterable[list[Task]], limit: Optional[int]) -> Iterator[list[Task]]:
+    if limit is None:
+        yield from chunks
+        return
+    left = limit
+    for chunk in chunks:
+        if left <= 0:
+            return
+        chunk = chunk[:left]
+        left -= len(chunk)
+        yield chunk
+
+
+def _sorted_chunks(chunks: Iterable[list[Task]], order_by: str, reverse: bool) -> Iterator[list[Task]]:
+    key, _ = SORT_KEYS[order_by]
+    tasks = [t for chunk in chunks for t in chunk]
+    tasks.sort(key=lambda t: (key(t), t.id), reverse=reverse)
+    it = iter(tasks)
+    while True:
+        chunk = list(islice(it, CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk
+
+
+# --- commands --------------------------------------------------------
+def cmd_list(storage: TaskStorage, args, out) -> int:
+    chunks = matching(storage, args)
+    if args.sort:
+        chunks = _sorted_chunks(chunks, args.sort, args.reverse)
+    write_tasks(_limited(chunks, args.limit), args.format, out)
+    return 0
+
+
+def cmd_count(storage: TaskStorage, args, out) -> int:
+    out.write(f"{sum(len(chunk) for chunk in matching(storage, args))}\n")
+    return 0
+
+
+def build_report(chunks: Iterable[list[Task]], today: Optional[date] = None) -> dict:
+    """Aggregate counts over the tasks in one pass."""
+    today = today or date.today()
+    today_s = today.isoformat()
+    week_s = (today + timedelta(days=7)).isoformat()
+    report = {"total": 0, "done": 0, "pending": 0, "with_deadline": 0,
+              "overdue": 0, "due_next_7_days": 0, "by_priority": {}}
+    by_priority = report["by_priority"]
+    for chunk in chunks:
+        for t in chunk:
+            report["total"] += 1
+            done = bool(t.completed)
+            report["done" if done else "pending"] += 1
+            counts = by_priority.setdefault(str(t.priority or "Normal"), {"total": 0, "done": 0})
+            counts["total"] += 1
+            counts["done"] += done
+            if t.deadline:
+                report["with_deadline"] += 1
+                deadline = str(t.deadline)
+                if not done and deadline < today_s:
+                    report["overdue"] += 1
+                elif not done and deadline <= week_s:
+                    report["due_next_7_days"] += 1
+    report["percent_done"] = round(100.0 * report["done"] / report["total"], 1) if report["total"] else 0.0
+    return report
+
+
+def cmd_report(storage: TaskStorage, args, out) -> int:
+    report = build_report(matching(storage, args))
+    if args.format == "json":
+        out.write(json.dumps(report, indent=2) + "\n")
+        return 0
+    out.write(f"Tasks:           {report['total']}\n"
+              f"Done:            {report['done']} ({report['percent_done']}%)\n"
+              f"Pending:         {report['pending']}\n"
+              f"With deadline:   {report['with_deadline']}\n"
+              f"Overdue:         {report['overdue']}\n"
+              f"Due in 7 days:   {report['due_next_7_days']}\n"
+              "By priority:\n")
+    for priority, counts in sorted(report["by_priority"].items(), key=lambda kv: -kv[1]["total"]):
+        out.write(f"  {priority:<12} {counts['total']:>8} ({counts['done']} done)\n")
+    return 0
+
+
+def cmd_import(storage: TaskStorage, args, out) -> int:
+    from models.data_model import DataModel
+    # a plain JSON snapshot is rewritten on every save: let write-behind coalesce
+    # the per-chunk saves; incremental backends persist each chunk directly
+    model = DataModel(storage=storage, write_behind=type(storage) is JsonStorage)
+    try:
+        result = import_tasks(model, args.file, args.format, args.chunk_size, dedupe=not args.no_dedupe)
+    finally:
+        model.close()
+    out.write(f"imported {result.imported} tasks in {result.seconds:.2f}s "
+              f"({result.duplicates} duplicates, {result.invalid} invalid)\n")
+    return 0
+
+
+def cmd_export(storage: TaskStorage, args, out) -> int:
+    written = export_tasks((t for chunk in matching(storage, args) for t in chunk), args.file, args.format)
+    out.write(f"exported {written} tasks to {args.file}\n")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    default_store = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tasks.json")
+    parser = argparse.ArgumentParser(prog="python -m cli", description="Query an UpaCube task store without the GUI")
+    parser.add_argument("--store", default=default_store, help="task store path (default: tasks.json)")
+    parser.add_argument("--journal", action="store_true", default=None, help="replay <store>.journal on load")
+
+    filters = argparse.ArgumentParser(add_help=False)
+    state = filters.add_mutually_exclusive_group()
+    state.add_argument("--pending", action="store_true", help="only tasks not done")
+    state.add_argument("--done", action="store_true", help="only completed tasks")
+    filters.add_argument("--priority", help="only this priority (case-insensitive)")
+    filters.add_argument("--due-before", metavar="DATE", help="only tasks with a deadline before DATE (YYYY-MM-DD)")
+    filters.add_argument("--overdue", action="store_true", help="only pending tasks past their deadline")
+    filters.add_argument("--search", metavar="TEXT", help="only tasks whose title/description match every word")
+
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("list", parents=[filters], help="print matching tasks")
+    p.add_argument("--sort", choices=sorted(SORT_KEYS), help="order by this key (collects matches first)")
+    p.add_argument("--reverse", action="store_true", help="descending order")
+    p.add_argument("--limit", type=int, default=None, help="stop after N tasks")
+    p.add_argument("--format", choices=("text", "jsonl", "csv"), default="text")
+    p.set_defaults(func=cmd_list)
+    p = sub.add_parser("count", parents=[filters], help="print the number of matching tasks")
+    p.set_defaults(func=cmd_count)
+    p = sub.add_parser("report", parents=[filters], help="summary counts of matching tasks")
+    p.add_argument("--format", choices=("text", "json"), default="text")
+    p.set_defaults(func=cmd_report)
+    p = sub.add_parser("import", help="add tasks from a JSONL or CSV file (new ids, duplicates skipped)")
+    p.add_argument("file")
+    p.add_argument("--format", choices=("jsonl", "csv"), default=None, help="default: from the file extension")
+    p.add_argument("--chunk-size", type=int, default=10_000, help="records validated and persisted together")
+    p.add_argument("--no-dedupe", action="store_true", help="keep records identical to existing tasks")
+    p.set_defaults(func=cmd_import)
+    p = sub.add_parser("export", parents=[filters], help="write matching tasks to a JSONL or CSV file")
+    p.add_argument("file")
+    p.add_argument("--format", choices=("jsonl", "csv"), default=None, help="default: from the file extension")
+    p.set_defaults(func=cmd_export)
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command != "import" and not os.path.exists(args.store):
+        parser.error(f"no task store at {args.store}")
+    storage = open_storage(args.store, args.journal)
+    try:
+        return args.func(storage, args, sys.stdout)
+    except BrokenPipeError:
+        # output piped into e.g. `head` that stopped reading
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    finally:
+        storage.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,11 +19,21 @@ class MainController:
 
         # Sub-controllers receive specific subviews from the main view
         self.home_controller = HomeController(model, view.home_view)
-        self.task_controller = TaskController(model, view.task_view)
+        self.task_controller: TaskController | None = None
+        if hasattr(view, 'task_view_created') and not view.has_task_view():
+            # the task page is built on first navigation; wire it up then
+            view.task_view_created.connect(self._on_task_view_created)
+        else:
+            self._on_task_view_created(view.task_view)
 
         # allow home controller to request navigation through this coordinator
         self.home_controller.show_task_view_callback = self.view.show_task_view
 
+    def _on_task_view_created(self, task_view):
+        if self.task_controller is None:
+            self.task_controller = TaskController(self.model, task_view)
+
     def update_view(self):
         # Keep convenience method that delegates to task controller
-        self.task_controller.update_view()
+        if self.task_controller is not None:
+            self.task_controller.update_view()
@@ -5,12 +5,17 @@ from datetime import datetime
 import logging
 from typing import Any
 
+from models.history import AddTask, ClearTasks, RemoveTask, ToggleTask, UndoHistory
+from utils.profiling import timed_slot
+
 
 class TaskController:
     """
     Handles task-related user actions and updates the model and view.
     """
 
+    PAGE_SIZE = 200
+
     def __init__(self, model: Any, view: Any):
         self.model = model
         self.view = view
@@ -21,21 +26,45 @@ class TaskController:
         self.view.toggle_task_requested.connect(self.on_toggle_task)
         self.view.remove_task_requested.connect(self.on_remove_task)
         self.view.clear_requested.connect(self.on_clear_requested)
+        if hasattr(self.view, 'undo_requested'):
+            self.view.undo_requested.connect(self.on_undo)
+            self.view.redo_requested.connect(self.on_redo)
+        # add/toggle/remove/clear done through this controller can be undone
+        self.history = UndoHistory()
+        if hasattr(self.view, 'search_requested'):
+            self.view.search_requested.connect(self.on_search)
+        if hasattr(self.view, 'sort_requested'):
+            self.view.sort_requested.connect(self.on_sort_requested)
+        self._search_query = ""
+        self._matches = None    # tasks matching _search_query, in display order
+        self._order_by = None   # None: model (insertion) order
 
-        # Listen to model signals
-        if hasattr(self.model, 'tasks_changed'):
+        # Listen to model signals: fine-grained ones when available, so a single
+        # edit only touches one item; tasks_changed as a coarse fallback
+        if hasattr(self.model, 'task_added'):
+            self.model.task_added.connect(self.on_model_task_added)
+            self.model.task_removed.connect(self.on_model_task_removed)
+            self.model.task_updated.connect(self.on_model_task_updated)
+            self.model.tasks_reset.connect(self.update_task_list)
+        elif hasattr(self.model, 'tasks_changed'):
             self.model.tasks_changed.connect(self.update_task_list)
+        # incremental loading: show chunks as they arrive
+        if hasattr(self.model, 'tasks_loaded'):
+            self.model.tasks_loaded.connect(self.on_model_tasks_loaded)
+            self.model.load_progress.connect(self.on_model_load_progress)
         if hasattr(self.model, 'data_changed'):
             self.model.data_changed.connect(self.on_model_data_changed)
 
         # Initialize view
         self.update_view()
 
+    @timed_slot
     def on_add_task(self, payload: Any):
         self.logger.info('on_add_task start: %r', payload)
         try:
             task = self.model.add_task(payload)
             if task:
+                self.history.push(AddTask(task))
                 ts = datetime.now().strftime("%H:%M:%S")
                 # include brief details in status
                 info = f"{task.title}"
@@ -51,11 +80,13 @@ class TaskController:
             except Exception:
                 pass
 
-    def on_toggle_task(self, index: int):
-        self.logger.info('on_toggle_task start: %r', index)
+    @timed_slot
+    def on_toggle_task(self, task_id: int):
+        self.logger.info('on_toggle_task start: %r', task_id)
         try:
-            task = self.model.toggle_task_completed(index)
+            task = self.model.toggle_by_id(task_id)
             if task:
+                self.history.push(ToggleTask(task))
                 ts = datetime.now().strftime("%H:%M:%S")
                 status = "Done" if getattr(task, "completed", False) else "Not done"
                 title = getattr(task, "title", "(unknown)")
@@ -67,13 +98,18 @@ class TaskController:
             except Exception:
                 pass
 
-    def on_remove_task(self, index: int):
-        self.logger.info('on_remove_task start: %r', index)
+    @timed_slot
+    def on_remove_task(self, task_id: int):
+        self.logger.info('on_remove_task start: %r', task_id)
         try:
-            task = self.model.get_task(index)
+            task = self.model.get_task_by_id(task_id)
             title = getattr(task, "title", "(unknown)") if task else "(unknown)"
-            ok = self.model.remove_task_by_index(index)
+            # recorded before the removal, while the task can still be read
+            command = RemoveTask(task) if task is not None else None
+            ok = self.model.remove_by_id(task_id)
             if ok:
+                if command is not None:
+                    self.history.push(command)
                 ts = datetime.now().strftime("%H:%M:%S")
                 self.view.append_status(f"[{ts}] Removed task: {title}")
         except Exception:
@@ -83,10 +119,13 @@ class TaskController:
             except Exception:
                 pass
 
+    @timed_slot
     def on_clear_requested(self):
         self.logger.info('on_clear_requested start')
         try:
-            self.model.clear_tasks()
+            previous = self.model.clear_tasks()
+            if previous:
+                self.history.push(ClearTasks(previous))
             self.model.data = ""
             ts = datetime.now().strftime("%H:%M:%S")
             self.view.append_status(f"[{ts}] Cleared all tasks")
@@ -97,12 +136,113 @@ class TaskController:
             except Exception:
                 pass
 
+    @timed_slot
+    def on_undo(self):
+        self._step(self.history.undo, "undo", "Undid")
+
+    @timed_slot
+    def on_redo(self):
+        self._step(self.history.redo, "redo", "Redid")
+
+    def _step(self, action, name: str, done: str):
+        self.logger.info('on_%s start', name)
+        try:
+            command = action(self.model)
+            ts = datetime.now().strftime("%H:%M:%S")
+            if command is None:
+                self.view.append_status(f"[{ts}] Nothing to {name}")
+            else:
+                self.view.append_status(f"[{ts}] {done} {command.label}")
+        except Exception:
+            self.logger.exception('on_%s exception', name)
+            try:
+                self.view.append_status(f"Error during {name}")
+            except Exception:
+                pass
+
+    def on_search(self, query: str):
+        self._search_query = query.strip()
+        self.update_task_list()
+
+    def on_sort_requested(self, order_by: str):
+        self.logger.info('on_sort_requested: %r', order_by)
+        self._order_by = order_by or None
+        self.update_task_list()
+
     def on_model_data_changed(self, new_data):
         self.view.append_status(f"Current input changed: {new_data}")
 
+    def on_model_task_added(self, task):
+        if self._search_query:
+            # search results are re-queried rather than patched
+            if task.id in (self.model.search_ids(self._search_query) or ()):
+                self.update_task_list()
+            return
+        if self._order_by:
+            self.view.add_task_item(task, self.model.sort_position(self._order_by, task.id))
+        else:
+            self.view.add_task_item(task)
+
+    def on_model_task_removed(self, task_id: int):
+        if self._matches is not None:
+            matches = [t for t in self._matches if t.id != task_id]
+            if len(matches) == len(self._matches):
+                return  # not a match: neither shown nor counted in the total
+            self._matches = matches
+        self.view.remove_task_item(task_id)
+
+    def on_model_task_updated(self, task_id: int, fields: list):
+        task = self.model.get_task_by_id(task_id)
+        if task is None:
+            return
+        if set(fields) - {'completed'}:
+            if self._search_query:
+                # the edit may change whether (and where) it matches
+                self.update_task_list()
+                return
+            if self._order_by:
+                # a sort key may have changed; moving to the same row is a no-op
+                self.view.move_task_item(task, self.model.sort_position(self._order_by, task_id))
+        self.view.update_task_item(task)
+
+    def on_model_tasks_loaded(self, tasks: list):
+        if self._search_query:
+            self.update_task_list()
+        elif self._order_by:
+            # ascending positions, so every earlier-ranked task is already shown
+            positioned = sorted((self.model.sort_position(self._order_by, t.id), i) for i, t in enumerate(tasks))
+            for row, i in positioned:
+                self.view.add_task_item(tasks[i], row)
+        else:
+            self.view.add_task_items(tasks)
+
+    def on_model_load_progress(self, fraction: float):
+        self.view.show_load_progress(fraction)
+
+    def _fetch_page(self, offset: int, limit: int) -> list:
+        """One window of the tasks currently shown (all tasks or the search matches)."""
+        if self._matches is not None:
+            return self._matches[offset:offset + limit]
+        return self.model.get_tasks(offset, limit, order_by=self._order_by)
+
     def update_task_list(self):
-        tasks = self.model.get_tasks()
-        self.view.update_tasks(tasks)
+        self._matches = None
+        total = None
+        if self._search_query:
+            try:
+                self._matches = self.model.search_tasks(self._search_query, order_by=self._order_by)
+                total = len(self._matches)
+            except Exception:
+                self.logger.exception('search failed')
+        if hasattr(self.view, 'show_task_page'):
+            # only the first page; the view asks for more as it scrolls
+            if total is None:
+                total = self.model.get_task_count()
+            self.view.show_task_page(self._fetch_page(0, self.PAGE_SIZE), total, self._fetch_page)
+        elif self._matches is not None:
+            self.view.update_tasks(self._matches)
+        else:
+            self.view.update_tasks(self.model.get_tasks(order_by=self._order_by))
 
     def update_view(self):
         self.update_task_list()
@@ -1,14 +1,15 @@
+import argparse
 import sys
 import traceback
 import logging
-from logging.handlers import RotatingFileHandler
 from PyQt6.QtWidgets import QApplication, QMessageBox
 import os
 
 from models.data_model import DataModel
 from views.main_view import MainView
 from controllers.main_controller import MainController
-from utils.logging_qt import QtHandler
+from utils.logging_setup import setup_logging, shutdown_logging
+from utils.profiling import enable_slot_timing, run_profiled
 
 
 def excepthook(exc_type, exc_value, exc_tb):
@@ -21,48 +22,78 @@ def excepthook(exc_type, exc_value, exc_tb):
     logging.getLogger().exception(tb)
 
 
+def parse_args(argv):
+    """Application options; anything unrecognised is left for Qt."""
+    parser = argparse.ArgumentParser(description="UpaCube task manager")
+    parser.add_argument('--profile', nargs='?', const='logs/upacube.prof', metavar='PATH',
+                        help="run the event loop under cProfile and write stats to PATH on exit "
+                             "(also enables slow-slot logging)")
+    parser.add_argument('--slow-slot-ms', type=float, default=None, metavar='MS',
+                        help="log controller slots that take longer than MS")
+    parser.add_argument('--serve', nargs='?', type=int, const=8765, default=None, metavar='PORT',
+                        help="also serve the tasks over HTTP/JSON on localhost:PORT (default 8765)")
+    return parser.parse_known_args(argv[1:])
+
+
 def main():
     sys.excepthook = excepthook
+    args, qt_args = parse_args(sys.argv)
 
-    # configure logging
-    root = logging.getLogger()
-    root.setLevel(logging.INFO)
-    formatter = logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s')
-    # rotating file in logs/ directory
-    base_dir = os.path.dirname(__file__)
-    logs_dir = os.path.join(base_dir, 'logs')
-    try:
-        os.makedirs(logs_dir, exist_ok=True)
-    except Exception:
-        pass
-    fh_path = os.path.join(logs_dir, 'upacube.log')
-    fh = RotatingFileHandler(fh_path, maxBytes=5_000_000, backupCount=3, encoding='utf-8')
-    fh.setFormatter(formatter)
-    root.addHandler(fh)
-    # console
-    ch = logging.StreamHandler()
-    ch.setFormatter(formatter)
-    root.addHandler(ch)
-    # Qt handler (view will connect emitter to its text widget)
-    qh = QtHandler()
-    qh.setFormatter(formatter)
-    root.addHandler(qh)
+    # configure logging: the root logger only enqueues records; file, console and
+    # Qt handlers run on a QueueListener thread (the view connects the Qt emitter
+    # to its status pane)
+    setup_logging(os.path.join(os.path.dirname(__file__), 'logs'))
+
+    if args.slow_slot_ms is not None:
+        enable_slot_timing(args.slow_slot_ms)
+    elif args.profile:
+        enable_slot_timing()
 
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_args)
 
-    model = DataModel()
+    # write-behind: clicks mark the model dirty, saves run coalesced off the GUI thread;
+    # tasks are read on a thread-pool worker and streamed in, so the window appears at once
+    model = DataModel(write_behind=True, autoload=False)
+    app.aboutToQuit.connect(model.flush)
+    # another instance (or a script) editing tasks.json: merge its changes in
+    model.watch_external_changes()
     view = MainView()
-    # connect Qt logging emitter to the view's status_text
+    # connect Qt logging emitter to the status pane once the task page is built
+    # (records logged before that are held and shown when it connects)
     try:
         from utils.logging_qt import connect_to_textedit
-        connect_to_textedit(view.status_text)
+        view.task_view_created.connect(lambda task_view: connect_to_textedit(task_view.status_text))
     except Exception:
         pass
 
     controller = MainController(model, view)
     logging.getLogger(__name__).info('Application started')
+    # start reading tasks only after the home page has painted, so the load
+    # never competes with the first frame
+    view.first_painted.connect(model.load_async)
+    server = None
+    if args.serve is not None:
+        # imported here so the GUI alone never pays for asyncio and the server
+        from server import ApiServer, QtGateway
+        server = ApiServer(model, port=args.serve, gateway=QtGateway())
+        try:
+            server.start_in_thread()
+        except OSError as e:
+            logging.getLogger(__name__).error('Could not start the API server: %s', e)
+            server = None
     view.show()
-    sys.exit(app.exec())
+    if args.profile:
+        profile_path = os.path.join(os.path.dirname(__file__), args.profile)
+        exit_code = run_profiled(app.exec, profile_path)
+    else:
+        exit_code = app.exec()
+    if server is not None:
+        server.stop()
+    # flush pending saves and stop the storage worker before exiting
+    model.close()
+    logging.getLogger(__name__).info('Application exiting')
+    shutdown_logging()
+    sys.exit(exit_code)
 
 
 if __name__ == '__main__':
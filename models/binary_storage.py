@@ -0,0 +1,315 @@
+"""
+Binary Storage - fixed-width record table plus string heap.
+
+Layout of `<path>`:
+    header   <4sHHQ>  magic, version, record size, heap generation
+    records  <qBBxx10I> per task: id, completed, deleted, then (offset, length)
+             into the heap for title, description, deadline, priority, created_at
+
+Strings live in a separate append-only heap file `<path>.<generation>.heap`.
+Loading maps both files with mmap and unpacks the table with struct.iter_unpack,
+so there is no text parsing at all. Toggling a task rewrites one byte in place,
+edits rewrite one record in place, removals set the tombstone byte and adds
+append one record; only save_all/compact rewrite the files (under a new heap
+generation, so a crash never pairs a table with the wrong heap).
+"""
+import io
+import json
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+from .storage import JsonStorage, TaskStorage
+from .task import Task
+
+
+_MAGIC = b"UPCB"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHQ")
+_RECORD = struct.Struct("<qBBxx10I")
+_COMPLETED_OFFSET = 8
+_DELETED_OFFSET = 9
+_NONE = 0xFFFFFFFF          # offset marking a None string field
+_STRING_FIELDS = ("title", "description", "deadline", "priority", "created_at")
+
+
+class BinaryStorage(TaskStorage):
+    """Binary snapshot backend; see the module docstring for the file format."""
+
+    def __init__(self, path: str, migrate_from: Optional[str] = None, durable: bool = False):
+        self.path = path
+        self.durable = durable
+        self._slots: dict[int, int] = {}      # task id -> record index
+        self._record_count = 0
+        self._dead = 0
+        self._generation = 0
+        self._table = None                    # open "r+b" handle on the record table
+        self._heap = None                     # open "ab" handle on the current heap
+        self._heap_size = 0
+        self._map: mmap.mmap | None = None    # writable map of the table for in-place flag updates
+        self._interned: dict[str, Tuple[int, int]] = {}
+        if not os.path.exists(path):
+            self._rewrite([])
+            if migrate_from and os.path.exists(migrate_from):
+                self.import_json(migrate_from)
+        self._open()
+
+    # --- file handling -------------------------------------------------
+    def _heap_path(self, generation: int) -> str:
+        return f"{self.path}.{generation}.heap"
+
+    def _open(self) -> None:
+        self._close_files()
+        self._table = open(self.path, "r+b")
+        magic, version, record_size, generation = _HEADER.unpack(self._table.read(_HEADER.size))
+        if magic != _MAGIC or version != _VERSION or record_size != _RECORD.size:
+            raise ValueError(f"{self.path} is not a version {_VERSION} UpaCube binary snapshot")
+        self._generation = generation
+        size = os.path.getsize(self.path)
+        self._record_count = (size - _HEADER.size) // _RECORD.size
+        self._heap = open(self._heap_path(generation), "ab")
+        self._heap_size = self._heap.tell()
+
+    def _close_files(self) -> None:
+        self._unmap()
+        for f in (self._table, self._heap):
+            if f is not None:
+                f.close()
+        self._table = self._heap = None
+
+    def _mapped(self) -> mmap.mmap:
+        if self._map is None:
+            self._table.flush()
+            self._map = mmap.mmap(self._table.fileno(), 0)
+        return self._map
+
+    def _unmap(self) -> None:
+        # the table cannot grow while it is mapped (notably on Windows)
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _sync(self, f) -> None:
+        f.flush()
+        if self.durable:
+            os.fsync(f.fileno())
+
+    # --- encoding ------------------------------------------------------
+    def _put_string(self, value: Optional[str]) -> Tuple[int, int]:
+        if value is None:
+            return _NONE, 0
+        if value.__class__ is not str:
+            value = str(value)
+        short = len(value) <= 32
+        if short:
+            ref = self._interned.get(value)
+            if ref is not None:
+                return ref
+        data = value.encode("utf-8")
+        ref = (self._heap_size, len(data))
+        self._heap.write(data)
+        self._heap_size += len(data)
+        if short:
+            # priorities, deadlines and short titles repeat a lot
+            self._interned[value] = ref
+        return ref
+
+    def _pack(self, task: Task, deleted: int = 0) -> bytes:
+        put = self._put_string
+        # unrolled over _STRING_FIELDS: this runs once per task on bulk writes
+        return _RECORD.pack(int(task.id), 1 if task.completed else 0, deleted,
+                            *put(task.title), *put(task.description), *put(task.deadline),
+                            *put(task.priority), *put(task.created_at))
+
+    # --- TaskStorage -----------------------------------------------------
+    def load(self) -> list[Task]:
+        tasks = []
+        for chunk, _ in self.iter_load(chunk_size=1 << 30):
+            tasks.extend(chunk)
+        return tasks
+
+    def iter_load(self, chunk_size: int = 1000) -> Iterator[Tuple[list[Task], float]]:
+        self._unmap()
+        self._table.flush()
+        self._heap.flush()
+        self._slots.clear()
+        self._interned.clear()
+        self._dead = 0
+        if self._record_count == 0:
+            return
+        heap_file = open(self._heap_path(self._generation), "rb")
+        try:
+            heap = mmap.mmap(heap_file.fileno(), 0, access=mmap.ACCESS_READ) if self._heap_size else b""
+            table = mmap.mmap(self._table.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                strings: dict[int, str] = {}
+                interned = self._interned
+
+                def text(offset: int, length: int) -> Optional[str]:
+                    if offset == _NONE:
+                        return None
+                    if not length:
+                        return ""
+                    s = strings.get(offset)
+                    if s is None:
+                        s = heap[offset:offset + length].decode("utf-8")
+                        if length <= 32:
+                            # share repeated short strings between tasks
+                            strings[offset] = s
+                            interned.setdefault(s, (offset, length))
+                    return s
+
+                chunk = []
+                view = memoryview(table)[_HEADER.size:_HEADER.size + self._record_count * _RECORD.size]
+                records = _RECORD.iter_unpack(view)
+                try:
+                    for index, (tid, completed, deleted, to, tl, do, dl, dlo, dll, po, pl, co, cl) in \
+                            enumerate(records):
+                        if deleted:
+                            self._dead += 1
+                            continue
+                        self._slots[tid] = index
+                        chunk.append(Task(tid, text(to, tl) or "", text(do, dl) or "", text(dlo, dll),
+                                          text(po, pl) or "Normal", completed == 1, text(co, cl)))
+                        if len(chunk) >= chunk_size:
+                            yield chunk, (index + 1) / self._record_count
+                            chunk = []
+                finally:
+                    # also when the caller stops early: the map cannot close while exported
+                    del records
+                    view.release()
+                if chunk:
+                    yield chunk, 1.0
+            finally:
+                table.close()
+                if self._heap_size:
+                    heap.close()
+        finally:
+            heap_file.close()
+
+    def save_all(self, tasks: Iterable[Task]) -> None:
+        self._rewrite(tasks)
+        self._open()
+
+    def _rewrite(self, tasks: Iterable[Task]) -> None:
+        """Write a fresh table and heap under a new generation, then swap them in."""
+        self._close_files()
+        old_generation = self._generation if os.path.exists(self.path) else None
+        generation = (old_generation or 0) + 1
+        self._interned = {}
+        self._slots = {}
+        self._heap_size = 0
+        tmp_path = self.path + ".tmp"
+        with open(self._heap_path(generation), "wb") as heap, open(tmp_path, "wb") as table:
+            self._heap = heap
+            table.write(_HEADER.pack(_MAGIC, _VERSION, _RECORD.size, generation))
+            for index, t in enumerate(tasks):
+                table.write(self._pack(t))
+                self._slots[t.id] = index
+            heap.flush()
+            os.fsync(heap.fileno())
+            table.flush()
+            os.fsync(table.fileno())
+        self._heap = None
+        os.replace(tmp_path, self.path)
+        self._generation = generation
+        self._dead = 0
+        if old_generation is not None and old_generation != generation:
+            try:
+                os.remove(self._heap_path(old_generation))
+            except OSError:
+                pass
+
+    def task_added(self, task: Task, tasks: Iterable[Task]) -> None:
+        if task.id in self._slots:
+            self.task_updated(task, _STRING_FIELDS + ("completed",), tasks)
+            return
+        self._append_records([task])
+
+    def _append_records(self, new_tasks: Sequence[Task]) -> None:
+        """Append records for tasks not stored yet: one heap sync and one table write."""
+        if not new_tasks:
+            return
+        # buffer the heap strings of the whole run and write them once
+        heap, self._heap = self._heap, io.BytesIO()
+        try:
+            records = b"".join([self._pack(t) for t in new_tasks])
+        finally:
+            # written even on failure: _heap_size and interned offsets already count it
+            heap.write(self._heap.getvalue())
+            self._heap = heap
+        self._sync(self._heap)
+        self._unmap()
+        self._table.seek(0, os.SEEK_END)
+        self._table.write(records)
+        self._sync(self._table)
+        for t in new_tasks:
+            self._slots[t.id] = self._record_count
+            self._record_count += 1
+
+    def task_updated(self, task: Task, fields: Sequence[str], tasks: Iterable[Task]) -> None:
+        index = self._slots.get(task.id)
+        if index is None:
+            self.task_added(task, tasks)
+            return
+        offset = _HEADER.size + index * _RECORD.size
+        mm = self._mapped()
+        if list(fields) == ["completed"]:
+            # the common case: flip one byte in place
+            mm[offset + _COMPLETED_OFFSET] = 1 if task.completed else 0
+        else:
+            record = self._pack(task)
+            self._sync(self._heap)
+            mm[offset:offset + _RECORD.size] = record
+        if self.durable:
+            mm.flush()
+
+    def task_removed(self, task_id: int, tasks: Iterable[Task]) -> None:
+        index = self._slots.pop(task_id, None)
+        if index is None:
+            return
+        mm = self._mapped()
+        mm[_HEADER.size + index * _RECORD.size + _DELETED_OFFSET] = 1
+        if self.durable:
+            mm.flush()
+        self._dead += 1
+
+    def tasks_cleared(self, tasks: Iterable[Task]) -> None:
+        self.save_all([])
+
+    def apply_batch(self, ops: Sequence[Tuple[str, tuple]], tasks: Iterable[Task]) -> None:
+        # runs of adds of new tasks (bulk imports) are appended together; every
+        # other op first writes out the pending run, so the order is preserved
+        pending: dict[int, Task] = {}
+        for hook, args in ops:
+            if hook == "task_added" and args[0].id not in self._slots and args[0].id not in pending:
+                pending[args[0].id] = args[0]
+                continue
+            self._append_records(list(pending.values()))
+            pending.clear()
+            getattr(self, hook)(*args, tasks)
+        self._append_records(list(pending.values()))
+
+    def compact(self, tasks: Iterable[Task], background: bool = False) -> None:
+        """Rewrite without tombstones and unreferenced heap strings."""
+        if self._dead:
+            self.save_all(tasks)
+
+    def close(self) -> None:
+        self._close_files()
+
+    # --- JSON interchange ------------------------------------------------
+    def import_json(self, json_path: str) -> int:
+        """Replace the stored tasks with those from a tasks.json file."""
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        tasks = [Task.from_dict(d) for d in data] if isinstance(data, list) else []
+        self.save_all(tasks)
+        return len(tasks)
+
+    def export_json(self, json_path: str) -> int:
+        """Write the stored tasks to a tasks.json file; returns the number written."""
+        tasks = self.load()
+        JsonStorage(json_path).save_all(tasks)
+        return len(tasks)
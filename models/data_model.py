@@ -1,14 +1,39 @@
 ﻿"""
 Task Data Model - stores tasks and persists them to a JSON file.
-Each task is represented in-memory as models.task.Task and persisted as dicts in JSON.
+Each task is represented in-memory as models.task.Task and persisted through a
+models.storage.TaskStorage backend: JSON by default, optionally an append-only
+journal (models.journal) or SQLite (models.sqlite_storage). With write_behind=True
+saves are coalesced on a background thread (models.write_behind).
+Large stores can be loaded chunk by chunk on the event loop (load_incrementally)
+or read on a QThreadPool worker with the chunks queued back (load_async),
+and columnar=True keeps them in a compact models.task_store.TaskStore.
+Titles and descriptions are searchable through an incrementally maintained
+models.search_index.SearchIndex (search_ids/search_tasks), and orderings by
+deadline, priority or creation time come from bisect-maintained
+models.sorted_index.SortedIndex instances (get_sorted_tasks, due_soonest, overdue).
+watch_external_changes() follows edits other processes make to a shared JSON
+store and merges them in by id (reload_changes), emitting only what changed.
 """
-import json
+import logging
 import os
-from PyQt6.QtCore import QObject, pyqtSignal
+from datetime import date
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
+from typing import Iterable, Optional
+from PyQt6.QtCore import QObject, QThreadPool, QTimer, pyqtSignal
 
+from .search_index import SearchIndex
+from .sorted_index import INDEX_KEYS, SORT_KEYS, SortedIndex
+from .storage import JsonStorage, TaskStorage
 from .task import Task
+from .task_store import TaskStore
+from .workers import LoadWorker
+from .write_behind import WriteBehindStorage
 
 
+logger = logging.getLogger(__name__)
+
 class DataModel(QObject):
     """
     Model class that holds task data and business logic.
@@ -17,13 +42,49 @@ class DataModel(QObject):
 
     # Signals
     data_changed = pyqtSignal(str)      # Emits when the current data string changes
-    tasks_changed = pyqtSignal()        # Emits when the tasks list changes
+    tasks_changed = pyqtSignal()        # Emits when the tasks list changes (any mutation)
+    # Fine-grained change signals, so observers can update only what changed
+    task_added = pyqtSignal(object)     # Task
+    task_removed = pyqtSignal(int)      # task id
+    task_updated = pyqtSignal(int, list)  # task id, names of changed fields
+    tasks_reset = pyqtSignal()          # contents replaced wholesale (clear, batch)
+    saved = pyqtSignal(float, int)      # Emits (latency seconds, coalesced mutations) after a write-behind save
+    # Incremental loading
+    tasks_loaded = pyqtSignal(list)     # a chunk of newly loaded Tasks
+    load_progress = pyqtSignal(float)   # fraction loaded, 0..1
+    load_finished = pyqtSignal()
 
-    def __init__(self, storage_path=None):
+    def __init__(self, storage_path=None, journal: bool = False, compact_threshold: int = 1000,
+                 storage: Optional[TaskStorage] = None, write_behind: bool = False, save_window: float = 0.25,
+                 autoload: bool = True, columnar: bool = False):
         super().__init__()
         self._data = ""
-        self._tasks: list[Task] = []
+        # id -> Task; dicts keep insertion order, so this is also the display order.
+        # columnar=True swaps in a TaskStore, which hands out Task-compatible views
+        self._columnar = columnar
+        self._tasks: dict[int, Task] | TaskStore = self._new_index()
         self._next_id = 1
+        # batch() state: pending storage hook calls and a deferred change notification
+        self._batch_depth = 0
+        self._batch_ops: list[tuple[str, tuple]] = []
+        self._batch_changed = False
+        # incremental load state: mutations issued meanwhile are replayed afterwards
+        self._loading = False
+        self._load_iter = None
+        self._load_timer: QTimer | None = None
+        self._load_worker: LoadWorker | None = None
+        self._load_pool: QThreadPool | None = None
+        self._deferred: list[tuple] = []
+        # full-text index; built on first search (or chunk by chunk during an
+        # incremental load) and then updated per mutation
+        self._search: SearchIndex | None = None
+        # order_by name -> SortedIndex, built on first use and kept in sync
+        self._sorted: dict[str, SortedIndex] = {}
+        # external change tracking (watch_external_changes): ids mutated here
+        # that may not have reached disk yet, which a reload must not revert
+        self._watcher = None
+        self._local_changes: set[int] | None = None
+        self._local_cleared = False
 
         # Decide storage path (project root/tasks.json by default)
         if storage_path:
@@ -32,38 +93,376 @@ class DataModel(QObject):
             base_dir = os.path.dirname(os.path.dirname(__file__))
             self.storage_path = os.path.join(base_dir, "tasks.json")
 
-        self._load()
+        # Persistence backend: explicit storage wins, else JSON (optionally journaled)
+        if storage is not None:
+            self._storage = storage
+        elif journal:
+            # each mutation costs one small append instead of a full rewrite
+            # (imported here: most runs never use the journal backend)
+            from .journal import JournalStorage
+            self._storage = JournalStorage(self.storage_path, compact_threshold)
+        else:
+            self._storage = JsonStorage(self.storage_path)
+        if write_behind:
+            # mutations only mark the model dirty; a worker coalesces and saves
+            self._storage = WriteBehindStorage(self._storage, save_window, on_saved=self.saved.emit)
+
+        # autoload=False leaves the model empty until load_incrementally() is called
+        if autoload:
+            self._load()
+
+    @property
+    def storage(self) -> TaskStorage:
+        return self._storage
+
+    @property
+    def is_loading(self) -> bool:
+        return self._loading
 
     # --- persistence -------------------------------------------------
+    def _new_index(self, tasks: Iterable[Task] = ()):
+        """Return the id -> task container: a plain dict or a columnar TaskStore."""
+        if self._columnar:
+            return TaskStore(tasks)
+        return {t.id: t for t in tasks}
+
     def _load(self):
-        """Load tasks from the JSON storage file if it exists."""
+        """Load tasks from the storage backend."""
         try:
-            if os.path.exists(self.storage_path):
-                with open(self.storage_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        self._tasks = [Task.from_dict(d) for d in data]
-                        # compute next id
-                        max_id = max((t.id for t in self._tasks), default=0)
-                        self._next_id = max_id + 1
-                    else:
-                        self._tasks = []
-            else:
-                # ensure file exists
-                self._save()
+            self._tasks = self._new_index(self._storage.load())
+            self._search = None
+            self._sorted = {}
+            # compute next id
+            max_id = max(self._tasks, default=0)
+            self._next_id = max_id + 1
         except Exception:
             # If loading fails, fallback to empty list (do not crash app)
-            self._tasks = []
+            self._tasks = self._new_index()
+            self._search = None
+            self._sorted = {}
+
+    def load_incrementally(self, chunk_size: int = 2000):
+        """Load tasks chunk by chunk on the event loop (requires a running QApplication).
+
+        Emits tasks_reset first, then tasks_loaded(chunk) and load_progress(fraction)
+        per chunk, and load_finished at the end, so the first page can be shown
+        while the rest is still being read.
+        """
+        if self._loading:
+            return
+        self._begin_load()
+        self._load_iter = self._storage.iter_load(chunk_size)
+        self._load_timer = QTimer(self)
+        self._load_timer.timeout.connect(self._load_next_chunk)
+        self._load_timer.start(0)
+
+    def load_async(self, chunk_size: int = 500, pool: Optional[QThreadPool] = None):
+        """Read and parse the store on a QThreadPool worker (requires a running event loop).
+
+        Emits the same signals as load_incrementally; chunks are queued back to
+        the GUI thread, so only indexing and display happen there. Mutations
+        issued meanwhile are applied in order once the load has finished.
+        """
+        if self._loading:
+            return
+        # the search index is built on the worker too and adopted at the end
+        self._begin_load(index=False)
+        worker = LoadWorker(self._storage, chunk_size, index=SearchIndex())
+        worker.signals.chunk_loaded.connect(self._on_chunk_loaded)
+        worker.signals.failed.connect(self._on_load_failed)
+        worker.signals.finished.connect(self._on_load_done)
+        self._load_worker = worker
+        self._load_pool = pool or QThreadPool.globalInstance()
+        self._load_pool.start(worker)
+
+    def _begin_load(self, index: bool = True):
+        self._tasks = self._new_index()
+        self._next_id = 1
+        self._search = SearchIndex() if index else None
+        self._sorted = {}
+        self._loading = True
+        self.tasks_reset.emit()
+        self.load_progress.emit(0.0)
+
+    def _is_current_load(self) -> bool:
+        # chunks still queued from a cancelled worker are dropped
+        worker = self._load_worker
+        return worker is not None and self.sender() is worker.signals
+
+    def _on_chunk_loaded(self, chunk: list, progress: float):
+        if self._is_current_load():
+            self._add_loaded(chunk)
+            self.load_progress.emit(progress)
+            self._load_worker.chunk_consumed()
+
+    def _on_load_failed(self, message: str):
+        if self._is_current_load():
+            logger.error("Background load failed; keeping tasks loaded so far: %s", message)
+
+    def _on_load_done(self):
+        if self._is_current_load():
+            if self._search is None:
+                # nobody searched mid-load: take over the index built on the worker
+                self._search = self._load_worker.index
+            self._finish_load()
+
+    def _load_next_chunk(self):
+        try:
+            chunk, progress = next(self._load_iter)
+        except StopIteration:
+            self._finish_load()
+            return
+        except Exception:
+            logger.exception("Incremental load failed; keeping tasks loaded so far")
+            self._finish_load()
+            return
+        self._add_loaded(chunk)
+        self.load_progress.emit(progress)
+
+    def _add_loaded(self, chunk: list[Task]):
+        """Index a chunk of loaded tasks and announce the new ones."""
+        new = []
+        for t in chunk:
+            if t.id in self._tasks:
+                # duplicate id in the store: last one wins, like a full load
+                self._tasks[t.id] = t
+                self._index(self._tasks[t.id])
+                self.task_updated.emit(t.id, list(Task.__dataclass_fields__))
+                continue
+            self._tasks[t.id] = t
+            new.append(self._tasks[t.id])
+            self._index(new[-1])
+            if t.id >= self._next_id:
+                self._next_id = t.id + 1
+        if new:
+            self.tasks_loaded.emit(new)
+
+    def _finish_load(self):
+        if self._load_timer is not None:
+            self._load_timer.stop()
+            self._load_timer.deleteLater()
+            self._load_timer = None
+        self._load_iter = None
+        self._load_worker = None
+        self._loading = False
+        self.load_progress.emit(1.0)
+        self.load_finished.emit()
+        self.tasks_changed.emit()
+        # apply mutations requested during the load, in order
+        deferred, self._deferred = self._deferred, []
+        for method, args in deferred:
+            method(*args)
+
+    def _defer_while_loading(self, method, *args) -> bool:
+        """Queue a mutation issued during an incremental load; True if queued."""
+        if not self._loading:
+            return False
+        self._deferred.append((method, args))
+        return True
+
+    def _index(self, task, fields=None):
+        """Update the search and sort indexes for a new task or changed `fields`."""
+        if self._search is not None and (fields is None or "title" in fields or "description" in fields):
+            self._search.add(task)
+        for name, index in self._sorted.items():
+            if fields is None or any(f in fields for f in INDEX_KEYS[name][1]):
+                index.add(task)
+
+    def _unindex(self, task_id: int):
+        if self._search is not None:
+            self._search.remove(task_id)
+        for index in self._sorted.values():
+            index.remove(task_id)
 
     def _save(self):
-        """Save tasks to the JSON storage file (as list of dicts)."""
+        """Save the full task list through the storage backend."""
         try:
-            with open(self.storage_path, "w", encoding="utf-8") as f:
-                json.dump([t.to_dict() for t in self._tasks], f, ensure_ascii=False, indent=2)
+            self._storage.save_all(self._tasks.values())
         except Exception:
             # best-effort save: ignore errors to avoid crashing UI
             pass
 
+    def _persist(self, hook: str, *args):
+        """Report one mutation to the storage backend (best-effort)."""
+        if self._local_changes is not None:
+            self._note_local_change(hook, args)
+        if self._batch_depth:
+            self._batch_ops.append((hook, args))
+            return
+        try:
+            getattr(self._storage, hook)(*args, self._tasks.values())
+        except Exception:
+            # incremental write failed: fall back to a full save
+            self._save()
+
+    def _notify(self, signal=None, *args):
+        """Emit the given fine-grained signal and tasks_changed.
+
+        Inside a batch both are deferred and replaced by one tasks_reset.
+        """
+        if self._batch_depth:
+            self._batch_changed = True
+            return
+        if signal is not None:
+            signal.emit(*args)
+        self.tasks_changed.emit()
+
+    @contextmanager
+    def batch(self):
+        """Group mutations: persist them together and emit tasks_reset/tasks_changed once on exit.
+
+        Usage: `with model.batch(): ...`. Batches may be nested; only the
+        outermost one flushes.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._end_batch()
+
+    def _end_batch(self):
+        ops, self._batch_ops = self._batch_ops, []
+        changed, self._batch_changed = self._batch_changed, False
+        if ops:
+            try:
+                self._storage.apply_batch(ops, self._tasks.values())
+            except Exception:
+                self._save()
+        if changed:
+            self.tasks_reset.emit()
+            self.tasks_changed.emit()
+
+    def flush(self):
+        """Block until pending (write-behind) saves have reached disk."""
+        try:
+            self._storage.flush()
+        except Exception:
+            pass
+
+    @property
+    def save_stats(self):
+        """Write-behind statistics (saves, coalesced mutations, latency) or None."""
+        return getattr(self._storage, "stats", None)
+
+    def compact(self, background: bool = False):
+        """Let the backend reclaim space from incremental writes (e.g. fold the journal)."""
+        try:
+            self._storage.compact(self._tasks.values(), background=background)
+        except Exception:
+            pass
+
+    def close(self):
+        """Flush pending storage work and release its resources."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+        if self._load_worker is not None:
+            # let a background load stop before its storage goes away
+            self._load_worker.cancel()
+            self._load_pool.waitForDone()
+        self._storage.close()
+
+    # --- external changes ---------------------------------------------
+    # fields compared (and copied) when merging a task changed on disk
+    _MERGED_FIELDS = tuple(f for f in Task.__dataclass_fields__ if f != "id")
+    # more changes than this are announced as one tasks_reset
+    RELOAD_RESET_THRESHOLD = 500
+
+    def watch_external_changes(self, debounce_ms: int = 200):
+        """Merge in edits other processes make to the JSON store (requires an event loop).
+
+        Returns the StoreWatcher, or None for backends that are not a plain
+        JSON file (SQLite and the journal have their own write paths).
+        """
+        base = getattr(self._storage, "inner", self._storage)
+        if type(base) is not JsonStorage:
+            return None
+        if self._watcher is None:
+            from .file_watcher import StoreWatcher
+            self._local_changes = set()
+            self._watcher = StoreWatcher(base.path, base.changed_on_disk, debounce_ms, parent=self)
+            self._watcher.changed.connect(self.reload_changes)
+        return self._watcher
+
+    def _note_local_change(self, hook: str, args: tuple):
+        if hook == "tasks_cleared":
+            self._local_cleared = True
+        elif hook == "task_removed":
+            self._local_changes.add(args[0])
+        elif hook in ("task_added", "task_updated"):
+            self._local_changes.add(args[0].id)
+
+    def reload_changes(self) -> tuple[int, int, int]:
+        """Re-read the store and apply only what differs from memory, by id.
+
+        While watching, tasks with changes of our own that are still waiting
+        for a (write-behind) save keep their in-memory state; everything else
+        follows the file. Emits task_added/task_updated/task_removed per
+        change (one tasks_reset for large diffs) and nothing when the file
+        matches memory. Returns (added, updated, removed).
+        """
+        if self._loading:
+            # the running load reads the store anyway
+            return 0, 0, 0
+        if not getattr(self._storage, "has_pending", False):
+            # everything done here is on disk: the file is the newer truth
+            if self._local_changes is not None:
+                self._local_changes.clear()
+            self._local_cleared = False
+        try:
+            disk = self._storage.load()
+        except Exception:
+            logger.exception("Could not re-read the task store after an external change")
+            return 0, 0, 0
+
+        keep = self._local_changes or set()
+        fields = self._MERGED_FIELDS
+        seen = set()
+        added, updated, removed = [], [], []
+        for t in disk:
+            seen.add(t.id)
+            if t.id in keep:
+                continue
+            task = self._tasks.get(t.id)
+            if task is None:
+                if self._local_cleared:
+                    continue
+                self._tasks[t.id] = t
+                task = self._tasks[t.id]
+                self._index(task)
+                added.append(task)
+                if t.id >= self._next_id:
+                    self._next_id = t.id + 1
+                continue
+            changed = [f for f in fields if getattr(task, f) != getattr(t, f)]
+            if changed:
+                for f in changed:
+                    setattr(task, f, getattr(t, f))
+                self._index(task, changed)
+                updated.append((task.id, changed))
+        for task_id in [i for i in self._tasks if i not in seen and i not in keep]:
+            del self._tasks[task_id]
+            self._unindex(task_id)
+            removed.append(task_id)
+
+        total = len(added) + len(updated) + len(removed)
+        if total > self.RELOAD_RESET_THRESHOLD:
+            self.tasks_reset.emit()
+        else:
+            for task in added:
+                self.task_added.emit(task)
+            for task_id, changed in updated:
+                self.task_updated.emit(task_id, changed)
+            for task_id in removed:
+                self.task_removed.emit(task_id)
+        if total:
+            self.tasks_changed.emit()
+            logger.info("Merged external changes to the task store: %d added, %d updated, %d removed",
+                        len(added), len(updated), len(removed))
+        return len(added), len(updated), len(removed)
+
     # --- data property (current input) ------------------------------
     @property
     def data(self) -> str:
@@ -76,65 +475,367 @@ class DataModel(QObject):
             self.data_changed.emit(value)
 
     # --- tasks API --------------------------------------------------
-    def add_task(self, title: str) -> Task | None:
-        """Add a new Task and persist changes."""
+    def _take_ids(self, count: int = 1) -> int:
+        """Allocate `count` consecutive new ids; returns the first.
+
+        The backend reserves them, so processes sharing a store never reuse
+        each other's ids.
+        """
+        try:
+            first = self._storage.reserve_ids(count, self._next_id)
+        except Exception:
+            # best-effort, like saving: fall back to our own counter
+            first = self._next_id
+        self._next_id = first + count
+        return first
+
+    def _make_task(self, payload) -> Task | None:
+        """Build (but do not store) a Task from a title or a dict with extra fields."""
         # Support passing a dict with extra fields
-        if isinstance(title, dict):
-            data = title
+        if isinstance(payload, dict):
+            data = payload
             title_text = str(data.get('title', '')).strip()
             if not title_text:
                 return None
             description = str(data.get('description', ''))
             deadline = data.get('deadline')
             priority = str(data.get('priority', 'Normal'))
-            task = Task(id=self._next_id, title=title_text, description=description, deadline=deadline, priority=priority)
-        else:
-            title_text = str(title).strip()
-            if not title_text:
-                return None
-            task = Task(id=self._next_id, title=title_text)
-        self._next_id += 1
-        self._tasks.append(task)
-        self._save()
-        self.tasks_changed.emit()
+            return Task(id=self._take_ids(), title=title_text, description=description, deadline=deadline, priority=priority)
+        title_text = str(payload).strip()
+        if not title_text:
+            return None
+        return Task(id=self._take_ids(), title=title_text)
+
+    def add_task(self, title: str) -> Task | None:
+        """Add a new Task and persist changes."""
+        if self._defer_while_loading(self.add_task, title):
+            return None
+        task = self._make_task(title)
+        if task is None:
+            return None
+        self._tasks[task.id] = task
+        # with a TaskStore this is a view onto the stored row
+        task = self._tasks[task.id]
+        self._index(task)
+        self._persist("task_added", task)
+        self._notify(self.task_added, task)
         return task
 
-    def get_tasks(self) -> list[Task]:
-        """Return a shallow copy of tasks list."""
-        return list(self._tasks)
+    def add_tasks(self, payloads: Iterable) -> list[Task]:
+        """Add many tasks (titles or dicts) with a single save and notification."""
+        payloads = list(payloads)
+        if self._defer_while_loading(self.add_tasks, payloads):
+            return []
+        added = []
+        with self.batch():
+            for payload in payloads:
+                task = self.add_task(payload)
+                if task is not None:
+                    added.append(task)
+        return added
+
+    def bulk_add(self, rows: Iterable[dict]) -> list[Task]:
+        """Add already-validated task fields (Task keyword arguments without id).
+
+        Ids are assigned as one block from _next_id, and the whole call is one
+        batch: the backend persists it once and observers get one tasks_reset.
+        """
+        rows = list(rows)
+        if self._defer_while_loading(self.bulk_add, rows):
+            return []
+        first = self._take_ids(len(rows))
+        added = []
+        with self.batch():
+            for task_id, row in enumerate(rows, first):
+                self._tasks[task_id] = Task(task_id, **row)
+                task = self._tasks[task_id]
+                self._index(task)
+                self._persist("task_added", task)
+                self._notify(self.task_added, task)
+                added.append(task)
+        return added
+
+    def remove_tasks(self, task_ids: Iterable[int]) -> int:
+        """Remove tasks by id with a single save and notification. Returns the number removed."""
+        task_ids = list(task_ids)
+        if self._defer_while_loading(self.remove_tasks, task_ids):
+            return 0
+        with self.batch():
+            return sum(1 for tid in task_ids if self.remove_by_id(tid))
+
+    def set_completed(self, task_ids: Iterable[int], value: bool = True) -> list[Task]:
+        """Set the 'completed' flag on tasks by id; returns the tasks that actually changed."""
+        task_ids = list(task_ids)
+        if self._defer_while_loading(self.set_completed, task_ids, value):
+            return []
+        changed = []
+        with self.batch():
+            for tid in task_ids:
+                task = self._tasks.get(tid)
+                if task is None or bool(task.completed) == bool(value):
+                    continue
+                task.completed = bool(value)
+                self._index(task, ("completed",))
+                self._persist("task_updated", task, ("completed",))
+                self._notify(self.task_updated, task.id, ["completed"])
+                changed.append(task)
+        return changed
+
+    def get_tasks(self, offset: int = 0, limit: Optional[int] = None, completed: Optional[bool] = None,
+                  order_by: Optional[str] = None, reverse: bool = False) -> list[Task]:
+        """Return a window of tasks: `limit` tasks starting at `offset` (all by default),
+        optionally only pending/done ones, in model order or sorted by `order_by`
+        ('deadline', 'priority' or 'created_at'). Use count_tasks() for the total.
+        """
+        stop = None if limit is None else offset + limit
+        if order_by:
+            ids = self._sorted_index(order_by).ids(reverse=reverse)
+            tasks = self._tasks
+            source = (tasks[i] for i in ids)
+        else:
+            source = reversed(self._tasks.values()) if reverse else iter(self._tasks.values())
+        if completed is not None:
+            source = (t for t in source if bool(t.completed) == completed)
+        return list(islice(source, offset, stop))
 
     def get_task_count(self) -> int:
         return len(self._tasks)
 
+    def query_tasks(self, completed: Optional[bool] = None, priority: Optional[str] = None,
+                    deadline_before: Optional[str] = None, limit: Optional[int] = None) -> list[Task]:
+        """Return tasks matching the filters; indexed backends answer without scanning.
+
+        The result holds the model's own tasks (as get_task_by_id returns them),
+        also when the backend builds its own copies from the database.
+        """
+        found = self._storage.query(self._tasks.values(), completed=completed, priority=priority,
+                                    deadline_before=deadline_before, limit=limit)
+        tasks = self._tasks
+        return [tasks[t.id] for t in found if t.id in tasks]
+
+    def count_tasks(self, completed: Optional[bool] = None) -> int:
+        """Count tasks, optionally only pending (False) or done (True) ones."""
+        return self._storage.count(self._tasks.values(), completed=completed)
+
     def clear_tasks(self):
-        """Remove all tasks and persist."""
-        self._tasks.clear()
+        """Remove all tasks and persist.
+
+        The task container is swapped for an empty one rather than emptied, and
+        the old one is returned (None if a running load defers the call).
+        Nothing modifies it afterwards, so restore_cleared() can put it back.
+        """
+        if self._defer_while_loading(self.clear_tasks):
+            return None
+        previous = self._tasks
+        self._tasks = self._new_index()
+        if self._search is not None:
+            self._search.clear()
+        for index in self._sorted.values():
+            index.clear()
+        self._persist("tasks_cleared")
+        self._notify(self.tasks_reset)
+        return previous
+
+    def restore_cleared(self, previous):
+        """Undo clear_tasks(): make the container it returned current again.
+
+        Tasks added since the clear stay, after the restored ones. The whole
+        collection is saved once and announced with tasks_reset; the search
+        and sort indexes are rebuilt on their next use.
+        """
+        if self._defer_while_loading(self.restore_cleared, previous):
+            return
+        for task in list(self._tasks.values()):
+            previous[task.id] = task
+        self._tasks = previous
+        self._search = None
+        self._sorted = {}
+        if self._local_changes is not None:
+            self._local_changes.update(previous)
         self._save()
-        self.tasks_changed.emit()
+        self._notify(self.tasks_reset)
+
+    def restore_tasks(self, tasks: Iterable[Task]) -> list[Task]:
+        """Put removed tasks back under their own ids (e.g. to undo a removal).
+
+        Each goes before the first remaining task with a larger id, so a task
+        returns to where it was; ids that are already present are skipped.
+        """
+        tasks = list(tasks)
+        if self._defer_while_loading(self.restore_tasks, tasks):
+            return []
+        tasks = sorted((t for t in tasks if t.id not in self._tasks), key=lambda t: t.id)
+        if not tasks:
+            return []
+        last = next(reversed(self._tasks.values()), None)
+        appended = last is None or tasks[0].id > last.id
+        if appended:
+            for t in tasks:
+                self._tasks[t.id] = t
+        else:
+            # going back mid-list: rebuild the order once (O(n))
+            incoming = iter(tasks)
+            pending = next(incoming)
+            ordered = []
+            for t in self._tasks.values():
+                while pending is not None and pending.id < t.id:
+                    ordered.append(pending)
+                    pending = next(incoming, None)
+                ordered.append(t)
+            if pending is not None:
+                ordered.append(pending)
+                ordered.extend(incoming)
+            self._tasks = self._new_index(ordered)
+        restored = [self._tasks[t.id] for t in tasks]
+        self._next_id = max(self._next_id, restored[-1].id + 1)
+        if appended and len(restored) == 1:
+            self._index(restored[0])
+            self._persist("task_added", restored[0])
+            self._notify(self.task_added, restored[0])
+            return restored
+        if appended:
+            # several tasks at the end: observers refresh once (tasks_reset)
+            with self.batch():
+                for task in restored:
+                    self._index(task)
+                    self._persist("task_added", task)
+                    self._notify(self.task_added, task)
+            return restored
+        # rows in the middle: incremental backends would append an added task,
+        # so the whole collection is saved in its new order
+        for task in restored:
+            self._index(task)
+        if self._local_changes is not None:
+            self._local_changes.update(t.id for t in restored)
+        self._save()
+        self._notify(self.tasks_reset)
+        return restored
+
+    def get_task_by_id(self, task_id: int) -> Task | None:
+        """Return the Task with the given id in O(1), or None."""
+        return self._tasks.get(task_id)
 
+    def remove_by_id(self, task_id: int) -> bool:
+        """Remove the Task with the given id. Returns True if removed."""
+        if self._defer_while_loading(self.remove_by_id, task_id):
+            return False
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return False
+        self._unindex(task.id)
+        self._persist("task_removed", task.id)
+        self._notify(self.task_removed, task.id)
+        return True
+
+    def toggle_by_id(self, task_id: int) -> Task | None:
+        """Toggle the 'completed' flag for the Task with the given id."""
+        if self._defer_while_loading(self.toggle_by_id, task_id):
+            return None
+        task = self._tasks.get(task_id)
+        if task is None:
+            return None
+        task.completed = not bool(task.completed)
+        self._index(task, ("completed",))
+        self._persist("task_updated", task, ("completed",))
+        self._notify(self.task_updated, task.id, ["completed"])
+        return task
+
+    def update_task(self, task_id: int, **fields) -> Task | None:
+        """Edit fields (title, description, deadline, priority, completed) of a task by id."""
+        if self._defer_while_loading(partial(self.update_task, task_id, **fields)):
+            return None
+        task = self._tasks.get(task_id)
+        if task is None:
+            return None
+        unknown = set(fields) - {"title", "description", "deadline", "priority", "completed"}
+        if unknown:
+            raise ValueError(f"cannot update task fields: {', '.join(sorted(unknown))}")
+        changed = [name for name, value in fields.items() if getattr(task, name) != value]
+        if not changed:
+            return task
+        for name in changed:
+            setattr(task, name, fields[name])
+        self._index(task, changed)
+        self._persist("task_updated", task, tuple(changed))
+        self._notify(self.task_updated, task.id, changed)
+        return task
+
+    # --- search -------------------------------------------------------
+    def search_ids(self, query: str, typos: bool = True) -> set[int] | None:
+        """Ids of tasks whose title/description match every word of `query` (prefix
+        and typo-tolerant), or None when the query has no words."""
+        if self._search is None:
+            self._search = SearchIndex(self._tasks.values())
+        return self._search.search(query, typos)
+
+    def search_tasks(self, query: str, limit: Optional[int] = None,
+                     order_by: Optional[str] = None) -> list[Task]:
+        """Tasks matching `query`, in id order or sorted by `order_by`."""
+        ids = self.search_ids(query)
+        if ids is None:
+            return []
+        if order_by:
+            position = self._sorted_index(order_by).position
+            ordered = sorted(ids, key=position)
+        else:
+            ordered = sorted(ids)
+        return [self._tasks[i] for i in ordered[:limit]]
+
+    # --- sorted views -------------------------------------------------
+    def _sorted_index(self, order_by: str) -> SortedIndex:
+        if order_by not in SORT_KEYS:
+            raise ValueError(f"unknown order_by: {order_by!r} (expected one of {', '.join(SORT_KEYS)})")
+        return self._index_for(order_by)
+
+    def _index_for(self, name: str) -> SortedIndex:
+        """The INDEX_KEYS index `name`, built on first use."""
+        index = self._sorted.get(name)
+        if index is None:
+            index = self._sorted[name] = SortedIndex(INDEX_KEYS[name][0], self._tasks.values())
+        return index
+
+    def get_sorted_tasks(self, order_by: str, reverse: bool = False, limit: Optional[int] = None) -> list[Task]:
+        """Tasks ordered by 'deadline', 'priority' or 'created_at' (ties in id order)."""
+        return self.get_tasks(limit=limit, order_by=order_by, reverse=reverse)
+
+    def sort_position(self, order_by: str, task_id: int) -> int | None:
+        """Position of a task in get_sorted_tasks(order_by), in O(log n)."""
+        return self._sorted_index(order_by).position(task_id)
+
+    def due_soonest(self, n: int, include_completed: bool = False) -> list[Task]:
+        """The n tasks with the nearest deadlines (pending only by default), in O(log n + k)."""
+        if include_completed:
+            ids = self._index_for("deadline").range(hi=(1,))
+        else:
+            # pending, dated tasks are one slice of the (completed, deadline) index
+            ids = self._index_for("pending_deadline").range(lo=(0, 0), hi=(0, 1))
+        tasks = self._tasks
+        return [tasks[i] for i in islice(ids, n)]
+
+    def overdue(self, today: Optional[str] = None) -> list[Task]:
+        """Pending tasks whose deadline is before `today` (ISO date, default: today), soonest first."""
+        today = today or date.today().isoformat()
+        tasks = self._tasks
+        return [tasks[i] for i in self._index_for("pending_deadline").range(lo=(0, 0), hi=(0, 0, today))]
+
+    # --- positional API (kept for compatibility; O(n)) ----------------
     def remove_task_by_index(self, index: int) -> bool:
         """Remove task by list index (not id). Returns True if removed."""
-        try:
-            self._tasks.pop(index)
-            self._save()
-            self.tasks_changed.emit()
-            return True
-        except Exception:
-            return False
+        task = self.get_task(index)
+        return task is not None and self.remove_by_id(task.id)
 
     def toggle_task_completed(self, index: int) -> Task | None:
         """Toggle the 'completed' flag for Task at index."""
-        try:
-            task = self._tasks[index]
-            task.completed = not bool(task.completed)
-            self._save()
-            self.tasks_changed.emit()
-            return task
-        except Exception:
-            return None
+        task = self.get_task(index)
+        return self.toggle_by_id(task.id) if task is not None else None
 
     def get_task(self, index: int) -> Task | None:
+        """Return the Task at a list position (prefer get_task_by_id)."""
         try:
-            return self._tasks[index]
+            if index < 0:
+                index += len(self._tasks)
+            if index < 0:
+                return None
+            return next(islice(self._tasks.values(), index, None), None)
         except Exception:
             return None
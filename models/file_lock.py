@@ -0,0 +1,97 @@
+"""
+Advisory file locking for stores shared between processes.
+
+`file_lock(path)` holds a lock on `<path>.lock` (fcntl.flock on POSIX,
+msvcrt.locking on Windows) for the duration of a with-block. The lock is
+advisory: it only orders writers (and readers) that take it too, such as two
+UpaCube instances on the same tasks.json. Windows has no shared locks, so
+shared=True is exclusive there.
+
+The with-block gets the lock file's descriptor, so small shared state such as
+an id counter (see reserve_counter) can live in the lock file itself.
+"""
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _try_lock(fd: int, shared: bool) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path: str, shared: bool = False, timeout: Optional[float] = 10.0) -> Iterator[int]:
+    """Hold an advisory lock for `path`; raises TimeoutError after `timeout` seconds (None: wait forever).
+
+    Yields the descriptor of `<path>.lock`.
+    """
+    fd = os.open(path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.001
+        while not _try_lock(fd, shared):
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"could not lock {path} within {timeout}s")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        try:
+            yield fd
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+def reserve_counter(path: str, count: int, floor: int = 1) -> int:
+    """Take `count` consecutive values from a counter shared between processes.
+
+    The counter is kept as text in `<path>.lock`; the first value handed out
+    is at least `floor`. Returns the first value taken.
+    """
+    with file_lock(path) as fd:
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            stored = int(os.read(fd, 32) or 0)
+        except ValueError:
+            stored = 0
+        first = max(floor, stored)
+        text = b"%d\n" % (first + count)
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, text)
+        os.ftruncate(fd, len(text))
+    return first
+
+
+def file_signature(path: str) -> Optional[tuple]:
+    """(mtime_ns, size, inode) of a file, or None if it does not exist.
+
+    A write through a temp file and os.replace always changes the inode, so
+    two writes within the clock's resolution still differ.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
@@ -0,0 +1,54 @@
+"""
+Store watcher - notices when another process rewrites the task file.
+
+QFileSystemWatcher reports changes to the file and to its directory (an atomic
+replace swaps the file out from under a plain file watch, so the directory
+watch is what sees it come back). Notifications are debounced, and `changed`
+is only emitted when `is_external()` says the file is not what this process
+last read or wrote itself.
+"""
+import os
+from typing import Callable
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+
+class StoreWatcher(QObject):
+    changed = pyqtSignal()
+
+    def __init__(self, path: str, is_external: Callable[[], bool], debounce_ms: int = 200, parent=None):
+        super().__init__(parent)
+        self.path = os.path.abspath(path)
+        self._is_external = is_external
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._check)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_event)
+        self._watcher.directoryChanged.connect(self._on_event)
+        self._watcher.addPath(os.path.dirname(self.path))
+        self._watch_file()
+
+    def _watch_file(self) -> None:
+        if self.path not in self._watcher.files() and os.path.exists(self.path):
+            self._watcher.addPath(self.path)
+
+    def _on_event(self, _path: str) -> None:
+        # a save touches the directory several times (temp file, rename): wait for quiet
+        self._timer.start()
+
+    def _check(self) -> None:
+        self._watch_file()
+        try:
+            external = self._is_external()
+        except Exception:
+            external = False
+        if external:
+            self.changed.emit()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
@@ -0,0 +1,177 @@
+"""
+Undo history - commands that remember only how to reverse one change.
+
+Each command keeps the inverse of its action, not a copy of the task list:
+an add or a removal keeps one detached Task, a toggle keeps an id and a flag,
+and a clear keeps the container DataModel.clear_tasks() swapped out, which is
+never modified afterwards (so recording it copies nothing). The history is
+bounded by the estimated memory its commands keep alive rather than by a
+number of steps; the oldest commands are dropped first, and the most recent
+one is always kept.
+"""
+import sys
+from collections import deque
+from itertools import islice
+from typing import Optional
+
+from .task import Task
+
+
+def detached(task) -> Task:
+    """A plain Task copy (a columnar TaskStore hands out views onto its rows)."""
+    return Task(task.id, task.title, task.description, task.deadline, task.priority,
+                bool(task.completed), task.created_at)
+
+
+def task_bytes(task) -> int:
+    size = sys.getsizeof(task)
+    for value in (task.title, task.description, task.deadline, task.priority, task.created_at):
+        if value is not None:
+            size += sys.getsizeof(value)
+    return size
+
+
+def container_bytes(tasks, sample: int = 100) -> int:
+    """Estimated memory held by a task container (measured on a sample of tasks)."""
+    nbytes = getattr(tasks, "nbytes", None)
+    if nbytes is not None:
+        return nbytes()  # TaskStore knows its own size
+    n = len(tasks)
+    if not n:
+        return sys.getsizeof(tasks)
+    head = list(islice(tasks.values(), sample))
+    return sys.getsizeof(tasks) + n * sum(task_bytes(t) for t in head) // len(head)
+
+
+class Command:
+    """One undoable change; `nbytes` estimates the memory it keeps alive."""
+
+    label = ""
+    nbytes = 64
+
+    def undo(self, model) -> None:
+        raise NotImplementedError
+
+    def redo(self, model) -> None:
+        raise NotImplementedError
+
+
+class AddTask(Command):
+    def __init__(self, task):
+        self.task = detached(task)
+        self.label = f"add '{task.title}'"
+        self.nbytes = task_bytes(self.task)
+
+    def undo(self, model) -> None:
+        model.remove_by_id(self.task.id)
+
+    def redo(self, model) -> None:
+        model.restore_tasks([detached(self.task)])
+
+
+class ToggleTask(Command):
+    def __init__(self, task):
+        self.task_id = task.id
+        self.completed = bool(task.completed)   # state after the toggle
+        self.label = f"toggle '{task.title}'"
+
+    def _set(self, model, value: bool) -> None:
+        task = model.get_task_by_id(self.task_id)
+        if task is not None and bool(task.completed) != value:
+            model.toggle_by_id(self.task_id)
+
+    def undo(self, model) -> None:
+        self._set(model, not self.completed)
+
+    def redo(self, model) -> None:
+        self._set(model, self.completed)
+
+
+class RemoveTask(Command):
+    def __init__(self, task):
+        # taken before the removal: a TaskStore view is not valid afterwards
+        self.task = detached(task)
+        self.label = f"remove '{task.title}'"
+        self.nbytes = task_bytes(self.task)
+
+    def undo(self, model) -> None:
+        model.restore_tasks([detached(self.task)])
+
+    def redo(self, model) -> None:
+        model.remove_by_id(self.task.id)
+
+
+class ClearTasks(Command):
+    def __init__(self, previous):
+        self.previous = previous    # the container clear_tasks() returned
+        self.label = f"clear {len(previous)} tasks"
+        self.nbytes = container_bytes(previous)
+
+    def undo(self, model) -> None:
+        model.restore_cleared(self.previous)
+        # the container is the model's again; redo swaps out a fresh one
+        self.previous = None
+        self.nbytes = Command.nbytes
+
+    def redo(self, model) -> None:
+        self.previous = model.clear_tasks()
+        self.nbytes = container_bytes(self.previous) if self.previous is not None else Command.nbytes
+
+
+class UndoHistory:
+    """Undo/redo stacks of Commands, bounded by their estimated memory."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._undo: deque[Command] = deque()
+        self._redo: list[Command] = []
+        self._bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def push(self, command: Command) -> None:
+        """Record a change that has just been made; forgets everything redoable."""
+        self._bytes -= sum(c.nbytes for c in self._redo)
+        self._redo.clear()
+        self._undo.append(command)
+        self._bytes += command.nbytes
+        self._trim()
+
+    def _trim(self) -> None:
+        while self._bytes > self.max_bytes and len(self._undo) > 1:
+            self._bytes -= self._undo.popleft().nbytes
+
+    def undo(self, model) -> Optional[Command]:
+        if not self._undo:
+            return None
+        command = self._undo.pop()
+        # a command may keep more or less alive once it ran (ClearTasks)
+        before = command.nbytes
+        command.undo(model)
+        self._bytes += command.nbytes - before
+        self._redo.append(command)
+        return command
+
+    def redo(self, model) -> Optional[Command]:
+        if not self._redo:
+            return None
+        command = self._redo.pop()
+        before = command.nbytes
+        command.redo(model)
+        self._bytes += command.nbytes - before
+        self._undo.append(command)
+        self._trim()
+        return command
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
@@ -0,0 +1,307 @@
+"""
+Task Journal - append-only log of task mutations.
+
+Each mutation is appended as one JSON line next to the snapshot file, so the
+cost of persisting a change does not depend on how many tasks are stored.
+Records are idempotent (toggles store the resulting value, adds carry the
+full task), which lets a snapshot be replayed with a journal that partially
+overlaps it - this is what makes background compaction safe.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .storage import JsonStorage, TaskStorage
+from .task import Task
+
+
+logger = logging.getLogger(__name__)
+
+
+def apply_record(tasks: Dict[int, Task], record: Dict[str, Any]) -> None:
+    """Apply a single journal record to an id-keyed mapping of tasks in place."""
+    op = record.get("op")
+    if op == "add":
+        task = Task.from_dict(record.get("task", {}))
+        tasks[task.id] = task
+    elif op == "toggle":
+        task = tasks.get(record.get("id"))
+        if task is not None:
+            task.completed = bool(record.get("completed", False))
+    elif op == "update":
+        task = tasks.get(record.get("id"))
+        if task is not None:
+            for name, value in record.get("fields", {}).items():
+                if hasattr(task, name) and name != "id":
+                    setattr(task, name, value)
+    elif op == "remove":
+        tasks.pop(record.get("id"), None)
+    elif op == "clear":
+        tasks.clear()
+
+
+class TaskJournal:
+    """
+    Append-only journal stored at `<snapshot_path>.journal`.
+
+    When the journal grows past `compact_threshold` records it is rotated to
+    `<snapshot_path>.journal.compacting` and a background thread folds the
+    current tasks into a fresh snapshot, then discards the rotated file.
+    The snapshot is written with `write_snapshot` when given (the owning
+    storage's own write path), else straight to `snapshot_path`.
+    """
+
+    def __init__(self, snapshot_path: str, compact_threshold: int = 1000, durable: bool = False,
+                 write_snapshot: Optional[Callable[[List[Task]], None]] = None):
+        self.snapshot_path = snapshot_path
+        self.write_snapshot = write_snapshot
+        self.path = snapshot_path + ".journal"
+        self.compacting_path = self.path + ".compacting"
+        self.compact_threshold = compact_threshold
+        self.durable = durable
+        self._record_count = 0
+        self._file = None
+        self._compact_thread: threading.Thread | None = None
+
+    # --- reading -----------------------------------------------------
+    def _read(self, path: str) -> Iterator[Dict[str, Any]]:
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # a line torn by a crash: the records after it still count
+                    logger.warning("Ignoring corrupt journal record in %s", path)
+
+    def replay(self, tasks: List[Task]) -> None:
+        """Apply the rotated journal (if a compaction was interrupted) and the live journal."""
+        by_id = {t.id: t for t in tasks}
+        for record in self._read(self.compacting_path):
+            apply_record(by_id, record)
+        count = 0
+        for record in self._read(self.path):
+            apply_record(by_id, record)
+            count += 1
+        tasks[:] = by_id.values()
+        self._record_count = count
+
+    # --- writing -----------------------------------------------------
+    @staticmethod
+    def _repair_tail(path: str) -> None:
+        """Make `path` end with a newline before anything is appended to it.
+
+        A crash mid-append can leave an unterminated last line; appending to
+        it would glue the next record onto the fragment. A complete record
+        just gets its newline, a torn one is cut off.
+        """
+        try:
+            f = open(path, "rb+")
+        except FileNotFoundError:
+            return
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            start = end
+            tail = b""
+            while start > 0:
+                step = min(4096, start)
+                start -= step
+                f.seek(start)
+                tail = f.read(step) + tail
+                newline = tail.rfind(b"\n")
+                if newline >= 0:
+                    start += newline + 1
+                    tail = tail[newline + 1:]
+                    break
+            if not tail:
+                return
+            try:
+                json.loads(tail)
+            except ValueError:
+                logger.warning("Truncating a torn journal record at the end of %s", path)
+                f.truncate(start)
+            else:
+                f.seek(end)
+                f.write(b"\n")
+
+    def _open(self):
+        if self._file is None:
+            self._repair_tail(self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+        return self._file
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record and flush it to the OS."""
+        self.append_many([record])
+
+    def append_many(self, records: Sequence[Dict[str, Any]]) -> None:
+        """Append several records with a single write and flush."""
+        if not records:
+            return
+        f = self._open()
+        f.write("".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in records))
+        f.flush()
+        if self.durable:
+            os.fsync(f.fileno())
+        self._record_count += len(records)
+
+    @property
+    def record_count(self) -> int:
+        return self._record_count
+
+    def needs_compaction(self) -> bool:
+        return self._record_count >= self.compact_threshold and not self.is_compacting()
+
+    def is_compacting(self) -> bool:
+        return self._compact_thread is not None and self._compact_thread.is_alive()
+
+    # --- compaction --------------------------------------------------
+    def compact(self, tasks: Iterable[Task], background: bool = True) -> None:
+        """Fold the journal into a new snapshot of `tasks`.
+
+        The journal is rotated synchronously (cheap), so records appended
+        while the snapshot is being written land in a fresh journal.
+        """
+        if self.is_compacting():
+            return
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self.path):
+            if os.path.exists(self.compacting_path):
+                # leftover from an interrupted compaction: keep its records first
+                self._repair_tail(self.compacting_path)
+                with open(self.compacting_path, "a", encoding="utf-8") as dst, \
+                        open(self.path, "r", encoding="utf-8") as src:
+                    dst.write(src.read())
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self.compacting_path)
+        self._record_count = 0
+        # shallow copy is enough: records are idempotent, so a task mutated
+        # after this point is reconciled by the new journal on replay
+        snapshot = list(tasks)
+        if background:
+            self._compact_thread = threading.Thread(
+                target=self._write_snapshot, args=(snapshot,), name="journal-compaction", daemon=True
+            )
+            self._compact_thread.start()
+        else:
+            self._write_snapshot(snapshot)
+
+    def _write_snapshot(self, snapshot: List[Task]) -> None:
+        try:
+            if self.write_snapshot is not None:
+                self.write_snapshot(snapshot)
+            else:
+                tmp_path = self.snapshot_path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump([t.to_dict() for t in snapshot], f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.snapshot_path)
+            if os.path.exists(self.compacting_path):
+                os.remove(self.compacting_path)
+            logger.info("Compacted journal into %s (%d tasks)", self.snapshot_path, len(snapshot))
+        except Exception:
+            logger.exception("Journal compaction failed; journal kept for replay")
+
+    def reset(self) -> None:
+        """Drop all journal records (used after the snapshot was rewritten in full)."""
+        self.wait()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        for path in (self.path, self.compacting_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self._record_count = 0
+
+    def wait(self) -> None:
+        """Block until a running background compaction finishes."""
+        if self._compact_thread is not None:
+            self._compact_thread.join()
+            self._compact_thread = None
+
+    def close(self) -> None:
+        self.wait()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class JournalStorage(JsonStorage):
+    """JSON snapshot plus TaskJournal: constant-cost persistence per mutation."""
+
+    def __init__(self, path: str, compact_threshold: int = 1000, durable: bool = False):
+        super().__init__(path)
+        # compaction writes through _write: it takes the file lock and keeps
+        # signature/_base in step, so the next full save does not mistake the
+        # new snapshot for another process's write
+        self.journal = TaskJournal(path, compact_threshold, durable, write_snapshot=self._write)
+
+    def load(self) -> list[Task]:
+        tasks = super().load()
+        self.journal.replay(tasks)
+        return tasks
+
+    # journal records can touch any task, so the snapshot cannot be streamed
+    iter_load = TaskStorage.iter_load
+
+    def save_all(self, tasks: Iterable[Task]) -> None:
+        # a full snapshot supersedes every record logged so far
+        self.journal.wait()
+        super().save_all(tasks)
+        self.journal.reset()
+
+    def _append(self, records: Sequence[Dict[str, Any]], tasks: Iterable[Task]) -> None:
+        try:
+            self.journal.append_many(records)
+            if self.journal.needs_compaction():
+                self.journal.compact(tasks)
+        except OSError:
+            # journal unavailable (e.g. disk error): fall back to a full save
+            self.save_all(tasks)
+
+    @staticmethod
+    def _record(hook: str, args: tuple) -> Dict[str, Any]:
+        """Translate a TaskStorage hook call into a journal record."""
+        if hook == "task_added":
+            return {"op": "add", "task": args[0].to_dict()}
+        if hook == "task_updated":
+            task, fields = args
+            if list(fields) == ["completed"]:
+                return {"op": "toggle", "id": task.id, "completed": bool(task.completed)}
+            return {"op": "update", "id": task.id, "fields": {name: getattr(task, name) for name in fields}}
+        if hook == "task_removed":
+            return {"op": "remove", "id": args[0]}
+        if hook == "tasks_cleared":
+            return {"op": "clear"}
+        raise ValueError(f"Unknown storage hook: {hook}")
+
+    def task_added(self, task: Task, tasks: Iterable[Task]) -> None:
+        self._append([self._record("task_added", (task,))], tasks)
+
+    def task_updated(self, task: Task, fields: Sequence[str], tasks: Iterable[Task]) -> None:
+        self._append([self._record("task_updated", (task, fields))], tasks)
+
+    def task_removed(self, task_id: int, tasks: Iterable[Task]) -> None:
+        self._append([self._record("task_removed", (task_id,))], tasks)
+
+    def tasks_cleared(self, tasks: Iterable[Task]) -> None:
+        self._append([self._record("tasks_cleared", ())], tasks)
+
+    def apply_batch(self, ops: Sequence[Tuple[str, tuple]], tasks: Iterable[Task]) -> None:
+        self._append([self._record(hook, args) for hook, args in ops], tasks)
+
+    def compact(self, tasks: Iterable[Task], background: bool = False) -> None:
+        self.journal.compact(tasks, background=background)
+
+    def close(self) -> None:
+        self.journal.close()
@@ -0,0 +1,163 @@
+"""
+Search Index - incremental inverted index over task titles and descriptions.
+
+Text is split into casefolded word tokens and each token maps to the ids of
+the tasks containing it. The vocabulary is additionally kept sorted, for
+prefix lookups with bisect, and indexed by trigrams, for typo-tolerant
+lookups. A query therefore touches only the vocabulary and the matching
+postings, never the tasks themselves, and the index is updated per task on
+add/remove/edit instead of being rebuilt.
+"""
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Iterable, Optional
+
+
+_TOKEN = re.compile(r"\w+")
+# shortest query token that also matches with one typo, and with two
+_TYPO_MIN_LEN = 5
+_TWO_TYPOS_MIN_LEN = 9
+
+
+def tokenize(text) -> list[str]:
+    """Split text into casefolded word tokens."""
+    return _TOKEN.findall(str(text or "").casefold())
+
+
+def _trigrams(term: str) -> set[str]:
+    # pad the start so short prefixes still produce grams
+    padded = "  " + term
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def prefix_distance(query: str, term: str, limit: int) -> int:
+    """Smallest edit distance (with transpositions) between `query` and any prefix of `term`.
+
+    Returns limit + 1 as soon as the distance is known to exceed `limit`.
+    """
+    prev2 = None
+    prev = list(range(len(term) + 1))
+    for i, qc in enumerate(query, 1):
+        cur = [i] + [0] * len(term)
+        for j, tc in enumerate(term, 1):
+            cost = 0 if qc == tc else 1
+            d = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev2 is not None and j > 1 and qc == term[j - 2] and query[i - 2] == tc:
+                d = min(d, prev2[j - 2] + 1)
+            cur[j] = d
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return min(prev)
+
+
+class SearchIndex:
+    """
+    Inverted index: token -> task ids, with prefix and typo-tolerant lookups.
+
+    `search(query)` returns the ids of tasks in which every query word matches
+    some token, either as a prefix or (for longer words) within one or two
+    edits of a prefix.
+    """
+
+    def __init__(self, tasks: Iterable = ()):
+        self.clear()
+        for t in tasks:
+            self.add(t)
+
+    def clear(self) -> None:
+        self._postings: dict[str, set[int]] = {}
+        self._docs: dict[int, tuple[str, ...]] = {}
+        self._vocab: list[str] = []
+        self._grams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, task_id) -> bool:
+        return task_id in self._docs
+
+    # --- maintenance ---------------------------------------------------
+    def add(self, task) -> None:
+        """Index (or re-index) one task's title and description."""
+        task_id = task.id
+        if task_id in self._docs:
+            self.remove(task_id)
+        tokens = tuple(set(tokenize(f"{task.title or ''} {task.description or ''}")))
+        self._docs[task_id] = tokens
+        postings = self._postings
+        for token in tokens:
+            ids = postings.get(token)
+            if ids is None:
+                postings[token] = ids = set()
+                self._add_term(token)
+            ids.add(task_id)
+
+    def _add_term(self, token: str) -> None:
+        insort(self._vocab, token)
+        for gram in _trigrams(token):
+            self._grams.setdefault(gram, set()).add(token)
+
+    update = add
+
+    def remove(self, task_id: int) -> None:
+        for token in self._docs.pop(task_id, ()):
+            ids = self._postings[token]
+            ids.discard(task_id)
+            if not ids:
+                # last task using this word: drop it from the vocabulary
+                del self._postings[token]
+                del self._vocab[bisect_left(self._vocab, token)]
+                for gram in _trigrams(token):
+                    terms = self._grams[gram]
+                    terms.discard(token)
+                    if not terms:
+                        del self._grams[gram]
+
+    # --- queries -------------------------------------------------------
+    def _prefix_terms(self, word: str) -> list[str]:
+        vocab = self._vocab
+        start = bisect_left(vocab, word)
+        end = start
+        while end < len(vocab) and vocab[end].startswith(word):
+            end += 1
+        return vocab[start:end]
+
+    def _fuzzy_terms(self, word: str) -> list[str]:
+        limit = 2 if len(word) >= _TWO_TYPOS_MIN_LEN else 1
+        grams = _trigrams(word)
+        counts = Counter()
+        for gram in grams:
+            counts.update(self._grams.get(gram, ()))
+        # a prefix within `limit` edits shares at least this many trigrams (q-gram lemma)
+        needed = max(1, len(word) - 3 * limit)
+        width = len(word) + limit
+        return [term for term, shared in counts.items()
+                if shared >= needed and prefix_distance(word, term[:width], limit) <= limit]
+
+    def matching_ids(self, word: str, typos: bool = True) -> set[int]:
+        """Ids of tasks with a token matching one query word."""
+        terms = self._prefix_terms(word)
+        if typos and len(word) >= _TYPO_MIN_LEN:
+            terms = set(terms).union(self._fuzzy_terms(word))
+        if len(terms) == 1:
+            return set(self._postings[next(iter(terms))])
+        ids: set[int] = set()
+        for term in terms:
+            ids |= self._postings[term]
+        return ids
+
+    def search(self, query: str, typos: bool = True) -> Optional[set[int]]:
+        """Ids of tasks matching every word of `query`, or None for an empty query."""
+        words = tokenize(query)
+        if not words:
+            return None
+        result: set[int] | None = None
+        # longest words first: they are usually the most selective
+        for word in sorted(set(words), key=len, reverse=True):
+            ids = self.matching_ids(word, typos)
+            result = ids if result is None else result & ids
+            if not result:
+                break
+        return result
@@ -0,0 +1,113 @@
+"""
+Sorted Index - secondary orderings of tasks maintained with bisect.
+
+Each index keeps a list of (key, task id) entries in sorted order. Adding,
+removing or re-keying one task is a binary search plus one list insert or
+delete, so an ordering by deadline, priority or creation time never has to be
+recomputed from scratch, and range queries ("due before X", "first N") cost
+O(log n + k).
+"""
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+_PRIORITY_RANK = {"high": 0, "normal": 1, "low": 2}
+
+
+def deadline_key(task) -> tuple:
+    # tasks without a deadline sort after all dated ones
+    deadline = task.deadline
+    return (0, str(deadline)) if deadline else (1, "")
+
+
+def priority_key(task) -> tuple:
+    # High, Normal, Low, then any custom priority
+    return (_PRIORITY_RANK.get(str(task.priority or "Normal").lower(), 3),)
+
+
+def created_key(task) -> tuple:
+    created = task.created_at
+    return (0, str(created)) if created else (1, "")
+
+
+def pending_deadline_key(task) -> tuple:
+    # pending tasks first, so "pending and due before X" is a single range
+    return (1 if task.completed else 0,) + deadline_key(task)
+
+
+# order_by name -> (key function, task fields the key depends on)
+SORT_KEYS: dict[str, tuple[Callable[[Any], tuple], tuple[str, ...]]] = {
+    "deadline": (deadline_key, ("deadline",)),
+    "priority": (priority_key, ("priority",)),
+    "created_at": (created_key, ("created_at",)),
+}
+
+# every index DataModel can keep: the orderings above plus ones that only
+# back its own queries (due_soonest, overdue) and are not order_by values
+INDEX_KEYS: dict[str, tuple[Callable[[Any], tuple], tuple[str, ...]]] = {
+    **SORT_KEYS,
+    "pending_deadline": (pending_deadline_key, ("deadline", "completed")),
+}
+
+
+class SortedIndex:
+    """Task ids ordered by `key(task)`, ties broken by id."""
+
+    def __init__(self, key: Callable[[Any], tuple], tasks: Iterable = ()):
+        self.key = key
+        self._keys: dict[int, tuple] = {t.id: key(t) for t in tasks}
+        self._entries: list[tuple[tuple, int]] = sorted((k, tid) for tid, k in self._keys.items())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[int]:
+        return (tid for _, tid in self._entries)
+
+    def __reversed__(self) -> Iterator[int]:
+        return (tid for _, tid in reversed(self._entries))
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._entries.clear()
+
+    def add(self, task) -> None:
+        """Insert a task, or move it if its key changed."""
+        key = self.key(task)
+        old = self._keys.get(task.id)
+        if old == key:
+            return
+        if old is not None:
+            self.remove(task.id)
+        self._keys[task.id] = key
+        insort(self._entries, (key, task.id))
+
+    update = add
+
+    def remove(self, task_id: int) -> None:
+        key = self._keys.pop(task_id, None)
+        if key is None:
+            return
+        i = bisect_left(self._entries, (key, task_id))
+        del self._entries[i]
+
+    def position(self, task_id: int) -> Optional[int]:
+        """Rank of a task in this ordering, or None if it is not indexed."""
+        key = self._keys.get(task_id)
+        if key is None:
+            return None
+        return bisect_left(self._entries, (key, task_id))
+
+    def ids(self, start: int = 0, stop: Optional[int] = None, reverse: bool = False) -> Iterator[int]:
+        """Task ids at ranks start..stop (in descending order if reverse)."""
+        entries = reversed(self._entries) if reverse else iter(self._entries)
+        return (tid for _, tid in islice(entries, start, stop))
+
+    def range(self, lo: Optional[tuple] = None, hi: Optional[tuple] = None) -> Iterator[int]:
+        """Task ids whose key k satisfies lo <= k < hi, in order."""
+        entries = self._entries
+        start = 0 if lo is None else bisect_left(entries, (lo,))
+        stop = len(entries) if hi is None else bisect_left(entries, (hi,))
+        return (entries[i][1] for i in range(start, stop))
+
@@ -0,0 +1,213 @@
+"""
+SQLite Storage - single-row persistence and indexed queries via stdlib sqlite3.
+
+Every mutation touches only the affected row, and `query`/`count` are answered
+by SQL using the indexes on completed/priority/deadline/created_at, so filtered
+reads never have to walk the whole collection in Python.
+
+The storage is used from several threads (a LoadWorker reads, a write-behind
+thread may save, the GUI queries): iter_load reads through a connection of
+its own, and every other use of the shared connection holds a lock.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+from .storage import TaskStorage
+from .task import Task
+
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = ("id", "title", "description", "deadline", "priority", "completed", "created_at")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    deadline TEXT,
+    priority TEXT NOT NULL DEFAULT 'Normal',
+    completed INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_position ON tasks(position);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks(completed, position);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority);
+CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks(deadline);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _row_to_task(row) -> Task:
+    return Task(
+        id=row[0],
+        title=row[1],
+        description=row[2] or "",
+        deadline=row[3],
+        priority=row[4] or "Normal",
+        completed=bool(row[5]),
+        created_at=row[6],
+    )
+
+
+class SQLiteStorage(TaskStorage):
+    """
+    Tasks stored in a SQLite database; `position` preserves display order.
+
+    If `migrate_from` names an existing tasks.json and the database has never
+    been populated, its contents are imported once on open.
+    """
+
+    def __init__(self, path: str, migrate_from: Optional[str] = None):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._next_position = self._conn.execute(
+            "SELECT COALESCE(MAX(position), 0) + 1 FROM tasks").fetchone()[0]
+        if migrate_from:
+            self.migrate_from_json(migrate_from)
+
+    # --- migration ---------------------------------------------------
+    def migrate_from_json(self, json_path: str, force: bool = False) -> int:
+        """Import tasks from a JSON snapshot once; returns the number of imported tasks."""
+        done = self._conn.execute("SELECT value FROM meta WHERE key = 'migrated_from'").fetchone()
+        if (done and not force) or not os.path.exists(json_path):
+            return 0
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        tasks = [Task.from_dict(d) for d in data] if isinstance(data, list) else []
+        with self._lock, self._conn:
+            self._insert(tasks)
+            self._conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES ('migrated_from', ?)",
+                               (os.path.abspath(json_path),))
+        logger.info("Migrated %d tasks from %s into %s", len(tasks), json_path, self.path)
+        return len(tasks)
+
+    # --- TaskStorage -------------------------------------------------
+    def load(self) -> list[Task]:
+        with self._lock:
+            cur = self._conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM tasks ORDER BY position")
+            return [_row_to_task(row) for row in cur]
+
+    def iter_load(self, chunk_size: int = 1000) -> Iterator[Tuple[list[Task], float]]:
+        if self.path == ":memory:":
+            # an in-memory database cannot be opened twice
+            yield from super().iter_load(chunk_size)
+            return
+        # a connection of its own: the chunks are read on a worker thread
+        # while the GUI thread keeps using the shared one (WAL lets both run)
+        conn = sqlite3.connect(self.path)
+        try:
+            total = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+            cur = conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM tasks ORDER BY position")
+            done = 0
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows:
+                    return
+                done += len(rows)
+                yield [_row_to_task(row) for row in rows], done / total if total else 1.0
+        finally:
+            conn.close()
+
+    def save_all(self, tasks: Iterable[Task]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks")
+            self._next_position = 1
+            self._insert(tasks)
+
+    def _insert(self, tasks: Iterable[Task]) -> None:
+        rows = []
+        for t in tasks:
+            rows.append((t.id, self._next_position, t.title, t.description, t.deadline,
+                         t.priority, int(bool(t.completed)), t.created_at))
+            self._next_position += 1
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO tasks(id, position, title, description, deadline, priority, completed, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def task_added(self, task: Task, tasks: Iterable[Task]) -> None:
+        with self._lock, self._conn:
+            self._insert([task])
+
+    def task_updated(self, task: Task, fields: Sequence[str], tasks: Iterable[Task]) -> None:
+        with self._lock, self._conn:
+            self._update(task, fields)
+
+    def task_removed(self, task_id: int, tasks: Iterable[Task]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+    def tasks_cleared(self, tasks: Iterable[Task]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks")
+
+    def apply_batch(self, ops: Sequence[Tuple[str, tuple]], tasks: Iterable[Task]) -> None:
+        # one transaction for the whole batch
+        with self._lock, self._conn:
+            for hook, args in ops:
+                if hook == "task_added":
+                    self._insert([args[0]])
+                elif hook == "task_updated":
+                    self._update(*args)
+                elif hook == "task_removed":
+                    self._conn.execute("DELETE FROM tasks WHERE id = ?", (args[0],))
+                elif hook == "tasks_cleared":
+                    self._conn.execute("DELETE FROM tasks")
+
+    def _update(self, task: Task, fields: Sequence[str]) -> None:
+        names = [f for f in fields if f in _COLUMNS and f != "id"]
+        if not names:
+            return
+        values = [int(bool(task.completed)) if f == "completed" else getattr(task, f) for f in names]
+        self._conn.execute(
+            f"UPDATE tasks SET {', '.join(f'{f} = ?' for f in names)} WHERE id = ?", (*values, task.id))
+
+    def query(self, tasks: Iterable[Task], completed: Optional[bool] = None, priority: Optional[str] = None,
+              deadline_before: Optional[str] = None, limit: Optional[int] = None) -> list[Task]:
+        """Answer from the database; returned tasks are detached read-only copies."""
+        where, params = self._where(completed, priority, deadline_before)
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM tasks{where} ORDER BY position"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            return [_row_to_task(row) for row in self._conn.execute(sql, params)]
+
+    def count(self, tasks: Iterable[Task], completed: Optional[bool] = None) -> int:
+        where, params = self._where(completed, None, None)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM tasks{where}", params).fetchone()[0]
+
+    @staticmethod
+    def _where(completed, priority, deadline_before):
+        clauses, params = [], []
+        if completed is not None:
+            clauses.append("completed = ?")
+            params.append(int(bool(completed)))
+        if priority is not None:
+            clauses.append("priority = ?")
+            params.append(priority)
+        if deadline_before is not None:
+            clauses.append("deadline < ?")
+            params.append(deadline_before)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def close(self) -> None:
+        try:
+            with self._lock:
+                self._conn.close()
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,247 @@
+"""
+Task Storage - pluggable persistence backends for DataModel.
+
+DataModel keeps tasks in memory and reports every mutation to a TaskStorage.
+Backends that can only rewrite everything (plain JSON) inherit the default
+hooks, which fall back to save_all(); incremental backends (journal, SQLite)
+override the hooks to persist just the affected record.
+
+JsonStorage takes an advisory lock (models.file_lock) around every read and
+write of its file, so several processes sharing one tasks.json never see or
+produce a half-written snapshot, and remembers the file's signature so
+changes made by someone else can be told apart from its own writes. A write
+that finds the file changed merges it by id under the same lock instead of
+overwriting it, and new ids come from a counter shared through
+`<path>.ids.lock`, so two processes never hand out the same id.
+"""
+import json
+import logging
+import os
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+from .file_lock import file_lock, file_signature, reserve_counter
+from .streaming import iter_json_array
+from .task import Task
+
+
+logger = logging.getLogger(__name__)
+
+
+def _fingerprint(task) -> int:
+    """Hash of a task's fields, to tell whether it changed since the last read or write."""
+    return hash((task.title, task.description, task.deadline, task.priority,
+                 bool(task.completed), task.created_at))
+
+
+class TaskStorage:
+    """
+    Base persistence interface.
+
+    `tasks` arguments are the model's current, ordered collection of tasks;
+    backends must not keep references to them beyond the call.
+    """
+
+    def load(self) -> list[Task]:
+        """Return all stored tasks in display order."""
+        raise NotImplementedError
+
+    def save_all(self, tasks: Iterable[Task]) -> None:
+        """Persist the complete task collection, replacing stored contents."""
+        raise NotImplementedError
+
+    def iter_load(self, chunk_size: int = 1000) -> Iterator[Tuple[list[Task], float]]:
+        """Yield (tasks, progress) chunks in display order; progress goes from 0 to 1.
+
+        The default loads everything first; streaming backends override it so
+        memory stays bounded by the chunk size.
+        """
+        tasks = self.load()
+        total = len(tasks)
+        for start in range(0, total, chunk_size):
+            yield tasks[start:start + chunk_size], min(1.0, (start + chunk_size) / total)
+
+    # --- mutation hooks (default: full rewrite) ----------------------
+    def task_added(self, task: Task, tasks: Iterable[Task]) -> None:
+        self.save_all(tasks)
+
+    def task_updated(self, task: Task, fields: Sequence[str], tasks: Iterable[Task]) -> None:
+        self.save_all(tasks)
+
+    def task_removed(self, task_id: int, tasks: Iterable[Task]) -> None:
+        self.save_all(tasks)
+
+    def tasks_cleared(self, tasks: Iterable[Task]) -> None:
+        self.save_all(tasks)
+
+    def apply_batch(self, ops: Sequence[Tuple[str, tuple]], tasks: Iterable[Task]) -> None:
+        """Persist several hook calls, given as (hook name, args) pairs, at once.
+
+        Task arguments reflect their state at the end of the batch.
+        """
+        self.save_all(tasks)
+
+    # --- queries (default: filter in memory) -------------------------
+    def query(self, tasks: Iterable[Task], completed: Optional[bool] = None, priority: Optional[str] = None,
+              deadline_before: Optional[str] = None, limit: Optional[int] = None) -> list[Task]:
+        """Return tasks matching all given filters, in display order."""
+        result = []
+        for t in tasks:
+            if completed is not None and bool(t.completed) != completed:
+                continue
+            if priority is not None and t.priority != priority:
+                continue
+            if deadline_before is not None and not (t.deadline and t.deadline < deadline_before):
+                continue
+            result.append(t)
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+    def count(self, tasks: Iterable[Task], completed: Optional[bool] = None) -> int:
+        if completed is None:
+            return sum(1 for _ in tasks)
+        return sum(1 for t in tasks if bool(t.completed) == completed)
+
+    def reserve_ids(self, count: int, floor: int) -> int:
+        """Return the first of `count` new consecutive ids, at least `floor`.
+
+        Single-process backends just hand out `floor`; shared ones reserve
+        the ids so that no other process uses them.
+        """
+        return floor
+
+    # --- lifecycle ---------------------------------------------------
+    def flush(self) -> None:
+        """Block until every reported mutation has reached disk (no-op when writes are synchronous)."""
+
+    def compact(self, tasks: Iterable[Task], background: bool = False) -> None:
+        """Reclaim space used by incremental writes (no-op by default)."""
+
+    def close(self) -> None:
+        """Flush pending work and release resources."""
+
+
+class JsonStorage(TaskStorage):
+    """Default backend: the whole collection as a JSON list of dicts."""
+
+    def __init__(self, path: str):
+        self.path = path
+        # signature of the file as last read or written by this object
+        # (None after a merge wrote tasks the caller does not have yet)
+        self.signature: Optional[tuple] = None
+        # id -> _fingerprint of the tasks as last read or written; a write
+        # compares against it to tell our changes from someone else's
+        self._base: Optional[dict[int, int]] = None
+
+    def changed_on_disk(self) -> bool:
+        """True if the file differs from what this storage last read or wrote."""
+        return file_signature(self.path) != self.signature
+
+    def load(self) -> list[Task]:
+        if not os.path.exists(self.path):
+            # ensure file exists
+            self._write([])
+            return []
+        with file_lock(self.path, shared=True):
+            tasks = self._read()
+            self._base = {t.id: _fingerprint(t) for t in tasks}
+            self.signature = file_signature(self.path)
+        return tasks
+
+    def _read(self) -> list[Task]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            return []
+        return [Task.from_dict(d) for d in data]
+
+    def iter_load(self, chunk_size: int = 1000) -> Iterator[Tuple[list[Task], float]]:
+        if not os.path.exists(self.path):
+            self._write([])
+            return
+        # no lock across the yields: writers replace the file atomically, so
+        # the one opened here stays a complete snapshot while it is read
+        signature = file_signature(self.path)
+        base = {}
+        chunk = []
+        progress = 0.0
+        for d, done, total in iter_json_array(self.path):
+            if isinstance(d, dict):
+                task = Task.from_dict(d)
+                base[task.id] = _fingerprint(task)
+                chunk.append(task)
+            progress = done / total if total else 1.0
+            if len(chunk) >= chunk_size:
+                yield chunk, progress
+                chunk = []
+        self._base, self.signature = base, signature
+        if chunk:
+            yield chunk, 1.0
+
+    def save_all(self, tasks: Iterable[Task]) -> None:
+        self._write(tasks)
+
+    def reserve_ids(self, count: int, floor: int) -> int:
+        return reserve_counter(self.path + ".ids", count, floor)
+
+    def _write(self, tasks: Iterable[Task]) -> None:
+        # write a temp file and rename it over the snapshot, so a crash
+        # mid-write never leaves a truncated tasks.json behind
+        data = []
+        ours = {}
+        for t in tasks:
+            data.append(t.to_dict())
+            ours[t.id] = _fingerprint(t)
+        tmp_path = self.path + ".tmp"
+        with file_lock(self.path):
+            foreign = False
+            if self._base is not None and self.changed_on_disk():
+                data, foreign = self._merge(data, ours)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._base = ours
+            # the file now holds tasks the caller has not seen: keep reporting
+            # it as changed, so the next write merges again and a watcher reloads
+            self.signature = None if foreign else file_signature(self.path)
+
+    def _merge(self, data: list[dict], ours: dict[int, int]) -> tuple[list[dict], bool]:
+        """Fold someone else's writes into `data` (called with the lock held).
+
+        Tasks added, changed or removed here since the last read or write win;
+        for every other task the file's version wins, and tasks only the file
+        has are appended. Returns the merged list and whether it holds
+        anything `data` did not.
+        """
+        try:
+            disk = self._read() if os.path.exists(self.path) else []
+        except (OSError, ValueError):
+            logger.exception("Could not read %s to merge; overwriting it", self.path)
+            return data, False
+        base = self._base
+        theirs = {t.id: t for t in disk}
+        merged = []
+        foreign = False
+        for d in data:
+            task_id = d["id"]
+            if base.get(task_id) != ours[task_id]:
+                if task_id not in base and task_id in theirs:
+                    logger.warning("Task id %d was added by two writers; keeping ours", task_id)
+                merged.append(d)            # added or changed here
+                continue
+            other = theirs.get(task_id)
+            if other is None:
+                foreign = True              # removed elsewhere
+                continue
+            if _fingerprint(other) != ours[task_id]:
+                foreign = True
+                d = other.to_dict()         # changed elsewhere
+            merged.append(d)
+        for t in disk:
+            if t.id not in ours and t.id not in base:
+                foreign = True
+                merged.append(t.to_dict())  # added elsewhere
+        logger.info("Merged changes another process made to %s", self.path)
+        return merged, foreign
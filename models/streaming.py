@@ -0,0 +1,74 @@
+"""
+Streaming JSON reader - parses a top-level JSON array one element at a time.
+
+Only a small read buffer and the element being decoded are held in memory,
+so reading a huge tasks.json never needs the whole file text or the whole
+parsed list at once.
+"""
+import codecs
+import json
+import os
+from typing import Any, Iterator, Tuple
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(path: str, read_size: int = 64 * 1024) -> Iterator[Tuple[Any, int, int]]:
+    """Yield (element, bytes_read, total_bytes) for each element of the JSON array in `path`.
+
+    Raises ValueError if the file is not a JSON array.
+    """
+    total = os.path.getsize(path)
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    with open(path, "rb") as f:
+        buf = ""
+        pos = 0
+        bytes_read = 0
+        eof = False
+        started = False
+
+        def fill() -> bool:
+            nonlocal buf, pos, bytes_read, eof
+            raw = f.read(read_size)
+            bytes_read += len(raw)
+            if not raw:
+                eof = True
+                buf = buf[pos:] + text_decoder.decode(b"", final=True)
+            else:
+                buf = buf[pos:] + text_decoder.decode(raw)
+            pos = 0
+            return not eof
+
+        while True:
+            # skip whitespace (and separators once inside the array)
+            while True:
+                while pos < len(buf) and (buf[pos] in _WHITESPACE or (started and buf[pos] == ",")):
+                    pos += 1
+                if pos < len(buf) or not fill():
+                    break
+            if pos >= len(buf):
+                if not started:
+                    # empty file: treat like an empty list
+                    return
+                raise ValueError("unterminated JSON array")
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError("expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == "]":
+                return
+            # decode the next element, reading more until it is complete
+            while True:
+                try:
+                    value, end = _decoder.raw_decode(buf, pos)
+                    break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    fill()
+            pos = end
+            yield value, bytes_read, total
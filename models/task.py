@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: int
     title: str
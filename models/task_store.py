@@ -0,0 +1,306 @@
+"""
+Task Store - compact struct-of-arrays storage for very large task collections.
+
+Numeric and flag fields live in `array`-module buffers (ids, completed bitmap,
+priority codes, deadline ordinals, created_at as epoch microseconds) and
+strings are interned, so a task costs a few dozen bytes instead of a full
+Python object with its own dict. DataModel(columnar=True) uses a TaskStore in
+place of its id -> Task dict and hands out StoredTask views, which read and
+write the arrays but otherwise behave like Task.
+"""
+import sys
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .task import Task
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+# sentinels in the numeric columns
+_NO_DEADLINE = -1
+_RAW_DEADLINE = -2          # not an ISO date: original string kept in a side table
+_NO_CREATED = -(2 ** 63)
+_RAW_CREATED = -(2 ** 63) + 1
+
+_FIELDS = ("id", "title", "description", "deadline", "priority", "completed", "created_at")
+
+
+def _intern(s: Optional[str]) -> str:
+    return sys.intern(s) if s else ""
+
+
+class StoredTask:
+    """A Task-compatible view of one row of a TaskStore, looked up by id."""
+
+    __slots__ = ("_store", "id")
+
+    def __init__(self, store: "TaskStore", task_id: int):
+        self._store = store
+        self.id = task_id
+
+    def _get(name):
+        return property(lambda self: self._store.get_field(self.id, name),
+                        lambda self, value: self._store.set_field(self.id, name, value))
+
+    title = _get("title")
+    description = _get("description")
+    deadline = _get("deadline")
+    priority = _get("priority")
+    completed = _get("completed")
+    created_at = _get("created_at")
+    del _get
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._store.row_dict(self.id)
+
+    def to_task(self) -> Task:
+        """Return a detached Task with the current values."""
+        return Task.from_dict(self.to_dict())
+
+    def __eq__(self, other):
+        if isinstance(other, (StoredTask, Task)):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"StoredTask({self.to_dict()!r})"
+
+
+class TaskStore:
+    """
+    Ordered id -> task mapping backed by columnar arrays.
+
+    Supports the dict operations DataModel relies on (get, [], in, len, pop,
+    clear, iteration over ids and values()). Removed rows are tombstoned and
+    the columns are compacted once more than half of them are dead.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self.clear()
+        for t in tasks:
+            self[t.id] = t
+
+    # --- mapping interface -------------------------------------------
+    def clear(self) -> None:
+        self._ids = array("q")
+        self._completed = bytearray()
+        self._priority = array("B")
+        self._deadline = array("i")
+        self._created = array("q")
+        self._titles: list[str] = []
+        self._descriptions: list[str] = []
+        # id -> row; insertion-ordered, so it also defines the display order
+        self._rows: dict[int, int] = {}
+        self._raw_deadlines: dict[int, str] = {}
+        self._raw_created: dict[int, str] = {}
+        self._priority_names: list[str] = ["Low", "Normal", "High"]
+        self._priority_codes: dict[str, int] = {n: i for i, n in enumerate(self._priority_names)}
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, task_id) -> bool:
+        return task_id in self._rows
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._rows)
+
+    def __getitem__(self, task_id: int) -> StoredTask:
+        if task_id not in self._rows:
+            raise KeyError(task_id)
+        return StoredTask(self, task_id)
+
+    def get(self, task_id: int, default=None):
+        return StoredTask(self, task_id) if task_id in self._rows else default
+
+    def values(self) -> "_Values":
+        return _Values(self)
+
+    def __setitem__(self, task_id: int, task) -> None:
+        row = self._rows.get(task_id)
+        if row is None:
+            row = len(self._ids)
+            self._ids.append(task_id)
+            self._completed.append(0)
+            self._priority.append(0)
+            self._deadline.append(_NO_DEADLINE)
+            self._created.append(_NO_CREATED)
+            self._titles.append("")
+            self._descriptions.append("")
+            self._rows[task_id] = row
+        for name in _FIELDS[1:]:
+            self._set(row, name, getattr(task, name))
+
+    def pop(self, task_id: int, *default):
+        row = self._rows.get(task_id)
+        if row is None:
+            if default:
+                return default[0]
+            raise KeyError(task_id)
+        task = Task.from_dict(self.row_dict(task_id))
+        del self._rows[task_id]
+        # tombstone: release the strings, keep the slot until compaction
+        self._titles[row] = ""
+        self._descriptions[row] = ""
+        self._raw_deadlines.pop(row, None)
+        self._raw_created.pop(row, None)
+        self._dead += 1
+        if self._dead > 1024 and self._dead * 2 > len(self._ids):
+            self._compact()
+        return task
+
+    # --- field access --------------------------------------------------
+    def get_field(self, task_id: int, name: str):
+        row = self._rows[task_id]
+        if name == "title":
+            return self._titles[row]
+        if name == "description":
+            return self._descriptions[row]
+        if name == "completed":
+            return bool(self._completed[row])
+        if name == "priority":
+            return self._priority_names[self._priority[row]]
+        if name == "deadline":
+            o = self._deadline[row]
+            if o == _NO_DEADLINE:
+                return None
+            if o == _RAW_DEADLINE:
+                return self._raw_deadlines[row]
+            return date.fromordinal(o).isoformat()
+        if name == "created_at":
+            us = self._created[row]
+            if us == _NO_CREATED:
+                return None
+            if us == _RAW_CREATED:
+                return self._raw_created[row]
+            return (_EPOCH + us * _ONE_US).isoformat()
+        if name == "id":
+            return task_id
+        raise AttributeError(name)
+
+    def set_field(self, task_id: int, name: str, value) -> None:
+        if name == "id":
+            raise AttributeError("task ids are immutable in a TaskStore")
+        self._set(self._rows[task_id], name, value)
+
+    def row_dict(self, task_id: int) -> Dict[str, Any]:
+        return {name: self.get_field(task_id, name) for name in _FIELDS}
+
+    def _set(self, row: int, name: str, value) -> None:
+        if name == "title":
+            self._titles[row] = _intern(str(value or ""))
+        elif name == "description":
+            self._descriptions[row] = _intern(str(value or ""))
+        elif name == "completed":
+            self._completed[row] = 1 if value else 0
+        elif name == "priority":
+            self._priority[row] = self._priority_code(str(value or "Normal"))
+        elif name == "deadline":
+            self._raw_deadlines.pop(row, None)
+            self._deadline[row] = self._encode_deadline(row, value)
+        elif name == "created_at":
+            self._raw_created.pop(row, None)
+            self._created[row] = self._encode_created(row, value)
+        else:
+            raise AttributeError(name)
+
+    def _priority_code(self, name: str) -> int:
+        code = self._priority_codes.get(name)
+        if code is None:
+            if len(self._priority_names) >= 255:
+                raise ValueError("too many distinct priorities for a TaskStore")
+            code = len(self._priority_names)
+            self._priority_names.append(sys.intern(name))
+            self._priority_codes[name] = code
+        return code
+
+    def _encode_deadline(self, row: int, value) -> int:
+        if value is None:
+            return _NO_DEADLINE
+        try:
+            d = date.fromisoformat(value)
+            if d.isoformat() == value:
+                return d.toordinal()
+        except (TypeError, ValueError):
+            pass
+        self._raw_deadlines[row] = value
+        return _RAW_DEADLINE
+
+    def _encode_created(self, row: int, value) -> int:
+        if value is None:
+            return _NO_CREATED
+        try:
+            dt = datetime.fromisoformat(value)
+            if dt.tzinfo is not None:
+                us = (dt - _EPOCH) // _ONE_US
+                # only store compactly if the string round-trips exactly
+                if (_EPOCH + us * _ONE_US).isoformat() == value:
+                    return us
+        except (TypeError, ValueError, OverflowError):
+            pass
+        self._raw_created[row] = value
+        return _RAW_CREATED
+
+    # --- maintenance ---------------------------------------------------
+    def _compact(self) -> None:
+        """Drop tombstoned rows from every column."""
+        old = (self._ids, self._completed, self._priority, self._deadline, self._created,
+               self._titles, self._descriptions, self._raw_deadlines, self._raw_created)
+        ids, completed, priority, deadline, created, titles, descriptions, raw_deadlines, raw_created = old
+        self._ids = array("q")
+        self._completed = bytearray()
+        self._priority = array("B")
+        self._deadline = array("i")
+        self._created = array("q")
+        self._titles, self._descriptions = [], []
+        self._raw_deadlines, self._raw_created = {}, {}
+        for new_row, (task_id, row) in enumerate(self._rows.items()):
+            self._ids.append(task_id)
+            self._completed.append(completed[row])
+            self._priority.append(priority[row])
+            self._deadline.append(deadline[row])
+            self._created.append(created[row])
+            self._titles.append(titles[row])
+            self._descriptions.append(descriptions[row])
+            if row in raw_deadlines:
+                self._raw_deadlines[new_row] = raw_deadlines[row]
+            if row in raw_created:
+                self._raw_created[new_row] = raw_created[row]
+            self._rows[task_id] = new_row
+        self._dead = 0
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns (excluding shared string data)."""
+        return (self._ids.itemsize * len(self._ids) + len(self._completed)
+                + self._priority.itemsize * len(self._priority)
+                + self._deadline.itemsize * len(self._deadline)
+                + self._created.itemsize * len(self._created)
+                + sys.getsizeof(self._titles) + sys.getsizeof(self._descriptions)
+                + sys.getsizeof(self._rows))
+
+
+class _Values:
+    """Re-iterable values() view yielding StoredTask objects in order."""
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: TaskStore):
+        self._store = store
+
+    def __iter__(self) -> Iterator[StoredTask]:
+        store = self._store
+        # iterate over a copy of the keys so concurrent writers cannot break iteration
+        return (StoredTask(store, tid) for tid in list(store._rows))
+
+    def __reversed__(self) -> Iterator[StoredTask]:
+        store = self._store
+        return (StoredTask(store, tid) for tid in reversed(list(store._rows)))
+
+    def __len__(self) -> int:
+        return len(self._store)
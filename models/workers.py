@@ -0,0 +1,70 @@
+"""
+Workers - QThreadPool runnables that keep storage reads off the GUI thread.
+(Writes already run off it through models.write_behind.)
+
+Results are reported through signals of a QObject created on the GUI thread,
+so Qt queues them onto the event loop and the receiving slots always run on
+the GUI thread; the runnable itself never touches the model.
+"""
+import logging
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+logger = logging.getLogger(__name__)
+
+
+class LoadSignals(QObject):
+    chunk_loaded = pyqtSignal(list, float)  # Tasks, fraction loaded 0..1
+    failed = pyqtSignal(str)                # error message
+    finished = pyqtSignal()                 # always emitted last
+
+
+class LoadWorker(QRunnable):
+    """Reads a storage backend chunk by chunk (TaskStorage.iter_load) on a pool thread.
+
+    With `index` (e.g. a SearchIndex) every loaded task is also added to it on
+    the worker thread; the receiver takes it over once `finished` arrives.
+    """
+
+    def __init__(self, storage, chunk_size: int = 2000, max_pending: int = 2, index=None):
+        super().__init__()
+        self.storage = storage
+        self.chunk_size = chunk_size
+        self.index = index
+        # create the signals here, on the GUI thread, so deliveries are queued there
+        self.signals = LoadSignals()
+        self._cancelled = threading.Event()
+        # backpressure: at most max_pending chunks queued but not yet consumed,
+        # so the event loop never has a long backlog of chunks to process at once
+        self._credits = threading.Semaphore(max_pending)
+
+    def cancel(self) -> None:
+        """Stop after the chunk being read; finished is still emitted."""
+        self._cancelled.set()
+
+    def chunk_consumed(self) -> None:
+        """Called by the receiver once it has processed a chunk_loaded delivery."""
+        self._credits.release()
+
+    def run(self) -> None:
+        start = time.perf_counter()
+        try:
+            for chunk, progress in self.storage.iter_load(self.chunk_size):
+                if self.index is not None:
+                    for t in chunk:
+                        self.index.add(t)
+                while not self._credits.acquire(timeout=0.1):
+                    if self._cancelled.is_set():
+                        break
+                if self._cancelled.is_set():
+                    break
+                self.signals.chunk_loaded.emit(chunk, progress)
+        except Exception as e:
+            logger.exception("Background load failed")
+            self.signals.failed.emit(str(e))
+        finally:
+            logger.debug("Background load read for %.1f ms", (time.perf_counter() - start) * 1000)
+            self.signals.finished.emit()
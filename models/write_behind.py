@@ -0,0 +1,186 @@
+"""
+Write-behind storage - coalesces mutations and saves them on a background thread.
+
+Mutations only mark the store dirty; a worker thread waits for the coalescing
+window to pass, then writes one full snapshot through the wrapped backend.
+A burst of N clicks therefore costs one save instead of N, and none of them
+blocks the GUI thread.
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Sequence, Tuple
+
+from .storage import TaskStorage
+from .task import Task
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteBehindStats:
+    saves: int = 0                  # snapshots written
+    mutations: int = 0              # mutations persisted by those snapshots
+    last_coalesced: int = 0         # mutations folded into the most recent save
+    last_latency: float = 0.0       # seconds spent writing the most recent save
+    max_latency: float = 0.0
+    failures: int = 0
+
+
+class WriteBehindStorage(TaskStorage):
+    """
+    Wraps a full-snapshot backend (e.g. JsonStorage) with a coalescing save thread.
+
+    `on_saved(latency_seconds, coalesced_mutations)` is called from the worker
+    thread after every successful save.
+    """
+
+    def __init__(self, inner: TaskStorage, window: float = 0.25,
+                 on_saved: Optional[Callable[[float, int], None]] = None):
+        self.inner = inner
+        self.window = window
+        self.on_saved = on_saved
+        self.stats = WriteBehindStats()
+        self._cond = threading.Condition()
+        self._pending = 0
+        self._first_dirty = 0.0
+        self._tasks_ref: Iterable[Task] = ()
+        self._saving = False
+        self._flush_requested = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    # --- reads go straight to the wrapped backend --------------------
+    def load(self) -> list[Task]:
+        return self.inner.load()
+
+    def iter_load(self, chunk_size: int = 1000):
+        return self.inner.iter_load(chunk_size)
+
+    def query(self, tasks, completed=None, priority=None, deadline_before=None, limit=None) -> list[Task]:
+        return self.inner.query(tasks, completed=completed, priority=priority,
+                                deadline_before=deadline_before, limit=limit)
+
+    def count(self, tasks, completed=None) -> int:
+        return self.inner.count(tasks, completed=completed)
+
+    def reserve_ids(self, count: int, floor: int) -> int:
+        return self.inner.reserve_ids(count, floor)
+
+    @property
+    def has_pending(self) -> bool:
+        """True while mutations are waiting for (or being written by) a save."""
+        with self._cond:
+            return bool(self._pending or self._saving)
+
+    # --- mutations only mark the store dirty ------------------------
+    def _mark_dirty(self, tasks: Iterable[Task], mutations: int = 1) -> None:
+        with self._cond:
+            self._tasks_ref = tasks
+            if self._pending == 0:
+                self._first_dirty = time.monotonic()
+            self._pending += mutations
+            self._cond.notify_all()
+
+    def save_all(self, tasks: Iterable[Task]) -> None:
+        self._mark_dirty(tasks)
+
+    def task_added(self, task: Task, tasks: Iterable[Task]) -> None:
+        self._mark_dirty(tasks)
+
+    def task_updated(self, task: Task, fields: Sequence[str], tasks: Iterable[Task]) -> None:
+        self._mark_dirty(tasks)
+
+    def task_removed(self, task_id: int, tasks: Iterable[Task]) -> None:
+        self._mark_dirty(tasks)
+
+    def tasks_cleared(self, tasks: Iterable[Task]) -> None:
+        self._mark_dirty(tasks)
+
+    def apply_batch(self, ops: Sequence[Tuple[str, tuple]], tasks: Iterable[Task]) -> None:
+        self._mark_dirty(tasks, len(ops))
+
+    # --- worker ------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending == 0 and not self._closed:
+                    self._cond.wait()
+                if self._pending == 0:
+                    return
+                # let further mutations pile up until the window has passed
+                deadline = self._first_dirty + self.window
+                while not (self._closed or self._flush_requested):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                coalesced = self._pending
+                self._pending = 0
+                self._flush_requested = False
+                self._saving = True
+                # shallow copy under the lock; tasks mutated afterwards mark
+                # the store dirty again and are picked up by the next save
+                snapshot = list(self._tasks_ref)
+
+            start = time.perf_counter()
+            ok = True
+            try:
+                self.inner.save_all(snapshot)
+            except Exception:
+                ok = False
+                logger.exception("Write-behind save failed")
+            latency = time.perf_counter() - start
+
+            with self._cond:
+                self._saving = False
+                if ok:
+                    self.stats.saves += 1
+                    self.stats.mutations += coalesced
+                    self.stats.last_coalesced = coalesced
+                    self.stats.last_latency = latency
+                    self.stats.max_latency = max(self.stats.max_latency, latency)
+                else:
+                    # keep the mutations dirty and retry after another window
+                    self.stats.failures += 1
+                    if not self._closed:
+                        if self._pending == 0:
+                            self._first_dirty = time.monotonic()
+                        self._pending += coalesced
+                self._cond.notify_all()
+
+            if ok:
+                logger.debug("Saved %d coalesced mutation(s) in %.1f ms", coalesced, latency * 1000)
+                if self.on_saved is not None:
+                    try:
+                        self.on_saved(latency, coalesced)
+                    except Exception:
+                        pass
+
+    # --- lifecycle ---------------------------------------------------
+    def flush(self) -> None:
+        """Write pending mutations now and wait until they are on disk."""
+        with self._cond:
+            if not self._thread.is_alive():
+                return
+            failures = self.stats.failures
+            self._flush_requested = True
+            self._cond.notify_all()
+            # give up on a failed write instead of blocking the caller forever
+            while (self._pending or self._saving) and self.stats.failures == failures:
+                self._cond.wait()
+
+    def compact(self, tasks: Iterable[Task], background: bool = False) -> None:
+        self.flush()
+        self.inner.compact(tasks, background=background)
+
+    def close(self) -> None:
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self.inner.close()
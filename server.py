@@ -0,0 +1,488 @@
+"""
+Local HTTP/JSON API over the task model (stdlib asyncio, no framework).
+
+    GET    /health
+    GET    /tasks?offset=&limit=&completed=&order_by=&reverse=     list (streamed)
+    GET    /tasks/query?search=&priority=&due_before=&completed=&order_by=&limit=
+                                                                   query (streamed)
+    GET    /tasks/count?completed=
+    GET    /tasks/<id>
+    POST   /tasks               body: a title, a task object or a list of them
+    POST   /tasks/<id>/toggle
+    DELETE /tasks/<id>
+
+Connections are HTTP/1.1 keep-alive. Listings are answered with chunked
+transfer encoding, one page of tasks per chunk, so a large listing never
+builds one big response and other clients are served between its pages.
+
+All model access goes through a gateway. Headless (`python -m server`), the
+model lives on the server's event loop thread and is called directly. Next to
+the GUI (`python main.py --serve`), the server runs on its own thread and
+QtGateway runs every model call on the GUI thread, where the model and the
+views live. Each read is one model call that copies what it returns into
+plain dicts (task_json) on the model's thread, so responses never touch live
+task objects and any number of readers proceed concurrently; writes are
+additionally serialized through one lock, in arrival order.
+
+The server binds to 127.0.0.1 by default and has no authentication: it is
+meant for tools on the same machine.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+from models.bulk_io import FIELDS
+from models.sorted_index import SORT_KEYS
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+MAX_BODY = 1 << 20          # bytes
+MAX_HEADERS = 100
+_REASONS = {200: "OK", 201: "Created", 202: "Accepted", 204: "No Content", 400: "Bad Request",
+            404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+            500: "Internal Server Error"}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ResponseAborted(Exception):
+    """A response failed after its head was sent; only dropping the connection is left."""
+
+
+# --- model access ----------------------------------------------------
+class DirectGateway:
+    """Calls the model on the calling (event loop) thread."""
+
+    async def call(self, fn: Callable, *args, **kwargs) -> Any:
+        return fn(*args, **kwargs)
+
+
+class QtGateway(QObject):
+    """Runs model calls on the thread this object was created on (the GUI thread)."""
+
+    _invoke = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self._invoke.connect(self._run, Qt.ConnectionType.QueuedConnection)
+
+    def _run(self, job) -> None:
+        fn, args, kwargs, future = job
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    async def call(self, fn: Callable, *args, **kwargs) -> Any:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._invoke.emit((fn, args, kwargs, future))
+        return await asyncio.wrap_future(future)
+
+
+def task_json(task) -> dict:
+    return {name: getattr(task, name) for name in FIELDS}
+
+
+def _flag(value: Optional[str], name: str) -> Optional[bool]:
+    if value is None or value == "":
+        return None
+    value = value.lower()
+    if value in ("1", "true", "yes"):
+        return True
+    if value in ("0", "false", "no"):
+        return False
+    raise HttpError(400, f"{name} must be true or false")
+
+
+def _int(value: Optional[str], name: str, default: Optional[int] = None) -> Optional[int]:
+    if value is None or value == "":
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise HttpError(400, f"{name} must be an integer") from None
+    if number < 0:
+        raise HttpError(400, f"{name} must not be negative")
+    return number
+
+
+class ApiServer:
+    """HTTP/JSON front end for a DataModel; see the module docstring."""
+
+    def __init__(self, model, host: str = "127.0.0.1", port: int = DEFAULT_PORT, gateway=None,
+                 page_size: int = 500, idle_timeout: float = 15.0):
+        self.model = model
+        self.host = host
+        self.port = port
+        self.gateway = gateway or DirectGateway()
+        self.page_size = page_size
+        self.idle_timeout = idle_timeout
+        self._server: asyncio.AbstractServer | None = None
+        self._write_lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    # --- lifecycle ---------------------------------------------------
+    async def start(self) -> int:
+        """Start listening; returns the bound port (useful with port=0)."""
+        self._loop = asyncio.get_running_loop()
+        self._write_lock = asyncio.Lock()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("API server listening on http://%s:%d", self.host, self.port)
+        return self.port
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start_in_thread(self) -> int:
+        """Run the server on a daemon thread with its own event loop; returns the port."""
+        started = threading.Event()
+        errors: list[BaseException] = []
+
+        def run():
+            async def main():
+                try:
+                    await self.start()
+                except BaseException as e:
+                    errors.append(e)
+                    raise
+                finally:
+                    started.set()
+                try:
+                    await self._server.serve_forever()
+                except asyncio.CancelledError:
+                    pass
+            try:
+                asyncio.run(main())
+            except BaseException:
+                if not errors:
+                    logger.exception("API server stopped unexpectedly")
+
+        self._thread = threading.Thread(target=run, name="api-server", daemon=True)
+        self._thread.start()
+        started.wait()
+        if errors:
+            raise errors[0]
+        return self.port
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop a server started with start_in_thread (or from another thread)."""
+        loop, server = self._loop, self._server
+        if loop is None or server is None or loop.is_closed():
+            return
+
+        def close():
+            server.close()
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+        try:
+            loop.call_soon_threadsafe(close)
+        except RuntimeError:
+            return  # loop already closed
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    # --- HTTP --------------------------------------------------------
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    break
+                if not line:
+                    break
+                keep_alive = False
+                try:
+                    method, target, version, headers = await self._read_head(line, reader)
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = (version == "HTTP/1.1" and connection != "close") or connection == "keep-alive"
+                    body = await self._read_body(headers, reader)
+                    await self._dispatch(method, target, body, writer, keep_alive)
+                except HttpError as e:
+                    keep_alive = keep_alive and e.status != 413
+                    await self._send_json(writer, e.status, {"error": str(e)}, keep_alive)
+                except ResponseAborted:
+                    # a second response would land inside the first one's
+                    # body: close without the final chunk so the client sees
+                    # a truncated response
+                    logger.exception("API response failed after its head was sent")
+                    break
+                except Exception:
+                    logger.exception("API request failed")
+                    keep_alive = False
+                    await self._send_json(writer, 500, {"error": "internal error"}, False)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        except asyncio.CancelledError:
+            pass  # stop(): drop the connection quietly
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+
+    async def _read_head(self, line: bytes, reader: asyncio.StreamReader):
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise HttpError(400, "malformed request line") from None
+        headers: dict[str, str] = {}
+        for _ in range(MAX_HEADERS + 1):
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                return method.upper(), target, version, headers
+            name, _, value = header.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        raise HttpError(400, "too many headers")
+
+    async def _read_body(self, headers: dict, reader: asyncio.StreamReader) -> bytes:
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HttpError(400, "chunked request bodies are not supported")
+        length = _int(headers.get("content-length"), "Content-Length", 0)
+        if length > MAX_BODY:
+            raise HttpError(413, f"request body over {MAX_BODY} bytes")
+        return await reader.readexactly(length) if length else b""
+
+    def _head(self, status: int, headers: dict, keep_alive: bool) -> bytes:
+        lines = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}"]
+        headers = dict(headers, Connection="keep-alive" if keep_alive else "close")
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _send_json(self, writer, status: int, obj, keep_alive: bool) -> None:
+        body = b"" if status == 204 else json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Length": len(body)}
+        if body:
+            headers["Content-Type"] = "application/json"
+        writer.write(self._head(status, headers, keep_alive) + body)
+        await writer.drain()
+
+    async def _send_tasks(self, writer, tasks: list[dict], keep_alive: bool) -> None:
+        """Stream task dicts (see task_json) as a JSON array, one page per HTTP chunk."""
+        # the head goes out with the first page and the terminator with the
+        # last, so a listing of one page is a single write
+        out = self._head(200, {"Content-Type": "application/json", "Transfer-Encoding": "chunked"}, keep_alive)
+        size = self.page_size
+        last = max(len(tasks) - 1, 0) // size * size
+        for start in range(0, last + 1, size):
+            try:
+                # one encoder call per page; strip its brackets to splice pages together
+                items = json.dumps(tasks[start:start + size], ensure_ascii=False)[1:-1]
+            except Exception as e:
+                if start == 0:
+                    raise  # nothing sent yet: an ordinary error response
+                raise ResponseAborted() from e
+            data = (("[" if start == 0 else ",") + items + ("]" if start == last else "")).encode("utf-8")
+            out += b"%x\r\n%s\r\n" % (len(data), data)
+            if start == last:
+                out += b"0\r\n\r\n"
+            writer.write(out)
+            out = b""
+            # let other connections run between pages of a big listing
+            await writer.drain()
+
+    # --- routing -----------------------------------------------------
+    async def _dispatch(self, method: str, target: str, body: bytes, writer, keep_alive: bool) -> None:
+        url = urlsplit(target)
+        parts = [unquote(p) for p in url.path.split("/") if p]
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if parts == ["health"] and method == "GET":
+            await self._send_json(writer, 200, {"status": "ok"}, keep_alive)
+            return
+        if not parts or parts[0] != "tasks":
+            raise HttpError(404, "not found")
+
+        if len(parts) == 1:
+            if method == "GET":
+                tasks = await self.gateway.call(self._list, params)
+                await self._send_tasks(writer, tasks, keep_alive)
+            elif method == "POST":
+                status, result = await self._write(self._add, self._json_body(body))
+                await self._send_json(writer, status, result, keep_alive)
+            else:
+                raise HttpError(405, "use GET or POST")
+            return
+
+        if parts[1] == "query" and len(parts) == 2:
+            if method != "GET":
+                raise HttpError(405, "use GET")
+            tasks = await self.gateway.call(self._query, params)
+            await self._send_tasks(writer, tasks, keep_alive)
+            return
+        if parts[1] == "count" and len(parts) == 2:
+            if method != "GET":
+                raise HttpError(405, "use GET")
+            completed = _flag(params.get("completed"), "completed")
+            count = await self.gateway.call(self.model.count_tasks, completed)
+            await self._send_json(writer, 200, {"count": count}, keep_alive)
+            return
+
+        try:
+            task_id = int(parts[1])
+        except ValueError:
+            raise HttpError(404, "not found") from None
+        if len(parts) == 2 and method == "GET":
+            task = await self.gateway.call(self._get, task_id)
+            await self._send_json(writer, 200, task, keep_alive)
+        elif len(parts) == 2 and method == "DELETE":
+            status, result = await self._write(self._remove, task_id)
+            await self._send_json(writer, status, result, keep_alive)
+        elif parts[2:] == ["toggle"] and method == "POST":
+            status, result = await self._write(self._toggle, task_id)
+            await self._send_json(writer, status, result, keep_alive)
+        elif len(parts) == 2 or parts[2:] == ["toggle"]:
+            raise HttpError(405, "method not allowed")
+        else:
+            raise HttpError(404, "not found")
+
+    async def _write(self, fn: Callable, *args):
+        # writers run one at a time, in arrival order
+        async with self._write_lock:
+            return await self.gateway.call(fn, *args)
+
+    @staticmethod
+    def _json_body(body: bytes):
+        try:
+            return json.loads(body.decode("utf-8")) if body else None
+        except ValueError:
+            raise HttpError(400, "body is not valid JSON") from None
+
+    # --- model operations (run through the gateway) -----------------
+    # reads return task_json dicts: a columnar model's tasks are views onto
+    # rows the GUI thread may remove or reuse while a response is streaming
+    def _get(self, task_id: int) -> dict:
+        task = self.model.get_task_by_id(task_id)
+        if task is None:
+            raise HttpError(404, f"no task {task_id}")
+        return task_json(task)
+
+    def _list(self, params: dict) -> list[dict]:
+        offset = _int(params.get("offset"), "offset", 0)
+        limit = _int(params.get("limit"), "limit")
+        order_by = self._order_by(params)
+        tasks = self.model.get_tasks(offset, limit, completed=_flag(params.get("completed"), "completed"),
+                                     order_by=order_by, reverse=bool(_flag(params.get("reverse"), "reverse")))
+        return [task_json(t) for t in tasks]
+
+    def _query(self, params: dict) -> list[dict]:
+        return [task_json(t) for t in self._find(params)]
+
+    def _find(self, params: dict) -> list:
+        completed = _flag(params.get("completed"), "completed")
+        priority = params.get("priority") or None
+        due_before = params.get("due_before") or None
+        limit = _int(params.get("limit"), "limit")
+        order_by = self._order_by(params)
+        search = (params.get("search") or "").strip()
+        if search:
+            tasks = self.model.search_tasks(search, order_by=order_by)
+            tasks = [t for t in tasks
+                     if (completed is None or bool(t.completed) == completed)
+                     and (priority is None or t.priority == priority)
+                     and (due_before is None or (t.deadline and t.deadline < due_before))]
+            return tasks[:limit] if limit is not None else tasks
+        if order_by:
+            tasks = self.model.query_tasks(completed, priority, due_before)
+            key = SORT_KEYS[order_by][0]
+            tasks.sort(key=lambda t: (key(t), t.id))
+            return tasks[:limit] if limit is not None else tasks
+        return self.model.query_tasks(completed, priority, due_before, limit)
+
+    @staticmethod
+    def _order_by(params: dict) -> Optional[str]:
+        order_by = params.get("order_by") or None
+        if order_by is not None and order_by not in SORT_KEYS:
+            raise HttpError(400, f"order_by must be one of {', '.join(sorted(SORT_KEYS))}")
+        return order_by
+
+    def _add(self, payload):
+        if isinstance(payload, list):
+            if not all(isinstance(p, (str, dict)) for p in payload):
+                raise HttpError(400, "expected a list of titles or task objects")
+            if self.model.is_loading:
+                self.model.add_tasks(payload)
+                return 202, {"queued": len(payload)}
+            return 201, [task_json(t) for t in self.model.add_tasks(payload)]
+        if not isinstance(payload, (str, dict)):
+            raise HttpError(400, "expected a title or a task object")
+        title = payload.get("title") if isinstance(payload, dict) else payload
+        if not str(title or "").strip():
+            raise HttpError(400, "title is required")
+        if self.model.is_loading:
+            # applied once the running load finishes
+            self.model.add_task(payload)
+            return 202, {"queued": 1}
+        return 201, task_json(self.model.add_task(payload))
+
+    def _toggle(self, task_id: int):
+        if self.model.is_loading:
+            self.model.toggle_by_id(task_id)
+            return 202, {"queued": 1}
+        task = self.model.toggle_by_id(task_id)
+        if task is None:
+            raise HttpError(404, f"no task {task_id}")
+        return 200, task_json(task)
+
+    def _remove(self, task_id: int):
+        if self.model.is_loading:
+            self.model.remove_by_id(task_id)
+            return 202, {"queued": 1}
+        if not self.model.remove_by_id(task_id):
+            raise HttpError(404, f"no task {task_id}")
+        return 204, None
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    from cli import open_storage
+    from models.data_model import DataModel
+    from models.storage import JsonStorage
+
+    default_store = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tasks.json")
+    parser = argparse.ArgumentParser(prog="python -m server", description="Serve a task store over local HTTP/JSON")
+    parser.add_argument("--store", default=default_store, help="task store path (default: tasks.json)")
+    parser.add_argument("--host", default="127.0.0.1", help="bind address (default: localhost only)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s [%(name)s] %(message)s')
+
+    storage = open_storage(args.store)
+    # a plain JSON snapshot is rewritten on every save: coalesce them off the loop
+    model = DataModel(storage=storage, write_behind=type(storage) is JsonStorage)
+    server = ApiServer(model, args.host, args.port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        model.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Hot-path benchmarks for the model, controller and view, against baselines.
+
+For each store size a synthetic tasks.json is generated and timed:
+
+    model.load        DataModel(storage_path) reading the whole store
+    model.save        one full save of the store (JsonStorage.save_all)
+    model.add/toggle/remove
+                      ms per call on a loaded model (write-behind, as in main.py,
+                      so this is the cost paid on the GUI thread)
+    controller.add/toggle/remove
+                      ms per TaskController slot, including the view update
+    view.update_tasks TaskView.update_tasks with every task
+    view.show_page    TaskView.show_task_page with the first page
+
+Results are compared with tests/bench_baselines.json; the run fails when a
+metric is more than --threshold slower (relative) and --min-delta-ms slower
+(absolute) than its baseline. --update writes the current results as the new
+baselines. Runs offscreen unless QT_QPA_PLATFORM is set.
+
+    python tests/bench_hot_paths.py [--sizes 1000,10000,100000] [--full] [--update]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from controllers.task_controller import TaskController
+from models.data_model import DataModel
+from models.storage import JsonStorage
+from models.task import Task
+from views.task_view import TaskView
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baselines.json")
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+FULL_SIZES = DEFAULT_SIZES + [1_000_000]
+
+_WORDS = ("report", "review", "invoice", "meeting", "deploy", "backup", "email", "plan",
+          "design", "budget", "release", "test", "call", "update", "draft", "order")
+_PRIORITIES = ("High", "Normal", "Normal", "Low")
+
+
+def synthetic_tasks(n: int, seed: int = 1) -> list[Task]:
+    rnd = random.Random(seed)
+    tasks = []
+    for i in range(1, n + 1):
+        title = " ".join(rnd.choice(_WORDS) for _ in range(3)) + f" {i}"
+        deadline = f"2026-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}" if i % 3 else None
+        tasks.append(Task(i, title, f"details for task {i}", deadline, _PRIORITIES[i % 4],
+                          i % 5 == 0, f"2026-01-01T00:00:{i % 60:02d}+00:00"))
+    return tasks
+
+
+def _best(fn, repeat: int) -> float:
+    """Fastest of `repeat` runs of fn(), in ms."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def _per_call(fn, args: list) -> float:
+    """Mean ms per fn(arg) over args."""
+    gc.collect()
+    start = time.perf_counter()
+    for a in args:
+        fn(a)
+    return (time.perf_counter() - start) * 1000 / max(1, len(args))
+
+
+def bench_size(n: int, workdir: str, ops: int, repeat: int) -> dict[str, float]:
+    results: dict[str, float] = {}
+    path = os.path.join(workdir, f"tasks_{n}.json")
+    tasks = synthetic_tasks(n)
+    storage = JsonStorage(path)
+    storage.save_all(tasks)
+    results["model.save"] = _best(lambda: storage.save_all(tasks), repeat)
+    del tasks
+
+    results["model.load"] = _best(lambda: DataModel(storage_path=path), repeat)
+
+    # mutations: write-behind with a long window, so only the GUI-thread part is timed
+    rnd = random.Random(2)
+    model = DataModel(storage_path=path, write_behind=True, save_window=3600)
+    ids = rnd.sample(range(1, n + 1), min(ops, n))
+    results["model.add"] = _per_call(model.add_task, [f"benchmark task {i}" for i in range(ops)])
+    results["model.toggle"] = _per_call(model.toggle_by_id, ids)
+    results["model.remove"] = _per_call(model.remove_by_id, ids)
+
+    # controller slots driving a real (offscreen) TaskView
+    view = TaskView()
+    controller = TaskController(model, view)
+    ids = [t.id for t in rnd.sample(model.get_tasks(), min(ops, n // 2))]
+    results["controller.add"] = _per_call(controller.on_add_task,
+                                          [{"title": f"controller task {i}", "priority": "High"} for i in range(ops)])
+    results["controller.toggle"] = _per_call(controller.on_toggle_task, ids)
+    results["controller.remove"] = _per_call(controller.on_remove_task, ids)
+
+    all_tasks = model.get_tasks()
+    results["view.update_tasks"] = _best(lambda: view.update_tasks(all_tasks), repeat)
+    results["view.show_page"] = _best(
+        lambda: view.show_task_page(all_tasks[:TaskController.PAGE_SIZE], len(all_tasks),
+                                    lambda offset, limit: all_tasks[offset:offset + limit]), repeat)
+
+    view.deleteLater()
+    QApplication.processEvents()
+    model.close()  # writes the pending mutations; not timed
+    return results
+
+
+def compare(results: dict, baselines: dict, threshold: float, min_delta_ms: float) -> list[str]:
+    regressions = []
+    for size, metrics in results.items():
+        for name, ms in metrics.items():
+            base = baselines.get(size, {}).get(name)
+            if base is None:
+                continue
+            if ms > base * (1 + threshold) and ms - base > min_delta_ms:
+                regressions.append(f"{size} {name}: {ms:.3f} ms vs baseline {base:.3f} ms "
+                                   f"(+{(ms / base - 1) * 100 if base else float('inf'):.0f}%)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Model/controller/view hot-path benchmarks")
+    parser.add_argument("--sizes", default=None, help="comma-separated store sizes")
+    parser.add_argument("--full", action="store_true", help="include the 1M-task store")
+    parser.add_argument("--ops", type=int, default=200, help="calls per mutation benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per whole-store benchmark (best kept)")
+    parser.add_argument("--threshold", type=float, default=0.5, help="allowed relative slowdown")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="ignore smaller absolute slowdowns")
+    parser.add_argument("--update", action="store_true", help="write results as the new baselines")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")] if args.sizes else (FULL_SIZES if args.full else DEFAULT_SIZES)
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    workdir = tempfile.mkdtemp(prefix="upacube_bench_")
+    results: dict[str, dict[str, float]] = {}
+    try:
+        for n in sizes:
+            print(f"--- {n:,} tasks")
+            results[str(n)] = metrics = bench_size(n, workdir, args.ops, args.repeat)
+            for name, ms in metrics.items():
+                print(f"  {name:<20} {ms:10.3f} ms")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    baselines = {}
+    if os.path.exists(BASELINES):
+        with open(BASELINES, "r", encoding="utf-8") as f:
+            baselines = json.load(f)
+
+    if args.update:
+        merged = {k: v for k, v in baselines.items() if k != "_meta"}
+        merged.update(results)
+        merged["_meta"] = {"python": platform.python_version(), "platform": platform.platform(),
+                           "ops": args.ops, "repeat": args.repeat}
+        with open(BASELINES, "w", encoding="utf-8") as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baselines written to {BASELINES}")
+        return 0
+
+    regressions = compare(results, baselines, args.threshold, args.min_delta_ms)
+    if not baselines:
+        print("no baselines yet; run with --update to record them")
+    elif regressions:
+        print("REGRESSIONS:")
+        for line in regressions:
+            print("  " + line)
+        return 1
+    else:
+        print(f"no regressions beyond {args.threshold:.0%} of the baselines")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
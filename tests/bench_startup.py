@@ -0,0 +1,114 @@
+"""
+Startup benchmark: per-module import time and time to first paint.
+
+Each measurement runs in a fresh interpreter so nothing is cached between
+runs. Import times come from `python -X importtime -c "import main"`; time to
+first paint is measured from interpreter start to MainView.first_painted,
+with the window wired up the same way main.py does it.
+
+    python tests/bench_startup.py [--runs 5] [--top 15] [--budget-ms 400]
+
+With --budget-ms the script exits non-zero when the median time to first
+paint exceeds the budget. Runs offscreen unless QT_QPA_PLATFORM is set.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_FIRST_PAINT = r'''
+import time
+start = time.perf_counter()
+import os, sys, tempfile
+sys.path.insert(0, ROOT)
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+from models.data_model import DataModel
+from views.main_view import MainView
+from controllers.main_controller import MainController
+
+app = QApplication(sys.argv)
+model = DataModel(storage_path=os.path.join(tempfile.mkdtemp(), "tasks.json"), autoload=False)
+view = MainView()
+controller = MainController(model, view)
+
+def painted():
+    print(f"first_paint_ms={(time.perf_counter() - start) * 1000:.1f}")
+    print(f"task_view_built={view.has_task_view()}")
+    app.quit()
+
+view.first_painted.connect(painted)
+view.show()
+QTimer.singleShot(10000, app.quit)
+app.exec()
+model.close()
+'''
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["PYTHONPATH"] = root + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def import_times() -> list[tuple[int, int, str]]:
+    """(self us, cumulative us, module) for every module imported by `import main`."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                          cwd=root, env=_env(), capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def first_paint() -> tuple[float, bool]:
+    proc = subprocess.run([sys.executable, "-c", _FIRST_PAINT.replace("ROOT", repr(root))],
+                          cwd=root, env=_env(), capture_output=True, text=True)
+    values = dict(line.split("=", 1) for line in proc.stdout.splitlines() if "=" in line)
+    if "first_paint_ms" not in values:
+        raise RuntimeError(f"first paint not reached:\n{proc.stderr}")
+    return float(values["first_paint_ms"]), values.get("task_view_built") == "True"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to list")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail above this median first paint")
+    args = parser.parse_args()
+
+    rows = import_times()
+    total = next((cum for _, cum, name in rows if name == "main"), sum(s for s, _, _ in rows))
+    print(f"import main: {total / 1000:.1f} ms over {len(rows)} modules")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {name}")
+    deferred = [m for m in ("views.task_view", "views.add_task_dialog", "views.task_list_model")
+                if m in {name for _, _, name in rows}]
+    print("deferred page modules imported at startup:", ", ".join(deferred) or "none")
+
+    paints = []
+    for _ in range(args.runs):
+        ms, task_view_built = first_paint()
+        paints.append(ms)
+        if task_view_built:
+            print("warning: the task page was built before the first paint")
+    median = statistics.median(paints)
+    print(f"time to first paint: median {median:.1f} ms, min {min(paints):.1f} ms, "
+          f"max {max(paints):.1f} ms ({args.runs} runs)")
+
+    if args.budget_ms is not None and median > args.budget_ms:
+        print(f"FAIL: over the {args.budget_ms:.0f} ms startup budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
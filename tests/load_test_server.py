@@ -0,0 +1,143 @@
+"""
+Load test for the HTTP/JSON API (server.py).
+
+Opens --clients keep-alive connections and has each one send requests back to
+back for --duration seconds: mostly reads (a page of /tasks, a query, a count,
+one task) and --write-ratio writes (add, toggle, remove). Reports throughput
+and latency percentiles per request kind.
+
+Without --port a headless server is started in-process on a temporary store of
+--tasks synthetic tasks; with --port an already running instance is used
+(e.g. `python -m server --store copy.json` - the test adds, toggles and
+removes tasks, so point it at a copy).
+
+    python tests/load_test_server.py [--clients 50] [--duration 5] [--tasks 10000]
+    python tests/load_test_server.py --port 8765
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+
+async def request(reader, writer, method: str, path: str, body=None) -> tuple[int, bytes]:
+    """One request on an open keep-alive connection; returns (status, body)."""
+    data = b"" if body is None else json.dumps(body).encode("utf-8")
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(data)}\r\n\r\n"
+                 .encode("latin-1") + data)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding") == "chunked":
+        parts = []
+        while size := int((await reader.readline()).strip(), 16):
+            parts.append(await reader.readexactly(size + 2))
+        await reader.readline()
+        return status, b"".join(p[:-2] for p in parts)
+    return status, await reader.readexactly(int(headers.get("content-length", 0)))
+
+
+async def client(port: int, deadline: float, write_ratio: float, ids: list[int],
+                 latencies: dict, errors: list, seed: int) -> None:
+    rnd = random.Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.perf_counter() < deadline:
+            if rnd.random() < write_ratio:
+                kind = rnd.choice(("add", "toggle", "remove"))
+                if kind == "add":
+                    args = ("POST", "/tasks", {"title": f"load test {rnd.random():.6f}"})
+                elif kind == "toggle":
+                    args = ("POST", f"/tasks/{rnd.choice(ids)}/toggle")
+                else:
+                    args = ("DELETE", f"/tasks/{rnd.choice(ids)}")
+            else:
+                kind = rnd.choice(("list", "query", "count", "get"))
+                args = {"list": ("GET", f"/tasks?offset={rnd.randrange(len(ids))}&limit=100"),
+                        "query": ("GET", "/tasks/query?priority=High&completed=false&limit=100"),
+                        "count": ("GET", "/tasks/count?completed=false"),
+                        "get": ("GET", f"/tasks/{rnd.choice(ids)}")}[kind]
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, *args)
+            latencies.setdefault(kind, []).append((time.perf_counter() - start) * 1000)
+            # 404: a task another client already removed
+            if status >= 400 and status != 404:
+                errors.append(f"{kind} {args[1]} -> {status}")
+    finally:
+        writer.close()
+
+
+async def run_clients(port: int, clients: int, duration: float, write_ratio: float) -> dict:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    status, body = await request(reader, writer, "GET", "/tasks")
+    writer.close()
+    ids = [t["id"] for t in json.loads(body)] or [1]
+    latencies: dict[str, list[float]] = {}
+    errors: list[str] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, start + duration, write_ratio, ids, latencies, errors, seed)
+                           for seed in range(clients)))
+    return {"elapsed": time.perf_counter() - start, "latencies": latencies, "errors": errors}
+
+
+def _percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the local HTTP/JSON API")
+    parser.add_argument("--port", type=int, default=None, help="use a running server instead of starting one")
+    parser.add_argument("--clients", type=int, default=50, help="concurrent keep-alive connections")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds of load")
+    parser.add_argument("--write-ratio", type=float, default=0.1, help="fraction of requests that write")
+    parser.add_argument("--tasks", type=int, default=10_000, help="tasks in the in-process server's store")
+    args = parser.parse_args()
+
+    server = model = workdir = None
+    port = args.port
+    if port is None:
+        from bench_hot_paths import synthetic_tasks
+        from models.data_model import DataModel
+        from models.storage import JsonStorage
+        from server import ApiServer
+        workdir = tempfile.mkdtemp(prefix="upacube_load_")
+        store = os.path.join(workdir, "tasks.json")
+        JsonStorage(store).save_all(synthetic_tasks(args.tasks))
+        model = DataModel(storage_path=store, write_behind=True)
+        server = ApiServer(model, port=0)
+        port = server.start_in_thread()
+    try:
+        result = asyncio.run(run_clients(port, args.clients, args.duration, args.write_ratio))
+    finally:
+        if server is not None:
+            server.stop()
+            model.close()
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    total = sum(len(v) for v in result["latencies"].values())
+    print(f"{total} requests from {args.clients} clients in {result['elapsed']:.2f}s "
+          f"= {total / result['elapsed']:.0f} req/s")
+    print(f"  {'kind':<8} {'count':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for kind, values in sorted(result["latencies"].items()):
+        print(f"  {kind:<8} {len(values):>8} {_percentile(values, 0.5):>9.2f} {_percentile(values, 0.95):>9.2f} "
+              f"{_percentile(values, 0.99):>9.2f} {max(values):>9.2f}")
+    if result["errors"]:
+        print(f"{len(result['errors'])} errors, e.g. {result['errors'][:3]}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+import json, os, sys, tempfile, threading
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+from models.data_model import DataModel
+
+app = QCoreApplication.instance() or QCoreApplication([])
+tmp = tempfile.mkdtemp()
+path = os.path.join(tmp, 'tasks.json')
+with open(path, 'w', encoding='utf-8') as f:
+    json.dump([{'id': i, 'title': f'task {i}'} for i in range(1, 20001)], f)
+
+m = DataModel(storage_path=path, autoload=False)
+gui_thread = threading.get_ident()
+chunk_threads = set()
+progress = []
+m.tasks_loaded.connect(lambda tasks: chunk_threads.add(threading.get_ident()))
+m.load_progress.connect(progress.append)
+
+loop = QEventLoop()
+m.load_finished.connect(loop.quit)
+QTimer.singleShot(10000, loop.quit)   # safety net
+m.load_async(chunk_size=3000)
+assert m.is_loading
+# mutations issued mid-load are queued and replayed in order afterwards
+assert m.add_task('added during load') is None
+m.toggle_by_id(1)
+m.remove_by_id(2)
+loop.exec()
+
+print('progress:', [round(p, 2) for p in progress])
+assert not m.is_loading
+assert chunk_threads == {gui_thread}, 'chunks must be delivered on the GUI thread'
+assert progress[0] == 0.0 and progress[-1] == 1.0
+tasks = m.get_tasks()
+assert len(tasks) == 20000 and m.get_task_by_id(2) is None
+assert m.get_task_by_id(1).completed
+assert tasks[-1].title == 'added during load' and tasks[-1].id == 20001
+# the search index built on the worker covers loaded and replayed tasks
+assert m.search_ids('task 19999', typos=False) == {19999}
+assert m.search_ids('during') == {20001} and m.search_ids('task 2') is not None
+assert 2 not in m.search_ids('task')
+m.close()
+print('async load test ok')
@@ -0,0 +1,41 @@
+import os, sys, tempfile
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.data_model import DataModel
+
+tmp = tempfile.mkdtemp()
+path = os.path.join(tmp, 'tasks.json')
+for journal in (False, True):
+    m = DataModel(storage_path=path + str(journal), journal=journal)
+    emitted = []
+    m.tasks_changed.connect(lambda: emitted.append(1))
+
+    added = m.add_tasks(['one', {'title': 'two', 'priority': 'High'}, '', 'three'])
+    assert [t.title for t in added] == ['one', 'two', 'three']
+    changed = m.set_completed([t.id for t in added[:2]], True)
+    assert len(changed) == 2
+    assert m.set_completed([added[0].id], True) == []
+    assert m.remove_tasks([added[2].id, 999]) == 1
+    with m.batch():
+        m.add_task('four')
+        m.toggle_by_id(added[0].id)
+    print('journal' if journal else 'json', 'notifications:', len(emitted))
+    assert len(emitted) == 4
+    m.close()
+
+    reloaded = DataModel(storage_path=path + str(journal), journal=journal)
+    state = [(t.title, t.completed) for t in reloaded.get_tasks()]
+    print('reloaded:', state)
+    assert state == [('one', False), ('two', True), ('four', False)]
+    reloaded.close()
+
+# generators are read once, not used up by the check for a running load
+m = DataModel(storage_path=path + '.gen')
+added = m.add_tasks(title for title in ['a', 'b', 'c'])
+assert [t.title for t in added] == ['a', 'b', 'c']
+assert len(m.set_completed(t.id for t in added[:2])) == 2
+assert m.remove_tasks(t.id for t in added[1:]) == 2
+assert [t.title for t in m.get_tasks()] == ['a']
+assert [t.title for t in m.restore_tasks(t for t in added[1:])] == ['b', 'c']
+m.close()
+print('batch test ok')
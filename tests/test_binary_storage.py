@@ -0,0 +1,50 @@
+import json, os, sys, tempfile
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.binary_storage import BinaryStorage
+from models.data_model import DataModel
+
+tmp = tempfile.mkdtemp()
+json_path = os.path.join(tmp, 'tasks.json')
+bin_path = os.path.join(tmp, 'tasks.bin')
+with open(json_path, 'w', encoding='utf-8') as f:
+    json.dump([
+        {'id': 3, 'title': 'legacy', 'priority': 'High', 'deadline': '2026-01-01'},
+        {'id': 7, 'title': 'unicodé ✓', 'description': 'multi\nline', 'completed': True},
+    ], f)
+
+# first open imports tasks.json into the binary snapshot
+m = DataModel(storage=BinaryStorage(bin_path, migrate_from=json_path))
+print('imported:', [t.to_dict() for t in m.get_tasks()])
+assert [(t.id, t.title, t.completed) for t in m.get_tasks()] == [(3, 'legacy', False), (7, 'unicodé ✓', True)]
+size = os.path.getsize(bin_path)
+m.toggle_by_id(3)
+assert os.path.getsize(bin_path) == size, 'toggle should rewrite in place'
+t = m.add_task({'title': 'new', 'priority': 'Low', 'deadline': '2025-06-01'})
+m.remove_by_id(7)
+# non-flag edits rewrite the fixed-width record in place
+edited = m.get_task_by_id(t.id)
+edited.title = 'renamed'
+m.storage.task_updated(edited, ['title'], m.get_tasks())
+m.close()
+
+# reopen: in-place toggle, tombstone and appended record all persisted
+storage = BinaryStorage(bin_path)
+m2 = DataModel(storage=storage)
+tasks = m2.get_tasks()
+print('reloaded:', [(t.id, t.title, t.completed) for t in tasks])
+assert [(t.id, t.title, t.completed) for t in tasks] == [(3, 'legacy', True), (8, 'renamed', False)]
+assert tasks[0].deadline == '2026-01-01' and tasks[0].priority == 'High'
+
+# compaction drops the tombstone and keeps the data
+m2.compact(background=False)
+assert os.path.getsize(bin_path) < size + 52
+assert [t.id for t in BinaryStorage(bin_path).load()] == [3, 8]
+
+# JSON export for interchange
+out = os.path.join(tmp, 'export.json')
+assert storage.export_json(out) == 2
+with open(out, encoding='utf-8') as f:
+    print('exported:', json.load(f))
+m2.close()
+print('binary storage test ok')
@@ -0,0 +1,83 @@
+import csv
+import gc
+import json
+import os
+import sys
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from models.binary_storage import BinaryStorage
+from models.bulk_io import export_tasks, import_tasks, iter_records
+from models.data_model import DataModel
+
+tmp = tempfile.mkdtemp()
+path = os.path.join(tmp, 'tasks.json')
+model = DataModel(storage_path=path)
+model.add_task({'title': 'Existing', 'description': 'd', 'priority': 'High'})
+model.add_task('Second')
+
+jsonl = os.path.join(tmp, 'in.jsonl')
+with open(jsonl, 'w', encoding='utf-8') as f:
+    f.write(json.dumps({'id': 99, 'title': 'Imported one', 'priority': 'Low', 'deadline': '2026-05-01'}) + '\n')
+    f.write('\n')
+    f.write('{not json\n')
+    f.write(json.dumps({'title': '   '}) + '\n')                          # blank title
+    f.write(json.dumps(['a list']) + '\n')                                 # not an object
+    f.write(json.dumps({'title': 'existing', 'description': 'd', 'priority': 'high'}) + '\n')  # dup of task 1
+    f.write(json.dumps({'title': 'Imported two', 'completed': True}) + '\n')
+    f.write(json.dumps({'title': 'Imported one', 'priority': 'Low', 'deadline': '2026-05-01'}) + '\n')  # dup in file
+    f.write(json.dumps({'title': 'Imported three', 'created_at': '2020-01-01T00:00:00+00:00'}) + '\n')
+
+# a bad line only costs that record, whatever the chunking
+assert sum(1 for r in iter_records(jsonl, chunk_size=3) if r is None) == 2
+
+resets, added = [], []
+model.tasks_reset.connect(lambda: resets.append(1))
+model.task_added.connect(added.append)
+result = import_tasks(model, jsonl, chunk_size=4)
+print(result)
+assert (result.imported, result.duplicates, result.invalid) == (3, 2, 3), result
+# fresh ids continue from the model's counter (the incoming id is ignored)
+tasks = model.get_tasks()
+assert [t.id for t in tasks] == [1, 2, 3, 4, 5], [t.id for t in tasks]
+assert tasks[2].title == 'Imported one' and tasks[2].priority == 'Low' and tasks[2].deadline == '2026-05-01'
+assert tasks[3].completed is True and tasks[4].created_at == '2020-01-01T00:00:00+00:00'
+# one notification per persisted chunk, no per-task signals
+assert len(resets) == result.chunks and not added
+assert gc.isenabled()
+
+# persisted: a fresh model sees the imported tasks
+assert [t.title for t in DataModel(storage_path=path).get_tasks()][2:] == ['Imported one', 'Imported two', 'Imported three']
+
+# CSV in: empty cells are missing values, flags accept yes/no
+csv_path = os.path.join(tmp, 'in.csv')
+with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+    w = csv.writer(f)
+    w.writerow(['title', 'description', 'deadline', 'priority', 'completed'])
+    w.writerow(['From csv', 'row', '', '', 'yes'])
+    w.writerow(['Imported two', '', '', 'Normal', 'no'])   # duplicate of a JSONL task
+result = import_tasks(model, csv_path)
+assert (result.imported, result.duplicates, result.invalid) == (1, 1, 0), result
+t = model.get_tasks()[-1]
+assert (t.id, t.deadline, t.priority, t.completed) == (6, None, 'Normal', True)
+
+# export round trip, both formats
+for name in ('out.jsonl', 'out.csv'):
+    out = os.path.join(tmp, name)
+    assert export_tasks(model.get_tasks(), out) == 6
+    fresh = DataModel(storage_path=os.path.join(tmp, name + '.json'))
+    r = import_tasks(fresh, out)
+    assert r.imported == 6 and r.invalid == 0, r
+    assert [(t.title, t.deadline, t.completed) for t in fresh.get_tasks()] == \
+           [(t.title, t.deadline, t.completed) for t in model.get_tasks()], name
+
+# binary backend appends each chunk in one write
+bin_model = DataModel(storage=BinaryStorage(os.path.join(tmp, 'tasks.bin')))
+assert import_tasks(bin_model, os.path.join(tmp, 'out.jsonl'), chunk_size=2).imported == 6
+bin_model.close()
+reopened = BinaryStorage(os.path.join(tmp, 'tasks.bin'))
+assert [t.title for t in reopened.load()] == [t.title for t in model.get_tasks()]
+reopened.close()
+print('bulk io OK')
@@ -0,0 +1,79 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+import cli
+from models.storage import JsonStorage
+from models.task import Task
+
+tmp = tempfile.mkdtemp()
+store = os.path.join(tmp, 'tasks.json')
+tasks = [
+    Task(1, 'Write report', 'quarterly numbers', '2000-01-01', 'High'),
+    Task(2, 'Review budget', '', '2099-12-31', 'Low', True),
+    Task(3, 'Call plumber', 'kitchen sink', None, 'Normal'),
+    Task(4, 'Report bug', 'crash on startup', '2001-05-05', 'high', True),
+]
+JsonStorage(store).save_all(tasks)
+
+
+def run(*argv):
+    out = io.StringIO()
+    with redirect_stdout(out):
+        code = cli.main(['--store', store, *argv])
+    assert code == 0, code
+    return out.getvalue()
+
+
+assert run('count') == '4\n'
+assert run('count', '--pending') == '2\n'
+assert run('count', '--priority', 'HIGH') == '2\n'
+assert run('count', '--overdue') == '1\n'
+assert run('count', '--due-before', '2050-01-01') == '2\n'
+assert run('count', '--search', 'rep') == '2\n'
+assert run('count', '--search', 'report quarter') == '1\n'
+
+lines = run('list', '--done').splitlines()
+assert lines == ['[x] #2 Review budget (Low, due 2099-12-31)', '[x] #4 Report bug (high, due 2001-05-05)'], lines
+
+rows = [json.loads(l) for l in run('list', '--format', 'jsonl', '--sort', 'deadline', '--limit', '3').splitlines()]
+assert [r['id'] for r in rows] == [1, 4, 2], rows
+
+csv_lines = run('list', '--format', 'csv', '--pending').splitlines()
+assert csv_lines[0].startswith('id,title') and len(csv_lines) == 3
+
+report = json.loads(run('report', '--format', 'json'))
+assert report['total'] == 4 and report['done'] == 2 and report['overdue'] == 1
+assert report['by_priority']['High'] == {'total': 1, 'done': 0}
+assert 'Tasks:' in run('report')
+
+# chunked streaming: results do not depend on the chunk size
+cli.CHUNK_SIZE = 1
+assert run('count', '--pending') == '2\n'
+assert len(run('list').splitlines()) == 4
+
+# bulk export of matching tasks, then import into another store
+cli.CHUNK_SIZE = 5000
+export_path = os.path.join(tmp, 'pending.jsonl')
+assert run('export', export_path, '--pending') == f'exported 2 tasks to {export_path}\n'
+other = os.path.join(tmp, 'other.json')
+out = io.StringIO()
+with redirect_stdout(out):
+    assert cli.main(['--store', other, 'import', export_path]) == 0
+assert out.getvalue().startswith('imported 2 tasks')
+assert [t.title for t in JsonStorage(other).load()] == ['Write report', 'Call plumber']
+
+# headless: running the CLI never imports Qt
+probe = ("import sys, io, contextlib, cli\n"
+         "with contextlib.redirect_stdout(io.StringIO()):\n"
+         f"    cli.main(['--store', {store!r}, 'report'])\n"
+         "assert not any(m.startswith('PyQt6') for m in sys.modules), 'Qt imported'\n")
+subprocess.run([sys.executable, '-c', probe], cwd=root, check=True)
+print('cli OK')
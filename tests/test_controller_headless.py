@@ -25,6 +25,13 @@ class DummyTaskView:
         self._tasks_snapshot = [t.to_dict() if hasattr(t, 'to_dict') else t for t in tasks]
     def clear_status(self):
         self._status.clear()
+    # incremental updates driven by the model's fine-grained signals
+    def add_task_item(self, task):
+        self._tasks_snapshot.append(task.to_dict())
+    def remove_task_item(self, task_id):
+        self._tasks_snapshot = [t for t in self._tasks_snapshot if t['id'] != task_id]
+    def update_task_item(self, task):
+        self._tasks_snapshot = [task.to_dict() if t['id'] == task.id else t for t in self._tasks_snapshot]
 
 
 # run headless test
@@ -39,11 +46,11 @@ controller.on_add_task('headless task')
 print('after add tasks:', m.get_task_count())
 # toggle first
 if m.get_task_count() > 0:
-    controller.on_toggle_task(0)
+    controller.on_toggle_task(m.get_tasks()[0].id)
     print('after toggle first:', m.get_tasks()[0].completed)
 # remove
 if m.get_task_count() > 0:
-    controller.on_remove_task(0)
+    controller.on_remove_task(m.get_tasks()[0].id)
     print('after remove tasks:', m.get_task_count())
 # clear
 controller.on_clear_requested()
@@ -0,0 +1,155 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication
+
+from models.data_model import DataModel
+from models.file_lock import file_lock
+from models.storage import JsonStorage
+from models.task import Task
+
+app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+tmp = tempfile.mkdtemp()
+path = os.path.join(tmp, 'tasks.json')
+
+# --- advisory lock: another process holding it makes us wait / time out
+holder = subprocess.Popen([sys.executable, '-c',
+                           'import sys, time; sys.path.insert(0, sys.argv[1])\n'
+                           'from models.file_lock import file_lock\n'
+                           'with file_lock(sys.argv[2]):\n'
+                           '    print("locked", flush=True); time.sleep(1.0)\n', root, path],
+                          stdout=subprocess.PIPE, text=True)
+assert holder.stdout.readline().strip() == 'locked'
+try:
+    with file_lock(path, timeout=0.1):
+        raise AssertionError('lock should be held by the other process')
+except TimeoutError:
+    pass
+start = time.monotonic()
+with file_lock(path, timeout=5):
+    assert time.monotonic() - start > 0.1
+holder.wait()
+with file_lock(path, shared=True), file_lock(path, shared=True, timeout=0.1):
+    pass  # readers do not exclude each other
+
+# --- our own writes are not external changes, someone else's are
+JsonStorage(path).save_all([Task(1, 'one'), Task(2, 'two'), Task(3, 'three')])
+model = DataModel(storage_path=path)
+storage = model.storage
+assert not storage.changed_on_disk()
+model.add_task('four')
+assert not storage.changed_on_disk()
+other = JsonStorage(path)
+tasks = other.load()
+assert storage.changed_on_disk() is False  # reading does not change the file
+
+events = []
+model.task_added.connect(lambda t: events.append(('added', t.id)))
+model.task_updated.connect(lambda i, f: events.append(('updated', i, f)))
+model.task_removed.connect(lambda i: events.append(('removed', i)))
+model.tasks_reset.connect(lambda: events.append(('reset',)))
+
+tasks[1].title = 'two (edited elsewhere)'
+tasks[0].completed = True
+tasks = [t for t in tasks if t.id != 3] + [Task(10, 'ten')]
+other.save_all(tasks)
+assert storage.changed_on_disk()
+
+# --- incremental reload: only the differences are applied and announced
+assert model.reload_changes() == (1, 2, 1)
+assert sorted(events, key=str) == sorted([('added', 10), ('updated', 1, ['completed']),
+                                          ('updated', 2, ['title']), ('removed', 3)], key=str), events
+assert model.get_task_by_id(2).title == 'two (edited elsewhere)'
+assert model.search_tasks('edited')[0].id == 2
+assert model.add_task('after reload').id == 11  # ids continue after the other process's
+events.clear()
+assert model.reload_changes() == (0, 0, 0) and events == []
+model.close()
+
+# --- write-behind: a change not yet saved survives a reload and is saved with the merge
+model = DataModel(storage_path=path, write_behind=True, save_window=3600)
+model.watch_external_changes()  # tracks changes not saved yet
+model.toggle_by_id(4)
+mine = model.add_task('unsaved here')
+assert model.storage.has_pending
+tasks = other.load()
+for t in tasks:
+    if t.id == 4:
+        t.title = 'renamed elsewhere'  # conflicts with our pending toggle: ours wins
+tasks.append(Task(50, 'fifty'))
+other.save_all(tasks)
+assert model.reload_changes() == (1, 0, 0)
+assert model.get_task_by_id(mine.id) is mine and model.get_task_by_id(4).completed
+model.flush()
+assert not model.storage.has_pending
+saved = {t.id: t for t in JsonStorage(path).load()}
+assert 50 in saved and mine.id in saved and saved[4].completed
+model.close()
+
+# --- the watcher reloads on external writes and ignores our own
+model = DataModel(storage_path=path)
+assert model.watch_external_changes(debounce_ms=20) is not None
+reloads = []
+model.tasks_changed.connect(lambda: reloads.append(1))
+
+
+def spin(seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        app.processEvents()
+        time.sleep(0.01)
+
+
+model.add_task('own write')
+reloads.clear()
+spin(0.3)
+assert reloads == []  # our own save is not reloaded
+tasks = other.load()
+tasks.append(Task(99, 'from another process'))
+other.save_all(tasks)
+end = time.monotonic() + 5
+while model.get_task_by_id(99) is None and time.monotonic() < end:
+    spin(0.05)
+assert model.get_task_by_id(99).title == 'from another process'
+model.close()
+
+# --- two writers on one file: ids are reserved and writes merge instead of overwriting
+path = os.path.join(tmp, 'shared.json')
+first, second = DataModel(storage_path=path), DataModel(storage_path=path, write_behind=True)
+a = first.add_task('from first')
+b = second.add_task('from second')
+assert a.id != b.id
+second.flush()
+saved = {t.id: t.title for t in JsonStorage(path).load()}
+assert saved == {a.id: 'from first', b.id: 'from second'}, saved
+first.toggle_by_id(a.id)        # first has not seen b: the merge keeps it
+second.update_task(b.id, title='edited by second')
+second.flush()
+saved = {t.id: t for t in JsonStorage(path).load()}
+assert saved[a.id].completed and saved[b.id].title == 'edited by second'
+first.remove_by_id(a.id)
+saved = {t.id: t.title for t in JsonStorage(path).load()}
+assert saved == {b.id: 'edited by second'}, saved
+first.close()
+second.close()
+
+writer = ('import sys; sys.path.insert(0, sys.argv[1])\n'
+          'from models.data_model import DataModel\n'
+          'model = DataModel(storage_path=sys.argv[2])\n'
+          'for i in range(25):\n'
+          '    model.add_task(sys.argv[3] + str(i))\n')
+procs = [subprocess.Popen([sys.executable, '-c', writer, root, path, name]) for name in ('p', 'q')]
+assert all(p.wait() == 0 for p in procs)
+saved = JsonStorage(path).load()
+assert len(saved) == 51 and len({t.id for t in saved}) == 51, len(saved)
+
+# other backends are not watched
+assert DataModel(storage_path=os.path.join(tmp, 'j.json'), journal=True).watch_external_changes() is None
+print('external changes OK')
@@ -0,0 +1,91 @@
+import os, sys, tempfile
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.data_model import DataModel
+
+tmp = tempfile.mkdtemp()
+path = os.path.join(tmp, 'tasks.json')
+
+m = DataModel(storage_path=path, journal=True, compact_threshold=5)
+m.add_task('first')
+m.add_task({'title': 'second', 'priority': 'High'})
+m.toggle_task_completed(0)
+m.remove_task_by_index(1)
+print('journal records:', m.storage.journal.record_count)
+m.close()
+
+# reload replays snapshot + journal
+m2 = DataModel(storage_path=path, journal=True, compact_threshold=5)
+tasks = [t.to_dict() for t in m2.get_tasks()]
+print('replayed:', tasks)
+assert len(tasks) == 1 and tasks[0]['title'] == 'first' and tasks[0]['completed']
+
+# cross the threshold to trigger background compaction
+for i in range(6):
+    m2.add_task(f'task {i}')
+m2.close()
+print('journal after compaction:', os.path.exists(path + '.journal.compacting'))
+
+m3 = DataModel(storage_path=path, journal=True)
+print('after compaction:', m3.get_task_count())
+assert m3.get_task_count() == 7
+assert [t.id for t in m3.get_tasks()] == sorted(t.id for t in m3.get_tasks())
+m3.close()
+print('journal test ok')
+
+# a torn last record (crash mid-append) must not swallow later appends
+path = os.path.join(tmp, 'torn.json')
+m = DataModel(storage_path=path, journal=True)
+m.add_task('before crash')
+m.close()
+with open(path + '.journal', 'a', encoding='utf-8') as f:
+    f.write('{"op":"add","task":{"id":9,"tit')
+m = DataModel(storage_path=path, journal=True)
+assert [t.title for t in m.get_tasks()] == ['before crash']
+m.add_task('after crash 1')
+m.add_task('after crash 2')
+m.close()
+m = DataModel(storage_path=path, journal=True)
+assert [t.title for t in m.get_tasks()] == ['before crash', 'after crash 1', 'after crash 2']
+m.close()
+
+# a complete last record that only lost its newline is kept
+with open(path + '.journal', 'rb+') as f:
+    f.seek(-1, os.SEEK_END)
+    f.truncate()
+m = DataModel(storage_path=path, journal=True)
+m.add_task('after repair')
+m.close()
+m = DataModel(storage_path=path, journal=True)
+assert [t.title for t in m.get_tasks()][-2:] == ['after crash 2', 'after repair']
+m.close()
+
+# journals already corrupted mid-file: only the bad line is skipped
+with open(path + '.journal', 'a', encoding='utf-8') as f:
+    f.write('{"op":"add","task":{"id":9,"tit{"op":"remove","id":1}\n')
+m = DataModel(storage_path=path, journal=True)
+m.add_task('after bad line')
+m.close()
+m = DataModel(storage_path=path, journal=True)
+assert [t.title for t in m.get_tasks()][-1] == 'after bad line'
+m.close()
+print('torn journal ok')
+
+# a full save after compaction must not take the new snapshot for another
+# writer's file and bring back tasks removed since
+from models.history import RemoveTask
+path = os.path.join(tmp, 'compacted.json')
+m = DataModel(storage_path=path, journal=True, compact_threshold=4)
+for title in ['zero', 'a', 'b', 'c']:
+    m.add_task(title)
+m.storage.journal.wait()
+assert not m.storage.changed_on_disk()
+m.remove_task_by_index(2)                 # b
+remove_a = RemoveTask(m.get_tasks()[1])
+m.remove_task_by_index(1)
+remove_a.undo(m)                          # a mid-list restore saves in full
+m.close()
+m = DataModel(storage_path=path, journal=True)
+assert [t.title for t in m.get_tasks()] == ['zero', 'a', 'c'], [t.title for t in m.get_tasks()]
+m.close()
+print('compaction then undo ok')
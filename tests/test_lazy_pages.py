@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from views.main_view import MainView
+from models.data_model import DataModel
+from controllers.main_controller import MainController
+
+# the task page and its modules are not loaded with the main window
+assert 'views.task_view' not in sys.modules, 'task_view imported eagerly'
+
+path = os.path.join(tempfile.mkdtemp(), 'tasks.json')
+seed = DataModel(storage_path=path)
+for i in range(5):
+    seed.add_task(f'task {i}')
+seed.flush()
+
+model = DataModel(storage_path=path, autoload=False)
+view = MainView()
+controller = MainController(model, view)
+assert not view.has_task_view()
+assert controller.task_controller is None
+
+events = []
+view.first_painted.connect(lambda: events.append(('painted', model.get_task_count())))
+view.first_painted.connect(model.load_async)
+view.show()
+QTimer.singleShot(300, view.show_task_view)
+QTimer.singleShot(600, app.quit)
+app.exec()
+
+# nothing was loaded before the first paint, everything after it
+print('events:', events)
+assert events == [('painted', 0)]
+assert view.has_task_view() and controller.task_controller is not None
+assert view.stacked_widget.currentWidget() is view.task_view
+assert view.task_view.task_model.rowCount() == 5, view.task_view.task_model.rowCount()
+
+model.close()
+print('lazy pages OK')
@@ -0,0 +1,81 @@
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from utils import logging_qt
+from utils.logging_setup import setup_logging, shutdown_logging
+
+
+class Recorder(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((threading.current_thread().name, self.format(record)))
+
+
+class Pane(QObject):
+    """Stands in for the status pane: records which thread each line arrives on."""
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def append(self, text):
+        self.lines.append((threading.current_thread() is threading.main_thread(), text))
+
+
+logs_dir = tempfile.mkdtemp()
+recorder = Recorder()
+pane = Pane()
+logging_qt.connect_to_textedit(pane)
+setup_logging(logs_dir, console=False, extra_handlers=[recorder])
+
+log = logging.getLogger('test_logging_queue')
+for i in range(1000):
+    log.info('message %d', i)
+try:
+    raise ValueError('boom')
+except ValueError:
+    log.exception('failed')
+
+# the GUI thread only enqueued: records are handled on the listener thread
+deadline = time.monotonic() + 10
+while len(recorder.records) < 1001 and time.monotonic() < deadline:
+    time.sleep(0.01)
+# one event-loop pass delivers whatever the Qt handler buffered
+app.processEvents()
+shutdown_logging()
+assert len(recorder.records) == 1001, len(recorder.records)
+assert all(name != threading.main_thread().name for name, _ in recorder.records)
+assert recorder.records[0][1].endswith('message 0')
+assert 'ValueError: boom' in recorder.records[-1][1]
+
+# everything reached the rotating file after shutdown
+with open(os.path.join(logs_dir, 'upacube.log'), encoding='utf-8') as f:
+    lines = [l for l in f.read().splitlines() if 'message' in l]
+assert len(lines) == 1000, len(lines)
+
+# Qt deliveries were queued back to the GUI thread, batched: 1001 records
+# exceed the handler's 1000-line buffer, so the oldest became a marker
+assert pane.lines and all(on_gui for on_gui, _ in pane.lines)
+text = "\n".join(t for _, t in pane.lines)
+assert len(pane.lines) < 1001, len(pane.lines)
+assert '... 1 messages suppressed' in text
+assert 'message 0' not in text.split('\n')[1] and text.count('message ') == 999, text.count('message ')
+
+# after shutdown logging no longer goes through the queue
+assert not any(h.__class__.__name__ == 'QueueHandler' for h in logging.getLogger().handlers)
+print('logging queue OK')
@@ -0,0 +1,27 @@
+import os, sys, tempfile
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.data_model import DataModel
+
+tmp = tempfile.mkdtemp()
+m = DataModel(storage_path=os.path.join(tmp, 'tasks.json'))
+events = []
+m.task_added.connect(lambda t: events.append(('added', t.id)))
+m.task_removed.connect(lambda tid: events.append(('removed', tid)))
+m.task_updated.connect(lambda tid, fields: events.append(('updated', tid, fields)))
+m.tasks_reset.connect(lambda: events.append(('reset',)))
+
+a = m.add_task('a')
+m.toggle_by_id(a.id)
+m.remove_by_id(a.id)
+m.add_tasks(['b', 'c'])
+m.clear_tasks()
+print('events:', events)
+assert events == [
+    ('added', a.id),
+    ('updated', a.id, ['completed']),
+    ('removed', a.id),
+    ('reset',),   # one consolidated event for the batch
+    ('reset',),
+]
+print('model signal test ok')
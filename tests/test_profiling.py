@@ -0,0 +1,66 @@
+import logging
+import os
+import pstats
+import sys
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+from utils import profiling
+from controllers.task_controller import TaskController
+
+
+class Recorder(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+recorder = Recorder()
+logging.getLogger('utils.profiling').addHandler(recorder)
+logging.getLogger('utils.profiling').setLevel(logging.INFO)
+
+
+@profiling.timed_slot
+def slow(delay):
+    time.sleep(delay)
+    return delay
+
+
+# disabled by default: nothing is logged, results pass through
+assert slow(0.02) == 0.02
+assert recorder.messages == []
+
+profiling.enable_slot_timing(10)
+slow(0.001)
+slow(0.03)
+assert len(recorder.messages) == 1, recorder.messages
+assert 'slow slot slow took' in recorder.messages[0]
+profiling.disable_slot_timing()
+slow(0.03)
+assert len(recorder.messages) == 1
+
+# the controller handlers are wrapped, and keep their names
+for name in ('on_add_task', 'on_toggle_task', 'on_remove_task', 'on_clear_requested'):
+    fn = getattr(TaskController, name)
+    assert fn.__name__ == name and hasattr(fn, '__wrapped__'), name
+
+# the event loop can run under cProfile; stats are written on return
+app = QApplication.instance() or QApplication(sys.argv)
+path = os.path.join(tempfile.mkdtemp(), 'run.prof')
+QTimer.singleShot(50, lambda: time.sleep(0.01))
+QTimer.singleShot(100, app.quit)
+assert profiling.run_profiled(app.exec, path) == 0
+stats = pstats.Stats(path)
+assert stats.total_calls > 0
+assert any('profile written to' in m for m in recorder.messages)
+print('profiling OK')
@@ -0,0 +1,105 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from models.task import Task
+from views.task_list_model import TaskIdRole, TaskListModel, _increasing_subsequence
+from views.task_view import TaskView
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def ids(proxy):
+    return [proxy.index(r, 0).data(TaskIdRole) for r in range(proxy.rowCount())]
+
+
+class Recorder:
+    """Counts the row signals a model emits."""
+
+    def __init__(self, model):
+        self.events = []
+        model.modelReset.connect(lambda: self.events.append('reset'))
+        model.rowsInserted.connect(lambda _p, a, b: self.events.append(('insert', a, b)))
+        model.rowsRemoved.connect(lambda _p, a, b: self.events.append(('remove', a, b)))
+        model.rowsMoved.connect(lambda _p, a, b, _d, r: self.events.append(('move', a, r)))
+        model.dataChanged.connect(lambda a, b, _roles: self.events.append(('changed', a.row(), b.row())))
+
+
+assert sorted(_increasing_subsequence([5, 1, 2, 9, 3, 4])) == [1, 2, 4, 5]
+
+tasks = [Task(i, f'task {i}') for i in range(1, 301)]
+view = TaskView()
+view.resize(600, 500)
+view.show()
+view.update_tasks(tasks)
+app.processEvents()
+rec = Recorder(view.task_model)
+
+# select a task and scroll the pending list
+view.select_id(150)
+view.pending_list.scrollTo(view.pending_list.currentIndex())
+scroll = view.pending_list.verticalScrollBar().value()
+assert scroll > 0
+
+# toggle one task in place: one changed row, which moves from Pending to Done
+tasks[9].completed = True
+view.update_tasks(tasks)
+assert rec.events == [('changed', 9, 9)], rec.events
+assert ids(view.done_model) == [10] and 10 not in ids(view.pending_model)
+assert view.current_selected_id() == 150
+assert view.pending_list.verticalScrollBar().value() == scroll
+
+# unchanged list: nothing is emitted
+rec.events.clear()
+view.update_tasks(tasks)
+assert rec.events == []
+
+# removals, insertions and an edited title in one diff
+rec.events.clear()
+tasks[199].title = 'renamed'
+new = [t for t in tasks if t.id not in (5, 6, 7, 250)]
+new.insert(20, Task(1001, 'inserted'))
+new.append(Task(1002, 'appended'))
+view.update_tasks(new)
+assert 'reset' not in rec.events
+assert ('remove', 4, 6) in rec.events and ('insert', 20, 20) in rec.events
+assert [view.task_model.task_at(r).id for r in range(view.task_model.rowCount())] == [t.id for t in new]
+assert ('changed', 197, 197) in rec.events, rec.events  # task 200: 3 rows removed above, 1 inserted
+assert view.current_selected_id() == 150
+
+# a reorder moves only the out-of-place rows
+rec.events.clear()
+moved = new[1:] + new[:1]
+view.update_tasks(moved)
+assert rec.events == [('move', 0, len(moved))], rec.events
+assert [view.task_model.task_at(r).id for r in range(view.task_model.rowCount())] == [t.id for t in moved]
+assert view.current_selected_id() == 150
+
+# a completely different list falls back to one reset, keeping the selection if it is still there
+rec.events.clear()
+shuffled = moved[::-1]
+view.update_tasks(shuffled)
+assert rec.events == ['reset'] and view.current_selected_id() == 150
+
+# paged views: a refresh keeps the rows already scrolled in
+model = TaskListModel()
+all_tasks = [Task(i, f'p{i}') for i in range(1, 1001)]
+fetch = lambda offset, limit: all_tasks[offset:offset + limit]
+model.reconcile(all_tasks[:200], 1000, fetch)
+model.fetchMore()
+assert model.rowCount() == 400
+view2 = TaskView()
+view2.show_task_page(all_tasks[:200], 1000, fetch)
+view2.task_model.fetchMore()
+rec2 = Recorder(view2.task_model)
+all_tasks[300].completed = True
+view2.show_task_page(all_tasks[:200], 1000, fetch)
+assert view2.task_model.rowCount() == 400 and rec2.events == [('changed', 300, 300)], rec2.events
+
+view.close()
+print('reconcile OK')
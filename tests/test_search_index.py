@@ -0,0 +1,39 @@
+import os, sys, tempfile
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.data_model import DataModel
+from models.search_index import SearchIndex, prefix_distance
+
+assert prefix_distance('reprot', 'report', 1) == 1      # transposition
+assert prefix_distance('meet', 'meeting', 1) == 0       # prefix
+assert prefix_distance('xyz', 'report', 1) == 2         # over the limit
+
+tmp = tempfile.mkdtemp()
+m = DataModel(storage_path=os.path.join(tmp, 'tasks.json'))
+a = m.add_task({'title': 'Quarterly report', 'description': 'numbers for the board'})
+b = m.add_task({'title': 'Team meeting', 'description': 'weekly sync'})
+c = m.add_task('Buy groceries')
+
+assert m.search_ids('') is None
+assert m.search_ids('rep') == {a.id}                    # prefix
+assert m.search_ids('MEET week') == {b.id}              # all words, case-insensitive
+assert m.search_ids('reprot') == {a.id}                 # one typo
+assert m.search_ids('quartrely') == {a.id}
+assert m.search_ids('board meeting') == set()
+
+# the index follows adds, edits and removals without a rebuild
+d = m.add_task('Prepare board slides')
+assert m.search_ids('board') == {a.id, d.id}
+m.update_task(c.id, title='Buy snacks for meeting')
+assert m.search_ids('meet') == {b.id, c.id}
+assert m.search_ids('groceries') == set()
+m.remove_by_id(b.id)
+assert m.search_ids('meet') == {c.id}
+print('search:', [t.title for t in m.search_tasks('board')])
+m.clear_tasks()
+assert m.search_ids('board') == set()
+
+# the index can be built on its own from any task objects
+idx = SearchIndex([a, d])
+assert idx.search('slid') == {d.id}
+print('search index test ok')
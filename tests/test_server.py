@@ -0,0 +1,172 @@
+import http.client
+import json
+import os
+import socket
+import sys
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from models.data_model import DataModel
+from models.storage import JsonStorage
+from models.task import Task
+from server import ApiServer
+
+tmp = tempfile.mkdtemp()
+store = os.path.join(tmp, 'tasks.json')
+JsonStorage(store).save_all([Task(i, f'task {i}', '', f'2026-01-{i:02d}', 'High' if i % 2 else 'Low')
+                             for i in range(1, 26)])
+model = DataModel(storage_path=store)
+server = ApiServer(model, port=0, page_size=4)
+port = server.start_in_thread()
+
+# one keep-alive connection for every request below
+conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+
+
+def call(method, path, body=None):
+    payload = None if body is None else json.dumps(body)
+    conn.request(method, path, payload, {'Content-Type': 'application/json'} if payload else {})
+    resp = conn.getresponse()
+    data = resp.read()
+    return resp.status, (json.loads(data) if data else None), resp
+
+
+status, data, _ = call('GET', '/health')
+assert status == 200 and data == {'status': 'ok'}
+
+# listings are streamed in chunks (page_size=4 -> several chunks) but are one JSON array
+status, data, resp = call('GET', '/tasks')
+assert status == 200 and resp.getheader('Transfer-Encoding') == 'chunked'
+assert [t['id'] for t in data] == list(range(1, 26))
+status, data, _ = call('GET', '/tasks?offset=20&limit=10')
+assert [t['id'] for t in data] == [21, 22, 23, 24, 25]
+status, data, _ = call('GET', '/tasks?order_by=deadline&reverse=true&limit=2')
+assert [t['id'] for t in data] == [25, 24]
+status, data, _ = call('GET', '/tasks?limit=0')
+assert status == 200 and data == []
+
+status, data, _ = call('GET', '/tasks/query?priority=High&due_before=2026-01-06')
+assert [t['id'] for t in data] == [1, 3, 5]
+status, data, _ = call('GET', '/tasks/query?search=task%2012')
+assert [t['id'] for t in data] == [12]
+status, data, _ = call('GET', '/tasks/count')
+assert data == {'count': 25}
+
+# writes
+status, data, _ = call('POST', '/tasks', {'title': 'from the api', 'priority': 'High'})
+assert status == 201 and data['title'] == 'from the api' and data['id'] == 26
+status, data, _ = call('POST', '/tasks', ['one', {'title': 'two'}])
+assert status == 201 and [t['id'] for t in data] == [27, 28]
+status, data, _ = call('POST', '/tasks/3/toggle')
+assert status == 200 and data['completed'] is True
+assert model.get_task_by_id(3).completed
+status, data, _ = call('DELETE', '/tasks/4')
+assert status == 204 and data is None and model.get_task_by_id(4) is None
+status, data, _ = call('GET', '/tasks/count?completed=true')
+assert data == {'count': 1}
+
+# errors keep the connection usable
+assert call('GET', '/tasks/4')[0] == 404
+assert call('DELETE', '/tasks/4')[0] == 404
+assert call('POST', '/tasks', {'title': '  '})[0] == 400
+assert call('GET', '/tasks?order_by=colour')[0] == 400
+assert call('GET', '/tasks?limit=x')[0] == 400
+assert call('PUT', '/tasks')[0] == 405
+assert call('GET', '/nowhere')[0] == 404
+status, data, _ = call('GET', '/tasks/1')
+assert status == 200 and data['title'] == 'task 1'
+
+# malformed JSON body
+conn.request('POST', '/tasks', '{nope', {'Content-Type': 'application/json'})
+resp = conn.getresponse()
+assert resp.status == 400 and 'JSON' in json.loads(resp.read())['error']
+conn.close()
+
+# HTTP/1.0 without keep-alive: the server closes after one response
+with socket.create_connection(('127.0.0.1', port), timeout=5) as s:
+    s.sendall(b'GET /health HTTP/1.0\r\n\r\n')
+    raw = b''
+    while chunk := s.recv(4096):
+        raw += chunk
+assert raw.startswith(b'HTTP/1.1 200') and b'Connection: close' in raw
+
+# a listing that fails after its head went out is cut off, not followed by a 500
+listing = server._list
+
+
+def failing_list(params):
+    # the second page (page_size=4) cannot be encoded
+    return [dict(t, title=object()) if t['id'] == 6 else t for t in listing(params)]
+
+
+server._list = failing_list
+try:
+    with socket.create_connection(('127.0.0.1', port), timeout=5) as s:
+        s.sendall(b'GET /tasks HTTP/1.1\r\nHost: x\r\n\r\n')
+        raw = b''
+        while chunk := s.recv(4096):
+            raw += chunk
+    assert raw.startswith(b'HTTP/1.1 200') and raw.count(b'HTTP/1.1') == 1, raw
+    assert not raw.endswith(b'0\r\n\r\n')   # no terminating chunk: the client sees it truncated
+    assert call('GET', '/tasks/7')[0] == 200  # other connections are unaffected
+finally:
+    del server._list
+conn.close()
+
+server.stop()
+model.close()
+assert len(JsonStorage(store).load()) == 27
+
+# next to the GUI: the server runs on its own thread, model calls run on the Qt thread
+import threading
+from PyQt6.QtCore import QCoreApplication
+from server import QtGateway
+
+app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+import server as server_module
+model = DataModel(storage_path=store, columnar=True)
+threads = []
+model.task_added.connect(lambda task: threads.append(threading.current_thread()))
+encode = server_module.task_json
+encoded_on = set()
+
+
+def recording_task_json(task):
+    encoded_on.add(threading.current_thread())
+    return encode(task)
+
+
+server_module.task_json = recording_task_json
+server = ApiServer(model, port=0, gateway=QtGateway())
+port = server.start_in_thread()
+results = []
+
+
+def client():
+    c = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    c.request('POST', '/tasks', json.dumps('added via Qt'))
+    resp = c.getresponse()
+    resp.read()
+    results.append(resp.status)
+    # listings are copied out of the (columnar) model on the GUI thread
+    c.request('GET', '/tasks')
+    resp = c.getresponse()
+    results.append((resp.status, len(json.loads(resp.read()))))
+    c.request('GET', '/tasks/1')
+    results.append(json.loads(c.getresponse().read())['title'])
+    c.close()
+
+
+worker = threading.Thread(target=client)
+worker.start()
+while worker.is_alive():
+    app.processEvents()
+    worker.join(0.01)
+assert results == [201, (200, 28), 'task 1'] and threads == [threading.main_thread()], (results, threads)
+assert encoded_on == {threading.main_thread()}, encoded_on
+server_module.task_json = encode
+server.stop()
+model.close()
+print('server OK')
@@ -0,0 +1,63 @@
+import os, sys, tempfile
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.data_model import DataModel
+
+tmp = tempfile.mkdtemp()
+m = DataModel(storage_path=os.path.join(tmp, 'tasks.json'))
+a = m.add_task({'title': 'a', 'deadline': '2026-03-01', 'priority': 'Low'})
+b = m.add_task({'title': 'b', 'deadline': '2026-01-15', 'priority': 'High'})
+c = m.add_task({'title': 'c', 'priority': 'Normal'})              # no deadline
+d = m.add_task({'title': 'd', 'deadline': '2025-12-31', 'priority': 'High'})
+
+def titles(tasks):
+    return [t.title for t in tasks]
+
+assert titles(m.get_sorted_tasks('deadline')) == ['d', 'b', 'a', 'c']   # undated last
+assert titles(m.get_sorted_tasks('priority')) == ['b', 'd', 'c', 'a']   # ties in id order
+assert titles(m.get_sorted_tasks('created_at')) == ['a', 'b', 'c', 'd']
+assert titles(m.get_sorted_tasks('deadline', reverse=True, limit=2)) == ['c', 'a']
+assert m.sort_position('deadline', a.id) == 2
+
+# due soonest / overdue skip completed tasks
+m.toggle_by_id(d.id)
+assert titles(m.due_soonest(2)) == ['b', 'a']
+assert titles(m.due_soonest(1, include_completed=True)) == ['d']
+assert titles(m.overdue(today='2026-02-01')) == ['b']
+
+# indexes follow edits, removals and clears incrementally
+m.update_task(a.id, deadline='2026-01-01')
+assert titles(m.get_sorted_tasks('deadline')) == ['d', 'a', 'b', 'c']
+e = m.add_task({'title': 'e', 'deadline': '2025-06-01'})
+assert m.sort_position('deadline', e.id) == 0
+m.remove_by_id(b.id)
+assert titles(m.get_sorted_tasks('deadline')) == ['e', 'd', 'a', 'c']
+print('sorted:', titles(m.get_sorted_tasks('priority')))
+m.clear_tasks()
+assert m.get_sorted_tasks('deadline') == [] and m.overdue() == []
+
+# after the clear: many completed tasks due first, pending ones still one index range
+done = m.add_tasks([{'title': f'done {i}', 'deadline': f'2024-01-{i % 28 + 1:02d}'} for i in range(2000)])
+m.set_completed([t.id for t in done])
+p = m.add_task({'title': 'pending late', 'deadline': '2027-01-01'})
+q = m.add_task({'title': 'pending early', 'deadline': '2024-06-01'})
+assert titles(m.due_soonest(5)) == ['pending early', 'pending late']
+assert titles(m.overdue(today='2026-01-01')) == ['pending early']
+m.toggle_by_id(q.id)
+m.toggle_by_id(done[0].id)       # pending again
+assert titles(m.due_soonest(2)) == ['done 0', 'pending late']
+m.update_task(done[0].id, completed=True)
+assert m.overdue(today='2026-01-01') == []
+assert titles(m.due_soonest(1, include_completed=True)) == ['done 0']
+try:
+    m.get_sorted_tasks('pending_deadline')   # internal index, not an order_by value
+    raise AssertionError('expected ValueError')
+except ValueError:
+    pass
+
+try:
+    m.get_sorted_tasks('title')
+    raise AssertionError('expected ValueError')
+except ValueError:
+    pass
+print('sorted index test ok')
@@ -0,0 +1,69 @@
+import json, os, sys, tempfile
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.data_model import DataModel
+from models.sqlite_storage import SQLiteStorage
+
+tmp = tempfile.mkdtemp()
+json_path = os.path.join(tmp, 'tasks.json')
+db_path = os.path.join(tmp, 'tasks.db')
+with open(json_path, 'w', encoding='utf-8') as f:
+    json.dump([
+        {'id': 3, 'title': 'legacy', 'priority': 'High', 'deadline': '2026-01-01'},
+        {'id': 7, 'title': 'old done', 'completed': True},
+    ], f)
+
+# first open migrates the existing tasks.json
+m = DataModel(storage=SQLiteStorage(db_path, migrate_from=json_path))
+print('migrated:', [t.to_dict() for t in m.get_tasks()])
+assert [t.id for t in m.get_tasks()] == [3, 7]
+t = m.add_task({'title': 'new', 'priority': 'Low', 'deadline': '2025-06-01'})
+assert t.id == 8
+m.toggle_task_completed(0)
+m.remove_task_by_index(1)
+print('pending:', m.count_tasks(completed=False), 'done:', m.count_tasks(completed=True))
+assert m.count_tasks(completed=True) == 1
+assert [t.title for t in m.query_tasks(deadline_before='2025-12-31')] == ['new']
+# query results are the model's tasks, not copies read back from the database
+found = m.query_tasks(completed=False)
+assert found == [t] and found[0] is m.get_task_by_id(t.id)
+m.close()
+
+# reopen: no second migration, single-row updates persisted
+m2 = DataModel(storage=SQLiteStorage(db_path, migrate_from=json_path))
+tasks = m2.get_tasks()
+print('reloaded:', [(t.id, t.title, t.completed) for t in tasks])
+assert [(t.id, t.completed) for t in tasks] == [(3, True), (8, False)]
+m2.close()
+
+# a load streamed on a worker thread while this thread keeps writing and counting
+import threading
+from models.task import Task
+big = SQLiteStorage(os.path.join(tmp, 'big.db'))
+big.save_all([Task(i, f'task {i}') for i in range(1, 5001)])
+loaded, errors = [], []
+
+
+def reader():
+    try:
+        for chunk, _progress in big.iter_load(chunk_size=50):
+            loaded.extend(chunk)
+    except Exception as e:
+        errors.append(e)
+
+
+worker = threading.Thread(target=reader)
+# the worker reads through its own connection, so it never waits on the
+# shared one (held here for the whole load)
+with big._lock:
+    worker.start()
+    i = 5001
+    while worker.is_alive():
+        big.task_added(Task(i, f'task {i}'), [])
+        assert big.count([]) == i
+        i += 1
+    worker.join(10)
+assert not errors, errors
+assert [t.id for t in loaded[:5000]] == list(range(1, 5001))
+big.close()
+print('sqlite test ok')
@@ -0,0 +1,60 @@
+import logging
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from utils import logging_qt
+from utils.logging_qt import QtHandler
+from views.task_view import TaskView
+
+handler = QtHandler(logging.INFO, max_pending=100)
+handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+log = logging.getLogger('test_status_pane')
+log.propagate = False
+log.setLevel(logging.DEBUG)
+log.addHandler(handler)
+
+# records flushed before the (lazily built) task page exists are held for its pane
+log.info('before the pane')
+app.processEvents()
+view = TaskView()
+pane = view.status_text
+assert pane.toPlainText() == ''
+logging_qt.connect_to_textedit(pane)
+assert pane.toPlainText() == 'INFO before the pane', pane.toPlainText()
+batches = []
+logging_qt._emitter.log.connect(batches.append)
+
+# records logged during one event-loop pass arrive as a single batch
+for i in range(50):
+    log.info('line %d', i)
+log.debug('hidden')  # below the handler level
+assert batches == [], 'delivery must wait for the event loop'
+app.processEvents()
+assert len(batches) == 1, len(batches)
+assert batches[0].count('\n') == 49 and 'hidden' not in batches[0]
+
+# a storm beyond the buffer keeps the newest lines behind a marker
+batches.clear()
+for i in range(250):
+    log.warning('storm %d', i)
+app.processEvents()
+assert len(batches) == 1
+lines = batches[0].split('\n')
+assert lines[0] == '... 150 messages suppressed', lines[0]
+assert lines[1] == 'WARNING storm 150' and lines[-1] == 'WARNING storm 249'
+
+# the pane itself is bounded: only the newest STATUS_MAX_LINES blocks remain
+for i in range(TaskView.STATUS_MAX_LINES * 2):
+    view.append_status(f'status {i}')
+assert pane.document().blockCount() == TaskView.STATUS_MAX_LINES, pane.document().blockCount()
+assert pane.toPlainText().endswith(f'status {TaskView.STATUS_MAX_LINES * 2 - 1}')
+
+print('status pane OK')
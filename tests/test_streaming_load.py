@@ -0,0 +1,21 @@
+import json, os, sys, tempfile
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.storage import JsonStorage
+from models.streaming import iter_json_array
+
+tmp = tempfile.mkdtemp()
+path = os.path.join(tmp, 'tasks.json')
+records = [{'id': i, 'title': f'task {i}', 'description': 'ünïcödé ' * 20} for i in range(1, 2501)]
+with open(path, 'w', encoding='utf-8') as f:
+    json.dump(records, f, ensure_ascii=False, indent=2)
+
+# tiny read size forces elements to straddle buffer boundaries
+parsed = [d for d, done, total in iter_json_array(path, read_size=97)]
+assert parsed == records
+
+chunks = list(JsonStorage(path).iter_load(chunk_size=1000))
+print('chunk sizes:', [len(c) for c, p in chunks], 'progress:', [round(p, 2) for c, p in chunks])
+assert [len(c) for c, p in chunks] == [1000, 1000, 500] and chunks[-1][1] == 1.0
+assert [t.id for c, p in chunks for t in c] == list(range(1, 2501))
+print('streaming load test ok')
@@ -0,0 +1,23 @@
+import os, sys, tempfile
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.data_model import DataModel
+
+tmp = tempfile.mkdtemp()
+m = DataModel(storage_path=os.path.join(tmp, 'tasks.json'))
+a = m.add_task('a')
+b = m.add_task('b')
+c = m.add_task('c')
+
+# ids stay valid after an earlier task is removed
+assert m.remove_by_id(a.id)
+assert m.get_task_by_id(c.id) is c
+assert m.toggle_by_id(c.id).completed
+assert not m.remove_by_id(a.id)
+assert m.toggle_by_id(a.id) is None
+print('remaining:', [(t.id, t.title, t.completed) for t in m.get_tasks()])
+assert [t.id for t in m.get_tasks()] == [b.id, c.id]
+
+# positional API still works on top of the id index
+assert m.get_task(0) is b and m.get_task(-1) is c and m.get_task(5) is None
+print('task id test ok')
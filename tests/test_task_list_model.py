@@ -0,0 +1,87 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QStyleOptionViewItem
+
+from models.task import Task
+from views.task_list_model import (CompletedRole, TaskFilterProxy, TaskIdRole, TaskItemDelegate,
+                                   TaskListModel)
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def ids(model):
+    return [model.index(r, 0).data(TaskIdRole) for r in range(model.rowCount())]
+
+
+model = TaskListModel()
+events = []
+model.modelAboutToBeReset.connect(lambda: events.append('begin reset'))
+model.modelReset.connect(lambda: events.append('end reset'))
+model.rowsAboutToBeInserted.connect(lambda _p, a, b: events.append(('begin insert', a, b)))
+model.rowsInserted.connect(lambda _p, a, b: events.append(('end insert', a, b)))
+model.rowsAboutToBeRemoved.connect(lambda _p, a, b: events.append(('begin remove', a, b)))
+model.rowsRemoved.connect(lambda _p, a, b: events.append(('end remove', a, b)))
+model.dataChanged.connect(lambda a, b, _roles: events.append(('changed', a.row(), b.row())))
+
+pending = TaskFilterProxy(completed=False)
+pending.setSourceModel(model)
+done = TaskFilterProxy(completed=True)
+done.setSourceModel(model)
+
+# reset: one begin/end pair, rows read from the tasks given
+tasks = [Task(1, 'one'), Task(2, 'two', priority='High', deadline='2026-01-01'), Task(3, 'three', completed=True)]
+model.reset_tasks(tasks)
+assert events == ['begin reset', 'end reset']
+assert ids(model) == [1, 2, 3] and model.rowCount() == 3
+assert model.index(1, 0).data() == 'two (High) [2026-01-01]'
+assert model.index(2, 0).data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+assert model.index(2, 0).data(CompletedRole) is True
+assert ids(pending) == [1, 2] and ids(done) == [3]
+
+# add, remove and update go through the row signals, not a reset
+events.clear()
+model.insert_task(Task(4, 'four'))
+assert events == [('begin insert', 3, 3), ('end insert', 3, 3)]
+assert ids(pending) == [1, 2, 4]
+events.clear()
+model.insert_tasks([Task(5, 'five'), Task(6, 'six', completed=True)])
+assert events == [('begin insert', 4, 5), ('end insert', 4, 5)]
+assert ids(pending) == [1, 2, 4, 5] and ids(done) == [3, 6]
+events.clear()
+model.remove_task(2)
+assert events == [('begin remove', 1, 1), ('end remove', 1, 1)]
+assert ids(model) == [1, 3, 4, 5, 6] and model.row_of(5) == 3
+events.clear()
+model.remove_task(99)            # unknown ids are ignored
+assert events == []
+first = model.task_at(0)
+first.completed = True
+model.update_task(first)
+assert events == [('changed', 0, 0)]
+# the proxies re-filter the changed row: it moves from Pending to Done
+assert ids(pending) == [4, 5] and ids(done) == [1, 3, 6]
+
+# ticking a checkbox only asks for the toggle; the model changes on update_task
+requested = []
+model.toggle_requested.connect(requested.append)
+assert pending.setData(pending.index(0, 0), Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
+assert requested == [4] and ids(pending) == [4, 5]
+assert model.setData(model.index(0, 0), Qt.CheckState.Unchecked, Qt.ItemDataRole.CheckStateRole)
+assert requested == [4, 1]
+assert not model.setData(model.index(0, 0), 'x', Qt.ItemDataRole.EditRole)
+
+# the delegate strikes out completed rows only
+delegate = TaskItemDelegate()
+option = QStyleOptionViewItem()
+delegate.initStyleOption(option, done.index(0, 0))
+assert option.font.strikeOut()
+option = QStyleOptionViewItem()
+delegate.initStyleOption(option, pending.index(0, 0))
+assert not option.font.strikeOut()
+print('task list model OK')
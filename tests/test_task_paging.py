@@ -0,0 +1,70 @@
+import os, sys, tempfile
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.data_model import DataModel
+from views.task_list_model import TaskListModel
+
+tmp = tempfile.mkdtemp()
+m = DataModel(storage_path=os.path.join(tmp, 'tasks.json'))
+m.add_tasks([{'title': f't{i}', 'deadline': f'2026-01-{30 - i:02d}'} for i in range(25)])
+m.set_completed([1, 2, 3])
+
+# windows over model order, filtered and sorted views
+assert [t.id for t in m.get_tasks(5, 3)] == [6, 7, 8]
+assert [t.id for t in m.get_tasks(0, 2, completed=True)] == [1, 2]
+assert [t.id for t in m.get_tasks(1, 2, completed=False)] == [5, 6]
+assert [t.id for t in m.get_tasks(0, 3, order_by='deadline')] == [25, 24, 23]
+assert [t.id for t in m.get_tasks(0, 2, reverse=True)] == [25, 24]
+assert len(m.get_tasks()) == m.count_tasks() == 25
+assert m.get_tasks(30, 10) == []
+
+# the list model only holds the pages fetched so far
+fetched = []
+def fetch(offset, limit):
+    fetched.append((offset, limit))
+    return m.get_tasks(offset, limit)
+lm = TaskListModel()
+lm.page_size = 10
+lm.reset_tasks(m.get_tasks(0, 10), m.get_task_count(), fetch)
+assert lm.rowCount() == 10 and lm.canFetchMore()
+lm.fetchMore()
+assert lm.rowCount() == 20 and fetched == [(10, 10)]
+
+# changes in the unfetched tail only move the total
+t = m.add_task('late')
+lm.insert_task(t)
+assert lm.rowCount() == 20
+m.remove_by_id(24)
+lm.remove_task(24)
+lm.fetchMore()
+print('rows:', lm.rowCount(), 'fetched:', fetched)
+assert [lm.task_at(r).id for r in range(20, lm.rowCount())] == [21, 22, 23, 25, 26]
+assert not lm.canFetchMore()
+
+# once everything is loaded, new tasks are appended directly
+t2 = m.add_task('later')
+lm.insert_task(t2)
+assert lm.task_at(lm.rowCount() - 1).id == t2.id
+print('paging test ok')
+
+# while searching, the total counts matches only: removing a non-match leaves it alone
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+from controllers.task_controller import TaskController
+from views.task_view import TaskView
+app = QApplication.instance() or QApplication(sys.argv)
+m = DataModel(storage_path=os.path.join(tmp, 'search.json'))
+m.add_tasks([f'match {i}' for i in range(500)] + [f'other {i}' for i in range(10)])
+view = TaskView()
+controller = TaskController(m, view)
+controller.on_search('match')
+lm = view.task_model
+assert lm._total == 500 and lm.canFetchMore()
+m.remove_by_id(505)              # 'other 4': not a match
+assert lm._total == 500
+m.remove_by_id(450)              # a match in the unfetched tail
+assert lm._total == 499
+while lm.canFetchMore():
+    lm.fetchMore()
+assert lm.rowCount() == 499 and not lm.canFetchMore()
+print('search paging ok')
@@ -0,0 +1,53 @@
+import os, sys, tempfile, tracemalloc
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.data_model import DataModel
+from models.task import Task
+from models.task_store import TaskStore
+
+samples = [
+    Task(id=1, title='plain'),
+    Task(id=2, title='dated', deadline='2026-01-10', priority='High', completed=True),
+    Task(id=3, title='odd', deadline='next week', priority='Someday', created_at='yesterday'),
+    Task(id=4, title='naive', created_at='2026-01-03T02:48:17.894228', deadline=None),
+]
+store = TaskStore(samples)
+for t in samples:
+    assert store[t.id].to_dict() == t.to_dict(), (store[t.id].to_dict(), t.to_dict())
+store[2].completed = False
+assert store.get(2).completed is False
+removed = store.pop(1)
+assert removed.title == 'plain' and 1 not in store
+assert [t.id for t in store.values()] == [2, 3, 4]
+
+# compaction after many removals keeps the remaining rows intact
+big = TaskStore(Task(id=i, title=f't{i % 10}') for i in range(1, 5001))
+for i in range(1, 4001):
+    big.pop(i)
+assert len(big) == 1000 and big[4500].title == 't0' and big._dead < 4000
+
+# memory: columnar store vs. plain Task objects
+tracemalloc.start()
+objs = {i: Task(id=i, title=f'task {i % 100}', deadline='2026-02-01', created_at='2026-01-03T02:48:17.894228+00:00') for i in range(20000)}
+plain = tracemalloc.get_traced_memory()[0]
+del objs
+tracemalloc.reset_peak()
+base = tracemalloc.get_traced_memory()[0]
+compact = TaskStore(Task(id=i, title=f'task {i % 100}', deadline='2026-02-01', created_at='2026-01-03T02:48:17.894228+00:00') for i in range(20000))
+columnar = tracemalloc.get_traced_memory()[0] - base
+tracemalloc.stop()
+print(f'bytes/task: plain={plain / 20000:.0f} columnar={columnar / 20000:.0f}')
+assert columnar < plain
+
+# DataModel in columnar mode
+tmp = tempfile.mkdtemp()
+m = DataModel(storage_path=os.path.join(tmp, 'tasks.json'), columnar=True)
+a = m.add_task({'title': 'x', 'deadline': '2026-03-01', 'priority': 'Low'})
+m.toggle_by_id(a.id)
+assert m.get_task_by_id(a.id).completed and a.completed
+m.add_tasks(['y', 'z'])
+m.remove_by_id(a.id)
+assert [t.title for t in m.get_tasks()] == ['y', 'z']
+reloaded = DataModel(storage_path=os.path.join(tmp, 'tasks.json'), columnar=True)
+assert [t.to_dict() for t in reloaded.get_tasks()] == [t.to_dict() for t in m.get_tasks()]
+print('task store test ok')
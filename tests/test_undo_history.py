@@ -0,0 +1,168 @@
+import json
+import os
+import random
+import sys
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+
+from controllers.task_controller import TaskController
+from models.binary_storage import BinaryStorage
+from models.data_model import DataModel
+from models.history import AddTask, ClearTasks, Command, RemoveTask, UndoHistory
+from models.sqlite_storage import SQLiteStorage
+from models.storage import JsonStorage
+from models.task import Task
+from views.task_view import TaskView
+
+app = QApplication.instance() or QApplication(sys.argv)
+tmp = tempfile.mkdtemp()
+path = os.path.join(tmp, 'tasks.json')
+JsonStorage(path).save_all([Task(i, f'task {i}') for i in range(1, 6)])
+
+
+def ids(model):
+    return [t.id for t in model.get_tasks()]
+
+
+def stored_ids():
+    with open(path, encoding='utf-8') as f:
+        return [d['id'] for d in json.load(f)]
+
+
+model = DataModel(storage_path=path)
+view = TaskView()
+controller = TaskController(model, view)
+
+# add -> undo -> redo brings back the same id
+controller.on_add_task('six')
+assert ids(model) == [1, 2, 3, 4, 5, 6]
+controller.on_undo()
+assert ids(model) == [1, 2, 3, 4, 5] and stored_ids() == [1, 2, 3, 4, 5]
+controller.on_redo()
+assert ids(model) == [1, 2, 3, 4, 5, 6] and model.get_task_by_id(6).title == 'six'
+
+# remove -> undo puts the task back where it was, in the view too
+controller.on_remove_task(3)
+assert ids(model) == [1, 2, 4, 5, 6]
+controller.on_undo()
+assert ids(model) == [1, 2, 3, 4, 5, 6] and stored_ids() == [1, 2, 3, 4, 5, 6]
+assert view.task_model.row_of(3) is not None
+assert model.search_tasks('task 3')[0].id == 3
+
+# toggle -> undo -> redo
+controller.on_toggle_task(2)
+assert model.get_task_by_id(2).completed
+controller.on_undo()
+assert not model.get_task_by_id(2).completed
+controller.on_redo()
+assert model.get_task_by_id(2).completed
+
+# clear keeps a reference to the old container instead of a copy
+before = model._tasks
+controller.on_clear_requested()
+assert ids(model) == [] and stored_ids() == []
+assert controller.history._undo[-1].previous is before
+controller.on_undo()
+assert model._tasks is before and ids(model) == [1, 2, 3, 4, 5, 6] and stored_ids() == [1, 2, 3, 4, 5, 6]
+assert model.get_sorted_tasks('created_at')  # indexes rebuilt on use
+controller.on_redo()
+assert ids(model) == []
+controller.on_undo()
+assert ids(model) == [1, 2, 3, 4, 5, 6]
+
+# a new action drops the redo side; undoing past the start is reported, not an error
+controller.on_undo()                  # the toggle
+assert controller.history.can_redo()
+controller.on_add_task('seven')
+assert not controller.history.can_redo()
+for _ in range(10):
+    controller.on_undo()
+assert ids(model) == [1, 2, 3, 4, 5]
+assert 'Nothing to undo' in view.status_text.toPlainText()
+
+# standard shortcuts on the task view
+view.show()
+view.activateWindow()
+QApplication.processEvents()
+QTest.keyClick(view.pending_list, Qt.Key.Key_Y, Qt.KeyboardModifier.ControlModifier)
+assert ids(model) == [1, 2, 3, 4, 5, 6]
+QTest.keyClick(view.pending_list, Qt.Key.Key_Z, Qt.KeyboardModifier.ControlModifier)
+assert ids(model) == [1, 2, 3, 4, 5]
+view.close()
+model.close()
+
+# the history is bounded by memory, not by a number of steps
+history = UndoHistory(max_bytes=10_000)
+for i in range(1000):
+    history.push(AddTask(Task(i, f'task {i}', 'x' * 100)))
+assert history.nbytes <= 10_000 and 10 < len(history._undo) < 1000
+history = UndoHistory(max_bytes=1)
+history.push(AddTask(Task(1, 'big')))
+assert len(history._undo) == 1  # the latest change is always undoable
+
+# a clear's size follows what it holds across undo/redo
+model = DataModel(storage_path=os.path.join(tmp, 'sizes.json'))
+model.add_tasks([f'task {i}' for i in range(200)])
+history = UndoHistory()
+history.push(ClearTasks(model.clear_tasks()))
+held = history.nbytes
+history.undo(model)
+assert history.nbytes == sum(c.nbytes for c in history._redo) < held
+history.redo(model)
+assert history.nbytes == sum(c.nbytes for c in history._undo) == held
+history.max_bytes = held - 1
+history.push(AddTask(model.add_task('after')))   # over the limit: the clear goes
+assert list(history._undo) and history.nbytes == sum(c.nbytes for c in history._undo) < held
+model.close()
+
+# columnar models: commands keep detached copies, not views onto rows
+model = DataModel(storage_path=path, columnar=True)
+history = UndoHistory()
+history.push(RemoveTask(model.get_task_by_id(2)))
+model.remove_by_id(2)
+model.add_task('reuses the row')
+history.undo(model)
+assert model.get_task_by_id(2).title == 'task 2' and ids(model)[:3] == [1, 2, 3]
+# a clear holds the swapped-out TaskStore, sized by the store itself
+before = ids(model)
+history.push(ClearTasks(model.clear_tasks()))
+held = history.nbytes
+assert isinstance(held, int) and held > Command.nbytes
+history.undo(model)
+assert ids(model) == before and history.nbytes < held
+history.redo(model)
+assert ids(model) == [] and history.nbytes == held
+history.undo(model)
+assert ids(model) == before
+model.close()
+
+# incremental backends: undone removals are saved in their restored order
+for name, make in (('journal', lambda p: DataModel(storage_path=p, journal=True)),
+                   ('sqlite', lambda p: DataModel(storage=SQLiteStorage(p))),
+                   ('binary', lambda p: DataModel(storage=BinaryStorage(p)))):
+    store = os.path.join(tmp, f'undo.{name}')
+    model = make(store)
+    model.add_tasks([f'task {i}' for i in range(30)])
+    history = UndoHistory()
+    rng = random.Random(7)
+    for _ in range(60):
+        live = ids(model)
+        if history.can_undo() and rng.random() < 0.4:
+            history.undo(model)
+        elif live:
+            task = model.get_task_by_id(rng.choice(live))
+            history.push(RemoveTask(task))
+            model.remove_by_id(task.id)
+    expected = ids(model)
+    model.close()
+    model = make(store)
+    assert ids(model) == expected, (name, ids(model), expected)
+    model.close()
+print('undo history OK')
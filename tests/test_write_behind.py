@@ -0,0 +1,24 @@
+import json, os, sys, tempfile
+# ensure project root is on sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.data_model import DataModel
+
+tmp = tempfile.mkdtemp()
+path = os.path.join(tmp, 'tasks.json')
+
+m = DataModel(storage_path=path, write_behind=True, save_window=0.2)
+for i in range(20):
+    m.add_task(f'burst {i}')
+for i in range(20):
+    m.toggle_task_completed(i)
+m.flush()
+stats = m.save_stats
+print('stats:', stats)
+assert stats.mutations == 40 and stats.saves < 40
+
+with open(path, 'r', encoding='utf-8') as f:
+    on_disk = json.load(f)
+assert len(on_disk) == 20 and all(d['completed'] for d in on_disk)
+assert not os.path.exists(path + '.tmp')
+m.close()
+print('write-behind test ok')
@@ -1,26 +1,107 @@
+"""
+Qt logging integration - delivers log records to a status pane in batches.
+
+QtHandler only formats records into a bounded buffer; the first record after
+a flush schedules one queued flush on the GUI thread, which hands everything
+buffered since then to the pane as a single append. Under a log storm the
+oldest buffered lines are dropped and replaced by an "N messages suppressed"
+marker, so neither the buffer nor the event loop can be flooded. Batches
+flushed before any status pane is connected (the task page is built lazily)
+are held, bounded the same way, and handed to the first pane that connects.
+"""
 import logging
-from PyQt6.QtCore import QObject, pyqtSignal
+import threading
+from collections import deque
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
 
 
 class QtLogEmitter(QObject):
-    log = pyqtSignal(str)
+    log = pyqtSignal(str)  # one or more formatted lines, newline separated
 
 
 _emitter = QtLogEmitter()
 
+# lines flushed while no pane was connected yet (GUI thread only)
+_HELD_MAX = 1000
+_held: deque[str] = deque(maxlen=_HELD_MAX)
+_held_dropped = 0
+_panes = 0
 
-class QtHandler(logging.Handler):
-    def __init__(self):
+
+def _deliver(lines: list[str]) -> None:
+    global _held_dropped
+    if _panes:
+        _emitter.log.emit("\n".join(lines))
+        return
+    _held_dropped += max(0, len(_held) + len(lines) - _HELD_MAX)
+    _held.extend(lines)
+
+
+class _Batcher(QObject):
+    # emitted (from any thread) when the buffer goes from empty to non-empty
+    pending = pyqtSignal()
+
+    def __init__(self, flush):
         super().__init__()
+        self._flush = flush
+        # queued even when emitted on the GUI thread: the flush runs on the
+        # next event-loop pass, once, no matter how many records arrived
+        self.pending.connect(self._on_pending, Qt.ConnectionType.QueuedConnection)
+
+    def _on_pending(self):
+        self._flush()
+
+
+class QtHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET, max_pending: int = 1000):
+        super().__init__(level)
+        self._lines: deque[str] = deque(maxlen=max_pending)
+        self._dropped = 0
+        self._scheduled = False
+        self._buffer_lock = threading.Lock()
+        # created on the GUI thread, so its queued slot runs flush_pending() there
+        self._batcher = _Batcher(self.flush_pending)
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
             msg = self.format(record)
-            _emitter.log.emit(msg)
+            with self._buffer_lock:
+                if len(self._lines) == self._lines.maxlen:
+                    self._dropped += 1  # deque drops the oldest line
+                self._lines.append(msg)
+                schedule = not self._scheduled
+                self._scheduled = True
+            if schedule:
+                self._batcher.pending.emit()
         except Exception:
             pass
 
+    def flush_pending(self) -> None:
+        """Deliver everything buffered so far as one batch (GUI thread)."""
+        with self._buffer_lock:
+            lines = list(self._lines)
+            dropped = self._dropped
+            self._lines.clear()
+            self._dropped = 0
+            self._scheduled = False
+        if dropped:
+            lines.insert(0, f"... {dropped} messages suppressed")
+        if lines:
+            _deliver(lines)
 
-def connect_to_textedit(textedit):
-    _emitter.log.connect(textedit.append)
 
+def connect_to_textedit(textedit):
+    """Show log batches in `textedit`, starting with those logged before it existed (GUI thread)."""
+    global _panes, _held_dropped
+    # QPlainTextEdit appends a batch as plain blocks (trimmed by its maximum block count)
+    append = getattr(textedit, 'appendPlainText', None) or textedit.append
+    _emitter.log.connect(append)
+    _panes += 1
+    lines = list(_held)
+    if _held_dropped:
+        lines.insert(0, f"... {_held_dropped} messages suppressed")
+    _held.clear()
+    _held_dropped = 0
+    if lines:
+        _emitter.log.emit("\n".join(lines))
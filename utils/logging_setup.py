@@ -0,0 +1,88 @@
+"""
+Logging setup - one QueueHandler on the root logger, real handlers on a thread.
+
+Logging calls on the GUI thread only put the record on a queue. A
+QueueListener thread then formats it and runs the file (with rotation),
+console and Qt handlers. The Qt handler emits a signal of an object living
+on the GUI thread, so Qt queues the delivery and the status pane is still
+only touched on the GUI thread.
+"""
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Iterable, Optional
+
+from .logging_qt import QtHandler
+
+
+FORMAT = '%(asctime)s %(levelname)s [%(name)s] %(message)s'
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def setup_logging(logs_dir: Optional[str] = None, level: int = logging.INFO,
+                  console: bool = True, qt: bool = True, qt_level: int = logging.INFO,
+                  extra_handlers: Iterable[logging.Handler] = ()) -> QueueListener:
+    """Route the root logger through a queue to file/console/Qt handlers.
+
+    Returns the started listener; call shutdown_logging() on exit so queued
+    records are written before the process ends. Calling it again replaces
+    the previous pipeline.
+    """
+    global _listener, _queue_handler
+    shutdown_logging()
+
+    formatter = logging.Formatter(FORMAT)
+    handlers: list[logging.Handler] = []
+    if logs_dir:
+        try:
+            os.makedirs(logs_dir, exist_ok=True)
+            fh = RotatingFileHandler(os.path.join(logs_dir, 'upacube.log'), maxBytes=5_000_000,
+                                     backupCount=3, encoding='utf-8')
+            handlers.append(fh)
+        except Exception:
+            logging.getLogger(__name__).exception('file logging unavailable')
+    if console:
+        handlers.append(logging.StreamHandler())
+    if qt:
+        # the status pane only shows qt_level and above, batched per event-loop pass
+        handlers.append(QtHandler(qt_level))
+    handlers.extend(extra_handlers)
+    for h in handlers:
+        if h.formatter is None:
+            h.setFormatter(formatter)
+
+    # unbounded: a burst of records must never block the GUI thread
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(records)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_queue_handler)
+
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    # the listener thread is a daemon; make sure queued records are written on any exit
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Detach the queue handler, drain the queue and close the handlers."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        listener, _listener = _listener, None
+        # stop() enqueues a sentinel and joins, so every earlier record is handled
+        listener.stop()
+        for h in listener.handlers:
+            try:
+                h.flush()
+                h.close()
+            except Exception:
+                pass
@@ -0,0 +1,67 @@
+"""
+Profiling helpers - whole-run cProfile and opt-in timing of controller slots.
+
+`run_profiled(fn, path)` runs fn (e.g. the Qt event loop) under cProfile and
+writes the stats on return. `timed_slot` wraps a slot; once
+`enable_slot_timing(threshold_ms)` has been called, every call slower than the
+threshold is logged. While timing is disabled the wrapper only checks a flag.
+"""
+import cProfile
+import functools
+import io
+import logging
+import pstats
+import time
+from typing import Any, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# threshold in ms, or None while slot timing is disabled
+_slot_threshold_ms: Optional[float] = None
+
+
+def enable_slot_timing(threshold_ms: float = 16.0) -> None:
+    """Log calls to @timed_slot functions that take longer than threshold_ms."""
+    global _slot_threshold_ms
+    _slot_threshold_ms = float(threshold_ms)
+
+
+def disable_slot_timing() -> None:
+    global _slot_threshold_ms
+    _slot_threshold_ms = None
+
+
+def timed_slot(fn: Callable) -> Callable:
+    """Decorator for slots: log the call if it exceeds the enabled threshold."""
+    name = fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        threshold = _slot_threshold_ms
+        if threshold is None:
+            return fn(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            if elapsed >= threshold:
+                logger.warning('slow slot %s took %.1f ms (threshold %.0f ms)', name, elapsed, threshold)
+
+    return wrapper
+
+
+def run_profiled(fn: Callable[[], Any], stats_path: str, top: int = 30) -> Any:
+    """Run fn() under cProfile, write the stats to stats_path and log the top entries."""
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(fn)
+    finally:
+        try:
+            profiler.dump_stats(stats_path)
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(top)
+            logger.info('profile written to %s (inspect with python -m pstats)\n%s', stats_path, out.getvalue())
+        except Exception:
+            logger.exception('could not write profile to %s', stats_path)
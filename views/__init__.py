@@ -2,8 +2,13 @@
 
 from .main_view import MainView
 from .home_view import HomeView
-from .task_view import TaskView
 
 __all__ = ['MainView', 'HomeView', 'TaskView']
 
 
+def __getattr__(name):
+    # TaskView (and its list model and dialog) is only imported when first used
+    if name == 'TaskView':
+        from .task_view import TaskView
+        return TaskView
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
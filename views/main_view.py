@@ -1,11 +1,15 @@
 """
 Main View - Application container with page navigation
+
+Only the home page is built up front. The task page (and the modules behind
+it) is imported and constructed on first navigation, so the first window
+paints as early as possible; `task_view_created` tells the coordinator when
+it exists, and `first_painted` fires once the window has been painted.
 """
 from PyQt6.QtWidgets import QMainWindow, QStackedWidget
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, QTimer
 
 from .home_view import HomeView
-from .task_view import TaskView
 
 
 class MainView(QMainWindow):
@@ -16,12 +20,18 @@ class MainView(QMainWindow):
 
     # Forward signals from TaskView for controller
     add_task_requested = pyqtSignal(object)   # payload: dict or title
-    toggle_task_requested = pyqtSignal(int)  # payload: index
-    remove_task_requested = pyqtSignal(int)  # payload: index
+    toggle_task_requested = pyqtSignal(int)  # payload: task id
+    remove_task_requested = pyqtSignal(int)  # payload: task id
     clear_requested = pyqtSignal()
+    search_requested = pyqtSignal(str)  # payload: query text
+    sort_requested = pyqtSignal(str)  # payload: order_by key, '' for insertion order
+    task_view_created = pyqtSignal(object)  # payload: the TaskView, built on first use
+    first_painted = pyqtSignal()  # emitted once, after the first paint of the window
 
     def __init__(self):
         super().__init__()
+        self._task_view = None
+        self._painted = False
         self.init_ui()
 
 
@@ -35,23 +45,12 @@ class MainView(QMainWindow):
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
 
-        # Create pages
+        # Create the home page now; the task page is built by the task_view property
         self.home_view = HomeView()
-        self.task_view = TaskView()
-
-        # Add pages to stack
         self.stacked_widget.addWidget(self.home_view)  # index 0
-        self.stacked_widget.addWidget(self.task_view)  # index 1
 
         # Connect navigation signals
         self.home_view.navigate_to_tasks.connect(self.show_task_view)
-        self.task_view.navigate_back.connect(self.show_home_view)
-
-        # Forward task view signals to controller
-        self.task_view.add_task_requested.connect(self.add_task_requested.emit)
-        self.task_view.toggle_task_requested.connect(self.toggle_task_requested.emit)
-        self.task_view.remove_task_requested.connect(self.remove_task_requested.emit)
-        self.task_view.clear_requested.connect(self.clear_requested.emit)
 
         # Start on home page
         self.show_home_view()
@@ -59,6 +58,39 @@ class MainView(QMainWindow):
         # Apply global theme
         self.apply_global_theme()
 
+    # --- Lazy pages ---------------------------------------------------
+    @property
+    def task_view(self):
+        """The task page, imported and constructed on first access."""
+        if self._task_view is None:
+            from .task_view import TaskView
+
+            task_view = TaskView()
+            self._task_view = task_view
+            self.stacked_widget.addWidget(task_view)  # index 1
+            task_view.navigate_back.connect(self.show_home_view)
+
+            # Forward task view signals to controller
+            task_view.add_task_requested.connect(self.add_task_requested.emit)
+            task_view.toggle_task_requested.connect(self.toggle_task_requested.emit)
+            task_view.remove_task_requested.connect(self.remove_task_requested.emit)
+            task_view.clear_requested.connect(self.clear_requested.emit)
+            task_view.search_requested.connect(self.search_requested.emit)
+            task_view.sort_requested.connect(self.sort_requested.emit)
+            self.task_view_created.emit(task_view)
+        return self._task_view
+
+    def has_task_view(self) -> bool:
+        """True once the task page has been built."""
+        return self._task_view is not None
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            # queued, so receivers run after this frame rather than inside paintEvent
+            QTimer.singleShot(0, self.first_painted.emit)
+
     # --- Navigation methods -------------------------------------------
     def show_home_view(self):
         """Switch to home page"""
@@ -73,6 +105,34 @@ class MainView(QMainWindow):
         """Forward to task view"""
         self.task_view.update_tasks(tasks)
 
+    def show_task_page(self, tasks, total: int, fetch_page):
+        """Forward to task view"""
+        self.task_view.show_task_page(tasks, total, fetch_page)
+
+    def add_task_item(self, task, row=None):
+        """Forward to task view"""
+        self.task_view.add_task_item(task, row)
+
+    def move_task_item(self, task, row: int):
+        """Forward to task view"""
+        self.task_view.move_task_item(task, row)
+
+    def remove_task_item(self, task_id: int):
+        """Forward to task view"""
+        self.task_view.remove_task_item(task_id)
+
+    def update_task_item(self, task):
+        """Forward to task view"""
+        self.task_view.update_task_item(task)
+
+    def add_task_items(self, tasks):
+        """Forward to task view"""
+        self.task_view.add_task_items(tasks)
+
+    def show_load_progress(self, fraction: float):
+        """Forward to task view"""
+        self.task_view.show_load_progress(fraction)
+
     def append_status(self, message):
         """Forward to task view"""
         self.task_view.append_status(message)
@@ -81,13 +141,13 @@ class MainView(QMainWindow):
         """Forward to task view"""
         self.task_view.clear_status()
 
-    def current_selected_index(self):
+    def current_selected_id(self):
         """Forward to task view"""
-        return self.task_view.current_selected_index()
+        return self.task_view.current_selected_id()
 
-    def select_index(self, index: int):
+    def select_id(self, task_id: int):
         """Forward to task view"""
-        self.task_view.select_index(index)
+        self.task_view.select_id(task_id)
 
     def clear_list(self):
         """Forward to task view"""
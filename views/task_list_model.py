@@ -0,0 +1,433 @@
+"""
+Task List Model - Qt item model adapter for displaying tasks in QListView.
+
+Rows are only materialized by the view when they become visible, tasks can be
+fetched page by page as the view scrolls (canFetchMore/fetchMore), and single
+task changes are reported with beginInsertRows/beginRemoveRows/dataChanged
+instead of rebuilding the list. A whole new list is applied with reconcile(),
+which diffs it against the current rows by task id, so selection and scroll
+position survive. Pending and Done are two filtered proxies over the same
+source model.
+"""
+from bisect import bisect_left
+
+from PyQt6.QtCore import (
+    QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt, pyqtSignal
+)
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QStyledItemDelegate
+
+
+# custom roles
+TaskIdRole = Qt.ItemDataRole.UserRole
+CompletedRole = Qt.ItemDataRole.UserRole + 1
+
+# shared colors (one instance each instead of one per item)
+_DONE_COLOR = QColor('#6c6c6c')
+_PRIORITY_COLORS = {
+    'high': QColor('#c0392b'),
+    'low': QColor('#27ae60'),
+}
+_NORMAL_COLOR = QColor('#2c3e50')
+
+
+def task_fields(t):
+    """Return (id, completed, title, description, deadline, priority) for a task."""
+    # support both dict-like and dataclass-like Task
+    if hasattr(t, "get"):
+        return (t.get('id'), t.get('completed'), t.get('title'), t.get('description', ''),
+                t.get('deadline'), t.get('priority', 'Normal'))
+    title = getattr(t, 'title', None)
+    if title is None:
+        # only now: formatting the whole object is far slower than the lookups
+        title = str(t)
+    return (getattr(t, 'id', None), getattr(t, 'completed', False), title,
+            getattr(t, 'description', ''), getattr(t, 'deadline', None), getattr(t, 'priority', 'Normal'))
+
+
+def task_state(t):
+    """Return (id, completed) for a task; cheaper than task_fields for filtering."""
+    if isinstance(t, dict):
+        return t.get('id'), t.get('completed')
+    return getattr(t, 'id', None), getattr(t, 'completed', False)
+
+
+def _runs(rows):
+    """Group ascending row numbers into (first, last) runs of consecutive rows."""
+    runs = []
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1][1] = row
+        else:
+            runs.append([row, row])
+    return runs
+
+
+def _increasing_subsequence(values) -> set:
+    """Indices of one longest strictly increasing subsequence of `values` (O(n log n))."""
+    tails, tail_idx, prev = [], [], [-1] * len(values)
+    for i, v in enumerate(values):
+        k = bisect_left(tails, v)
+        if k == len(tails):
+            tails.append(v)
+            tail_idx.append(i)
+        else:
+            tails[k] = v
+            tail_idx[k] = i
+        prev[i] = tail_idx[k - 1] if k else -1
+    keep = set()
+    i = tail_idx[-1] if tail_idx else -1
+    while i != -1:
+        keep.add(i)
+        i = prev[i]
+    return keep
+
+
+def task_label(title, deadline, priority) -> str:
+    # compact label: Title (Priority) [deadline]
+    label = title
+    if priority:
+        label += f" ({priority})"
+    if deadline:
+        label += f" [{deadline}]"
+    return label
+
+
+class TaskListModel(QAbstractListModel):
+    """
+    Flat list of tasks in model order. Holds references to the task objects it
+    is given and reads their fields on demand in data().
+    """
+
+    # emitted when the user ticks/unticks a checkbox; the change itself comes
+    # back from DataModel through update_task()
+    toggle_requested = pyqtSignal(int)  # payload: task id
+
+    page_size = 200
+    # reconcile() falls back to a reset beyond this many row moves / row runs
+    # inserted or removed: past that, one reset is cheaper for the views
+    max_moves = 64
+    max_runs = 256
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks: list = []
+        # paging: total number of tasks and a callback returning later pages
+        self._total = 0
+        self._fetch_page = None
+        # task id -> row, rebuilt lazily after removals shift rows
+        self._rows: dict = {}
+        self._rows_valid = True
+        # task id -> fields as last shown; task objects are mutated in
+        # place, so this is how reconcile() recognises changed rows
+        self._shown: dict = {}
+
+    # --- Qt model interface ------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._tasks)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        t = self._tasks[index.row()]
+        tid, completed, title, description, deadline, priority = task_fields(t)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return task_label(title, deadline, priority)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return description or None
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if completed else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.ForegroundRole:
+            # completed items are dim gray; pending ones colored by priority
+            if completed:
+                return _DONE_COLOR
+            return _PRIORITY_COLORS.get((priority or 'Normal').lower(), _NORMAL_COLOR)
+        if role == TaskIdRole:
+            return tid
+        if role == CompletedRole:
+            return bool(completed)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role == Qt.ItemDataRole.CheckStateRole and index.isValid():
+            tid = task_fields(self._tasks[index.row()])[0]
+            if tid is not None:
+                self.toggle_requested.emit(tid)
+            return True
+        return False
+
+    # --- updates from the controller ---------------------------------
+    def task_at(self, row: int):
+        return self._tasks[row]
+
+    def row_of(self, task_id):
+        """Return the row showing the given task id, or None."""
+        if not self._rows_valid:
+            self._rows = {task_state(t)[0]: i for i, t in enumerate(self._tasks)}
+            self._rows_valid = True
+        return self._rows.get(task_id)
+
+    def reset_tasks(self, tasks, total=None, fetch_page=None):
+        """Show `tasks`. With `fetch_page(offset, limit)` they are only the first
+        page of `total` tasks, and later pages are fetched as the view scrolls."""
+        self.beginResetModel()
+        self._tasks = list(tasks)
+        self._fetch_page = fetch_page
+        self._total = total if fetch_page is not None and total is not None else len(self._tasks)
+        self._rows_valid = False
+        self._shown = {}
+        self.endResetModel()
+
+    def reconcile(self, tasks, total=None, fetch_page=None) -> bool:
+        """Show `tasks` (like reset_tasks) by diffing them against the current rows by id.
+
+        Rows of tasks that are gone are removed, new ones inserted, reordered
+        ones moved, and rows whose fields changed get dataChanged, so views
+        keep their selection and scroll position and the Pending/Done proxies
+        move toggled rows between lists. Returns False when the lists were too
+        different and a plain reset was done instead.
+        """
+        tasks = list(tasks)
+        new_ids = [task_state(t)[0] for t in tasks]
+        position = {tid: i for i, tid in enumerate(new_ids)}
+        if (not self._tasks or len(position) != len(new_ids)
+                or len(self._tasks) > 2 * len(tasks) + self.max_runs):
+            # nothing (or little) to keep, or ids that cannot key a diff
+            self._reset_shown(tasks, total, fetch_page)
+            return False
+        old_ids = [task_state(t)[0] for t in self._tasks]
+        removed = [row for row, tid in enumerate(old_ids) if tid not in position]
+        kept = [tid for tid in old_ids if tid in position]
+        order = [position[tid] for tid in kept]
+        if all(a < b for a, b in zip(order, order[1:])):
+            stay, moved = None, []      # the usual case: nothing reordered
+        else:
+            stay = _increasing_subsequence(order)
+            moved = [tid for i, tid in enumerate(kept) if i not in stay]
+        kept_set = set(kept)
+        inserted = [i for i, tid in enumerate(new_ids) if tid not in kept_set]
+        if len(moved) > self.max_moves or len(_runs(removed)) + len(_runs(inserted)) > self.max_runs:
+            self._reset_shown(tasks, total, fetch_page)
+            return False
+
+        root = QModelIndex()
+        # 1. removals, bottom-up so earlier row numbers stay valid
+        for first, last in reversed(_runs(removed)):
+            self.beginRemoveRows(root, first, last)
+            del self._tasks[first:last + 1]
+            del old_ids[first:last + 1]
+            self.endRemoveRows()
+        # 2. moves: each out-of-order task goes right after the placed task
+        #    that precedes it in the new order
+        placed = {kept[i] for i in stay} if moved else set()
+        for tid in sorted(moved, key=position.get):
+            src = old_ids.index(tid)
+            anchor = -1
+            for row, other in enumerate(old_ids):
+                if other in placed and position[other] < position[tid]:
+                    anchor = row
+            dest = anchor + 1  # in pre-move row numbers, as Qt expects
+            if dest not in (src, src + 1) and self.beginMoveRows(root, src, src, root, dest):
+                to = dest - 1 if dest > src else dest
+                self._tasks.insert(to, self._tasks.pop(src))
+                old_ids.insert(to, old_ids.pop(src))
+                self.endMoveRows()
+            placed.add(tid)
+        # 3. insertions: the current rows are now the new list minus its new tasks
+        for first, last in _runs(inserted):
+            self.beginInsertRows(root, first, last)
+            self._tasks[first:first] = tasks[first:last + 1]
+            self.endInsertRows()
+        # 4. changed fields of rows that were already shown
+        shown = {}
+        changed = []
+        for row, t in enumerate(tasks):
+            fields = task_fields(t)
+            shown[fields[0]] = fields
+            if fields[0] in kept_set and (self._tasks[row] is not t or self._shown.get(fields[0]) != fields):
+                self._tasks[row] = t
+                changed.append(row)
+        for first, last in _runs(changed):
+            self.dataChanged.emit(self.index(first), self.index(last))
+        self._shown = shown
+        self._fetch_page = fetch_page
+        self._total = total if fetch_page is not None and total is not None else len(self._tasks)
+        self._rows_valid = False
+        return True
+
+    def _reset_shown(self, tasks, total, fetch_page):
+        self.reset_tasks(tasks, total, fetch_page)
+        self._note_shown(self._tasks)
+
+    def _note_shown(self, tasks):
+        # remember the fields as shown, so the next reconcile() can diff them
+        shown = self._shown
+        for t in tasks:
+            fields = task_fields(t)
+            shown[fields[0]] = fields
+
+    # --- paging --------------------------------------------------------
+    @property
+    def paged(self) -> bool:
+        """True when the rows are pages fetched on demand (see reset_tasks)."""
+        return self._fetch_page is not None
+
+    def _has_more(self) -> bool:
+        return len(self._tasks) < self._total
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetch_page is not None and self._has_more()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        page = self._fetch_page(len(self._tasks), self.page_size)
+        if not page:
+            # the source has fewer tasks than announced
+            self._total = len(self._tasks)
+            return
+        first = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._tasks.extend(page)
+        self._rows_valid = False
+        self.endInsertRows()
+        self._note_shown(page)
+
+    # --- incremental changes -------------------------------------------
+    # The loaded rows are always a prefix of the full ordering; changes that
+    # fall into the not-yet-fetched tail only adjust the total.
+    def insert_task(self, task, row=None):
+        """Insert a new task at `row` of the full ordering (default: the end)."""
+        tid = task_state(task)[0]
+        if self.row_of(tid) is not None:
+            self.update_task(task)
+            return
+        end = len(self._tasks)
+        more = self._has_more()
+        if row is None:
+            row = self._total
+        self._total += 1
+        if row > end or (row == end and more):
+            return  # lands in the unfetched tail
+        self._insert_row(row, task)
+
+    def _insert_row(self, row, task):
+        end = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tasks.insert(row, task)
+        self._note_shown((task,))
+        if row == end and self._rows_valid:
+            self._rows[task_state(task)[0]] = row
+        else:
+            self._rows_valid = False
+        self.endInsertRows()
+
+    def _remove_row(self, task_id, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._tasks[row]
+        if row == len(self._tasks):
+            self._rows.pop(task_id, None)
+        else:
+            # rows after this one shifted; rebuild the map on next lookup
+            self._rows_valid = False
+        self.endRemoveRows()
+
+    def move_task(self, task, row):
+        """Move a task so that it ends up at `row` (e.g. after its sort key changed)."""
+        tid = task_state(task)[0]
+        old = self.row_of(tid)
+        loaded = len(self._tasks)
+        if old is None:
+            # coming in from the unfetched tail
+            if row < loaded:
+                self._insert_row(row, task)
+            return
+        if self._has_more() and row >= loaded:
+            # moving out into the unfetched tail
+            self._remove_row(tid, old)
+            return
+        row = max(0, min(row, loaded - 1))
+        if row == old:
+            return
+        # destination is given in pre-move coordinates
+        dest = row + 1 if row > old else row
+        if not self.beginMoveRows(QModelIndex(), old, old, QModelIndex(), dest):
+            return
+        self._tasks.insert(row, self._tasks.pop(old))
+        self._rows_valid = False
+        self.endMoveRows()
+
+    def insert_tasks(self, tasks):
+        """Append several new tasks with one row insertion."""
+        tasks = list(tasks)
+        if not tasks:
+            return
+        more = self._has_more()
+        self._total += len(tasks)
+        if more:
+            return  # they follow the unfetched tail
+        first = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), first, first + len(tasks) - 1)
+        self._tasks.extend(tasks)
+        self._note_shown(tasks)
+        if self._rows_valid:
+            for i, t in enumerate(tasks, first):
+                self._rows[task_state(t)[0]] = i
+        self.endInsertRows()
+
+    def remove_task(self, task_id):
+        """Remove a task of the shown set (all tasks or the matches), loaded or not."""
+        row = self.row_of(task_id)
+        if row is None:
+            if self._has_more():
+                self._total -= 1  # it was in the unfetched tail
+            return
+        self._total -= 1
+        self._remove_row(task_id, row)
+
+    def update_task(self, task):
+        tid = task_state(task)[0]
+        row = self.row_of(tid)
+        if row is None:
+            if not self._has_more():
+                self.insert_task(task)
+            return
+        self._tasks[row] = task
+        self._note_shown((task,))
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+
+class TaskFilterProxy(QSortFilterProxyModel):
+    """Shows only pending (completed=False) or done (completed=True) tasks."""
+
+    def __init__(self, completed: bool, parent=None):
+        super().__init__(parent)
+        self._completed = completed
+        self._source = None
+        # re-filter rows when their data changes, so toggled tasks move lists
+        self.setDynamicSortFilter(True)
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        # kept on the Python side: filterAcceptsRow runs once per row
+        self._source = model
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return bool(task_state(self._source.task_at(source_row))[1]) == self._completed
+
+
+class TaskItemDelegate(QStyledItemDelegate):
+    """Strikes out completed tasks without storing a font per item."""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.data(CompletedRole):
+            option.font.setStrikeOut(True)
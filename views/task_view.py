@@ -3,11 +3,11 @@ Task View - Task manager UI with back navigation
 """
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QListWidget, QTextEdit, QListWidgetItem, QSplitter
+    QPushButton, QLabel, QLineEdit, QListView, QPlainTextEdit, QSplitter, QComboBox
 )
-from PyQt6.QtCore import pyqtSignal, Qt
-from PyQt6.QtGui import QColor
-from .add_task_dialog import AddTaskDialog
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
+from PyQt6.QtGui import QKeySequence, QShortcut
+from .task_list_model import TaskListModel, TaskFilterProxy, TaskItemDelegate, TaskIdRole
 
 
 class TaskView(QWidget):
@@ -18,14 +18,34 @@ class TaskView(QWidget):
 
     # Signals for user actions
     add_task_requested = pyqtSignal(object)   # payload: dict or title
-    toggle_task_requested = pyqtSignal(int)  # payload: index (model index)
-    remove_task_requested = pyqtSignal(int)  # payload: index (model index)
+    toggle_task_requested = pyqtSignal(int)  # payload: task id
+    remove_task_requested = pyqtSignal(int)  # payload: task id
     clear_requested = pyqtSignal()
+    search_requested = pyqtSignal(str)  # payload: query text (debounced)
+    sort_requested = pyqtSignal(str)    # payload: order_by key, '' for insertion order
+    undo_requested = pyqtSignal()
+    redo_requested = pyqtSignal()
     navigate_back = pyqtSignal()  # Signal to go back to home
 
+    SEARCH_DEBOUNCE_MS = 150
+    # sort selector entries: (label, order_by key understood by DataModel)
+    SORT_MODES = [
+        ("Added", ""),
+        ("Deadline", "deadline"),
+        ("Priority", "priority"),
+        ("Created", "created_at"),
+    ]
+    # the status pane keeps only the newest lines (older blocks are dropped)
+    STATUS_MAX_LINES = 500
+
     def __init__(self):
         super().__init__()
-        self._suppress_item_change = False
+        # one source model shared by the Pending and Done proxies
+        self.task_model = TaskListModel(self)
+        self.pending_model = TaskFilterProxy(completed=False, parent=self)
+        self.pending_model.setSourceModel(self.task_model)
+        self.done_model = TaskFilterProxy(completed=True, parent=self)
+        self.done_model.setSourceModel(self.task_model)
         self.init_ui()
 
     def init_ui(self):
@@ -60,13 +80,26 @@ class TaskView(QWidget):
 
         main_layout.addLayout(header_layout)
 
-        # Add button only (use dialog for full form)
+        # Search box and add button (use dialog for full form)
         input_layout = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search tasks…")
+        self.search_edit.setClearButtonEnabled(True)
+        self.sort_combo = QComboBox()
+        for label, key in self.SORT_MODES:
+            self.sort_combo.addItem(f"Sort: {label}", key)
         self.add_button = QPushButton("Add Task")
-        input_layout.addStretch()
+        input_layout.addWidget(self.search_edit)
+        input_layout.addWidget(self.sort_combo)
         input_layout.addWidget(self.add_button)
         main_layout.addLayout(input_layout)
 
+        # Shown while tasks are still being loaded in the background
+        self.loading_label = QLabel("Loading tasks…")
+        self.loading_label.setStyleSheet("color: #7f8c8d; padding: 4px;")
+        self.loading_label.hide()
+        main_layout.addWidget(self.loading_label)
+
         # Two-column area: pending (left) and done (right)
         splitter = QSplitter(Qt.Orientation.Horizontal)
 
@@ -75,8 +108,7 @@ class TaskView(QWidget):
         pending_label = QLabel("Pending")
         pending_label.setStyleSheet("font-weight: bold; padding: 6px; font-size: 14px;")
         pending_layout.addWidget(pending_label)
-        self.pending_list = QListWidget()
-        self.pending_list.setStyleSheet('font-size: 12px;')
+        self.pending_list = self._make_list_view(self.pending_model)
         pending_layout.addWidget(self.pending_list)
 
         done_widget = QWidget()
@@ -84,8 +116,7 @@ class TaskView(QWidget):
         done_label = QLabel("Done")
         done_label.setStyleSheet("font-weight: bold; padding: 6px; font-size: 14px;")
         done_layout.addWidget(done_label)
-        self.done_list = QListWidget()
-        self.done_list.setStyleSheet('font-size: 12px;')
+        self.done_list = self._make_list_view(self.done_model)
         done_layout.addWidget(self.done_list)
 
         splitter.addWidget(pending_widget)
@@ -95,9 +126,8 @@ class TaskView(QWidget):
 
         main_layout.addWidget(splitter)
 
-        # listen for checkbox changes (user toggles) on both lists
-        self.pending_list.itemChanged.connect(self._on_item_changed)
-        self.done_list.itemChanged.connect(self._on_item_changed)
+        # checkbox clicks on either list become toggle requests
+        self.task_model.toggle_requested.connect(self.toggle_task_requested.emit)
 
         # Buttons row
         button_layout = QHBoxLayout()
@@ -110,24 +140,45 @@ class TaskView(QWidget):
         main_layout.addLayout(button_layout)
 
         # Status area
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setReadOnly(True)
+        self.status_text.setMaximumBlockCount(self.STATUS_MAX_LINES)
         self.status_text.setMaximumHeight(120)
         main_layout.addWidget(self.status_text)
 
         # Connect UI actions
         self.add_button.clicked.connect(self._on_add_clicked)
+        # search-as-you-type: query once typing pauses, not on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._emit_search)
+        self.search_edit.textChanged.connect(lambda _text: self._search_timer.start())
+        self.sort_combo.currentIndexChanged.connect(
+            lambda i: self.sort_requested.emit(self.sort_combo.itemData(i) or ""))
         # toggle/remove call internal handlers which accept optional checked param
         self.toggle_button.clicked.connect(self._on_toggle_clicked)
         self.remove_button.clicked.connect(self._on_remove_clicked)
         self.clear_button.clicked.connect(lambda checked=False: self.clear_requested.emit())
+        # platform undo/redo keys (Ctrl+Z, Ctrl+Y / Ctrl+Shift+Z); a focused text
+        # field keeps them for its own editing history
+        redo_keys = QKeySequence.keyBindings(QKeySequence.StandardKey.Redo)
+        if QKeySequence("Ctrl+Y") not in redo_keys:
+            redo_keys.append(QKeySequence("Ctrl+Y"))
+        for keys, signal in ((QKeySequence.keyBindings(QKeySequence.StandardKey.Undo), self.undo_requested),
+                             (redo_keys, self.redo_requested)):
+            shortcut = QShortcut(self)
+            shortcut.setKeys(keys)
+            shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(signal.emit)
 
         # Apply the preferred theme
         self.apply_light_theme()
 
     # --- UI event handlers -------------------------------------------
     def _on_add_clicked(self, checked=False):
-        # Open modal dialog to collect task details
+        # Open modal dialog to collect task details (imported on first use)
+        from .add_task_dialog import AddTaskDialog
         dlg = AddTaskDialog(self)
         dlg.submitted.connect(lambda payload: self.add_task_requested.emit(payload))
         dlg.exec()
@@ -135,152 +186,115 @@ class TaskView(QWidget):
     def _on_toggle_clicked(self, checked=False):
         import logging
         logging.getLogger(__name__).info('ui: toggle clicked')
-        index = self.current_selected_index()
-        if index is not None:
-            self.toggle_task_requested.emit(index)
+        task_id = self.current_selected_id()
+        if task_id is not None:
+            self.toggle_task_requested.emit(task_id)
 
     def _on_remove_clicked(self, checked=False):
         import logging
         logging.getLogger(__name__).info('ui: remove clicked')
-        index = self.current_selected_index()
-        if index is not None:
-            self.remove_task_requested.emit(index)
-
-    def _on_item_changed(self, item: QListWidgetItem):
-        """Handle checkbox toggles from the user and emit toggle signal.
-
-        This method ignores programmatic changes when `_suppress_item_change` is True.
-        """
-        if self._suppress_item_change:
-            return
-
-        # Determine which list the changed item lives in and get its model id
-        list_widget = item.listWidget()
-        row = list_widget.row(item)
-        if row < 0:
-            return
-
-        tid = item.data(Qt.ItemDataRole.UserRole)
-        if tid is None:
-            return
-
-        # Emit toggle request with model index resolved by id
-        model_index = self._model_index_from_task_id(tid)
-        if model_index is not None:
-            self.toggle_task_requested.emit(model_index)
+        task_id = self.current_selected_id()
+        if task_id is not None:
+            self.remove_task_requested.emit(task_id)
+
+    def _emit_search(self):
+        self.search_requested.emit(self.search_edit.text())
+
+    def _make_list_view(self, model) -> QListView:
+        """Create a virtualized list view: only visible rows are ever laid out."""
+        view = QListView()
+        view.setModel(model)
+        view.setUniformItemSizes(True)
+        view.setItemDelegate(TaskItemDelegate(view))
+        view.setStyleSheet('font-size: 12px;')
+        return view
 
     # --- view update methods ---------------------------------------
     def update_tasks(self, tasks):
-        """Repopulate the tasks lists from model data.
+        """Show these tasks in the lists, changing only what differs.
 
         Accepts either list of dict-like objects (with .get) or Task dataclass instances
-        with attributes `title`, `completed`, and `id`.
+        with attributes `title`, `completed`, and `id`. Rows are matched by task id:
+        removed tasks disappear, new ones are inserted, toggled ones move between
+        Pending and Done, and selection and scroll position are kept.
         """
-        # Suppress itemChanged handler while we rebuild the lists
-        self._suppress_item_change = True
-        self.pending_list.clear()
-        self.done_list.clear()
-
-        for idx, t in enumerate(tasks):
-            # support both dict-like and dataclass-like Task
-            if hasattr(t, "get"):
-                completed = t.get('completed')
-                title = t.get('title')
-                description = t.get('description', '')
-                deadline = t.get('deadline')
-                priority = t.get('priority', 'Normal')
-            else:
-                completed = getattr(t, 'completed', False)
-                title = getattr(t, 'title', str(t))
-                description = getattr(t, 'description', '')
-                deadline = getattr(t, 'deadline', None)
-                priority = getattr(t, 'priority', 'Normal')
-
-            # compact label: Title (Priority) [deadline]
-            label = title
-            if priority:
-                label += f" ({priority})"
-            if deadline:
-                label += f" [{deadline}]"
-
-            item = QListWidgetItem(label)
-            # attach description as tooltip for more detail
-            if description:
-                item.setToolTip(description)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-            # attach model index as UserRole so selection maps back to model
-            item.setData(Qt.ItemDataRole.UserRole, idx)
-            # set check state and visual cues
-            if completed:
-                item.setCheckState(Qt.CheckState.Checked)
-                f = item.font()
-                f.setStrikeOut(True)
-                item.setFont(f)
-                # completed items are dim gray
-                item.setForeground(QColor('#6c6c6c'))
-                # place in done list
-                self.done_list.addItem(item)
-            else:
-                item.setCheckState(Qt.CheckState.Unchecked)
-                # color by priority for pending tasks
-                p = (priority or 'Normal').lower()
-                if p == 'high':
-                    item.setForeground(QColor('#c0392b'))
-                elif p == 'low':
-                    item.setForeground(QColor('#27ae60'))
-                else:
-                    # Normal or unknown: use a neutral dark color
-                    item.setForeground(QColor('#2c3e50'))
-                self.pending_list.addItem(item)
-
-        self._suppress_item_change = False
+        self._reconcile(tasks)
+
+    def show_task_page(self, tasks, total: int, fetch_page):
+        """Show the first page of `total` tasks; `fetch_page(offset, limit)` supplies
+        the following pages as the lists are scrolled."""
+        loaded = self.task_model.rowCount()
+        if self.task_model.paged and loaded > len(tasks) and total > len(tasks):
+            # keep as many rows as are loaded now, so a scrolled list stays put
+            tasks = list(tasks) + list(fetch_page(len(tasks), min(loaded, total) - len(tasks)))
+        self._reconcile(tasks, total, fetch_page)
+
+    def _reconcile(self, tasks, total=None, fetch_page=None):
+        selected = self.current_selected_id()
+        if not self.task_model.reconcile(tasks, total, fetch_page) and selected is not None:
+            # the model fell back to a reset: at least bring the selection back
+            self.select_id(selected)
+
+    # --- incremental updates (one row per model change) ----------------
+    def add_task_item(self, task, row=None):
+        """Insert a single task (at `row`, default the end) without touching the other rows."""
+        self.task_model.insert_task(task, row)
+
+    def move_task_item(self, task, row: int):
+        """Move a task's row to `row`, keeping its selection."""
+        self.task_model.move_task(task, row)
+
+    def remove_task_item(self, task_id: int):
+        """Remove the row showing the given task id, if any."""
+        self.task_model.remove_task(task_id)
+
+    def update_task_item(self, task):
+        """Refresh one task's row; the proxies move it between Pending and Done."""
+        self.task_model.update_task(task)
+
+    def add_task_items(self, tasks):
+        """Append a chunk of tasks (e.g. from an incremental load) in one insertion."""
+        self.task_model.insert_tasks(tasks)
+
+    def show_load_progress(self, fraction: float):
+        """Show 'Loading tasks… N%' until fraction reaches 1."""
+        if fraction >= 1.0:
+            self.loading_label.hide()
+            return
+        self.loading_label.setText(f"Loading tasks… {int(fraction * 100)}%")
+        self.loading_label.show()
 
     def append_status(self, message):
-        self.status_text.append(message)
+        self.status_text.appendPlainText(str(message))
 
     def clear_status(self):
         self.status_text.clear()
 
-    def current_selected_index(self):
-        """Return the model index of the currently selected item (if any)."""
+    def current_selected_id(self):
+        """Return the task id of the currently selected item (if any)."""
         # check pending list first, then done list
         for lst in (self.pending_list, self.done_list):
-            row = lst.currentRow()
-            if row >= 0:
-                item = lst.item(row)
-                tid = item.data(Qt.ItemDataRole.UserRole)
+            index = lst.currentIndex()
+            if index.isValid():
+                tid = index.data(TaskIdRole)
                 if tid is not None:
-                    return self._model_index_from_task_id(tid)
+                    return tid
         return None
 
-    def select_index(self, index: int):
-        """Select the item corresponding to the given model index."""
-        # find task id for model index via model lookup of tasks is not available here
-        # instead, select by searching both lists for item with matching UserRole == index
-        # assume callers pass a model index corresponding to the stored ids
-        # we'll match by task id equal to index or by stringified id
-        for lst in (self.pending_list, self.done_list):
-            for i in range(lst.count()):
-                item = lst.item(i)
-                tid = item.data(Qt.ItemDataRole.UserRole)
-                if tid == index:
-                    lst.setCurrentRow(i)
-                    return
-        # fallback: no-op
+    def select_id(self, task_id: int):
+        """Select the item showing the task with the given id."""
+        row = self.task_model.row_of(task_id)
+        if row is None:
+            return
+        source_index = self.task_model.index(row)
+        for lst, proxy in ((self.pending_list, self.pending_model), (self.done_list, self.done_model)):
+            index = proxy.mapFromSource(source_index)
+            if index.isValid():
+                lst.setCurrentIndex(index)
+                return
 
     def clear_list(self):
-        self.pending_list.clear()
-        self.done_list.clear()
-
-    # --- helpers ---------------------------------------------------
-    def _model_index_from_task_id(self, task_id):
-        """Here task_id is already a model index (integer). Return it if valid."""
-        try:
-            if isinstance(task_id, int):
-                return task_id
-        except Exception:
-            return None
-        return None
+        self.task_model.reset_tasks([])
 
     # --- Theme ------------------------------------------------------
     def apply_light_theme(self):
@@ -329,26 +343,26 @@ class TaskView(QWidget):
         }
         
         /* List */
-        QListWidget {
+        QListView {
             background-color: white;
             border: 1px solid #d1d1d1;
             border-radius: 4px;
             padding: 4px;
         }
-        QListWidget::item {
+        QListView::item {
             padding: 6px;
             border-bottom: 1px solid #ecf0f1;
         }
-        QListWidget::item:selected {
+        QListView::item:selected {
             background-color: #e8f4f8;
             color: #222;
         }
-        QListWidget::item:hover {
+        QListView::item:hover {
             background-color: #f0f8ff;
         }
         
         /* Text edit (status) */
-        QTextEdit {
+        QPlainTextEdit {
             background-color: white;
             color: #222;
             border: 1px solid #d1d1d1;